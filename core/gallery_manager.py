@@ -12,6 +12,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Set, Callable, Optional, Tuple
 from collections import defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
@@ -33,6 +34,27 @@ from utils.file_utils import (
 )
 from utils.image_utils import validate_image_file, extract_dominant_colors
 
+# Below this many files a thread pool costs more to spin up than it saves
+SCAN_POOL_THRESHOLD = 64
+
+# Threads validating and hashing files (hashlib and PIL decoding release the GIL)
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Folders processed at once by process_folders (Vision API calls are network-bound)
+BATCH_FOLDER_WORKERS = 4
+
+
+def _scan_image_file(full_path: Path) -> Optional[Tuple[str, str]]:
+    """
+    Validate and hash a single image file.
+    
+    Returns:
+        (filename, hash) tuple, or None if the file is not a valid image
+    """
+    if not validate_image_file(full_path):
+        return None
+    return full_path.name, compute_image_hash(full_path)
+
 class FolderWatcher(FileSystemEventHandler):
     """Main class for managing gallery folders and images with v2.0 schema support."""
     
@@ -95,21 +117,29 @@ class GalleryManager:
         hash_data: Dict[str, Dict],
         updated_hashes: Dict[str, Dict],
         new_entries_all: List[Dict],
-        progress_callback: Optional[Callable[[str, int, int], None]] = None
-    ) -> None:
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        scan_executor: Optional[Executor] = None
+    ) -> int:
         """
         Process all images in a folder with batch support.
         Wrapped in transaction safety.
+        
+        Large folders are scanned on scan_executor when given (so a batch
+        run shares one pool), otherwise on a short-lived thread pool.
+        
+        Returns:
+            Number of new images processed
         """
         try:
             with self._folder_transaction(folder_path):
-                self._process_folder_unsafe(
+                return self._process_folder_unsafe(
                     folder_path,
                     folder_name,
                     hash_data,
                     updated_hashes,
                     new_entries_all,
-                    progress_callback
+                    progress_callback,
+                    scan_executor
                 )
         except Exception as e:
             raise GalleryManagerError(f"Error processing folder {folder_name}: {str(e)}")
@@ -121,8 +151,9 @@ class GalleryManager:
         hash_data: Dict[str, Dict],
         updated_hashes: Dict[str, Dict],
         new_entries_all: List[Dict],
-        progress_callback: Optional[Callable[[str, int, int], None]] = None
-    ) -> None:
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        scan_executor: Optional[Executor] = None
+    ) -> int:
         """Actual folder processing implementation with transaction safety."""
         json_path = folder_path / f"{folder_name}.json"
         
@@ -134,21 +165,20 @@ class GalleryManager:
             json_data = load_json_data(json_path)
             existing_urls = {entry['url'] for entry in json_data}
 
-        # Get all valid image files in folder
-        image_files = [
+        # Get all valid image files in folder along with their hashes
+        scanned = self._scan_images(folder_path, [
             f for f in os.listdir(folder_path) 
-            if f.lower().endswith(SUPPORTED_EXTENSIONS) and 
-            validate_image_file(folder_path / f)
-        ]
+            if f.lower().endswith(SUPPORTED_EXTENSIONS)
+        ], scan_executor)
+        image_files = [img_file for img_file, _ in scanned]
         
         new_entries = []
         processed_count = 0
         batch_count = 0
 
-        for img_file in image_files:
+        for img_file, img_hash in scanned:
             try:
                 full_path = folder_path / img_file
-                img_hash = compute_image_hash(full_path)
 
                 # Skip if already processed
                 if img_hash in hash_data:
@@ -234,6 +264,101 @@ class GalleryManager:
         
         if progress_callback:
             progress_callback(folder_name, processed_count, len(image_files))
+        return processed_count
+
+    def process_folders(
+        self,
+        folders: List[Dict[str, str]],
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        folder_callback: Optional[Callable[[str, int], None]] = None,
+        max_workers: int = BATCH_FOLDER_WORKERS
+    ) -> int:
+        """
+        Process several gallery folders concurrently against one hash index.
+        
+        The hash index is loaded once and only read while folders run. Each
+        folder collects its new hashes and entries in its own containers,
+        which are merged on the calling thread as folders finish; the index
+        is saved once at the end. Images duplicated across two folders that
+        run at the same time are therefore analyzed in both. All folders
+        share a single scan pool, so file hashing stays bounded at
+        SCAN_WORKERS threads however many folders run at once.
+        
+        Args:
+            folders: Folder dicts with 'name' and 'path'
+            progress_callback: (folder_name, processed, total) - called from
+                worker threads
+            folder_callback: (folder_name, new_count) - called on the calling
+                thread as each folder finishes
+            max_workers: Folders processed at once
+            
+        Returns:
+            Number of new images processed
+        """
+        hash_data = load_json_data(HASH_TRACK_FILE)
+        updated_hashes: Dict[str, Dict] = {}
+        total = 0
+        
+        def run(folder: Dict[str, str]) -> Tuple[int, Dict[str, Dict]]:
+            folder_hashes: Dict[str, Dict] = {}
+            count = self.process_folder(
+                Path(folder['path']), folder['name'],
+                hash_data, folder_hashes, [], progress_callback, scan_pool
+            )
+            return count, folder_hashes
+        
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as scan_pool, \
+                ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(folders)))) as pool:
+            futures = {pool.submit(run, folder): folder for folder in folders}
+            for future in as_completed(futures):
+                name = futures[future]['name']
+                try:
+                    count, folder_hashes = future.result()
+                except GalleryManagerError as e:
+                    print(str(e))
+                    count, folder_hashes = 0, {}
+                total += count
+                updated_hashes.update(folder_hashes)
+                if folder_callback:
+                    folder_callback(name, count)
+        
+        if updated_hashes:
+            hash_data.update(updated_hashes)
+            save_json_data(HASH_TRACK_FILE, hash_data)
+        return total
+
+    def _scan_images(
+        self,
+        folder_path: Path,
+        filenames: List[str],
+        executor: Optional[Executor] = None
+    ) -> List[Tuple[str, str]]:
+        """
+        Validate and hash candidate image files.
+        
+        Large folders are spread across threads: hashlib and PIL release the
+        GIL, and threads share the validate_image_file cache that a process
+        pool would start empty every time. Order of the input list is preserved.
+        
+        Args:
+            folder_path: Folder containing the files
+            filenames: Candidate image filenames
+            executor: Pool to run on; a temporary one is created if omitted
+            
+        Returns:
+            List of (filename, hash) tuples for valid images
+        """
+        paths = [folder_path / f for f in filenames]
+        
+        if len(paths) < SCAN_POOL_THRESHOLD:
+            results = map(_scan_image_file, paths)
+            return [r for r in results if r]
+            
+        if executor is not None:
+            return [r for r in executor.map(_scan_image_file, paths) if r]
+            
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            return [r for r in pool.map(_scan_image_file, paths) if r]
 
     def start_folder_watcher(self, path: str, callback: Callable[[str], None]) -> None:
         """
@@ -2,16 +2,17 @@
 Track changes for undo/redo functionality
 """
 
+from collections import deque
+
 class HistoryManager:
     def __init__(self, max_steps=50):
-        self.undo_stack = []
-        self.redo_stack = []
+        # maxlen evicts the oldest entry on append, replacing list.pop(0)
+        self.undo_stack = deque(maxlen=max_steps)
+        self.redo_stack = deque(maxlen=max_steps)
         self.max_steps = max_steps
 
     def record_change(self, item_id, old_state, new_state):
         self.undo_stack.append((item_id, old_state, new_state))
-        if len(self.undo_stack) > self.max_steps:
-            self.undo_stack.pop(0)
         self.redo_stack.clear()
 
     def undo(self):
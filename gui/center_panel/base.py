@@ -158,12 +158,26 @@ class CenterPanel(tk.Frame):
         self.pan_start_x = None
         self.pan_start_y = None
 
-    def show_image(self, image_path: Path, metadata: Dict) -> None:
-        """Display an image with metadata."""
+    def show_image(
+        self,
+        image_path: Path,
+        metadata: Dict,
+        preview: Optional[Image.Image] = None
+    ) -> None:
+        """
+        Display an image with metadata.
+        
+        Args:
+            image_path: Path to the image file
+            metadata: Image metadata for the overlays
+            preview: Already-decoded 1200px preview (e.g. from the
+                ImageManager cache); decoded from image_path when omitted
+        """
         # UPDATE FOLDER NAME FIRST - this ensures it's always set
         self.folder_name_var.set(Path(image_path).parent.name)
         
-        if not validate_image_file(image_path):
+        # A decoded preview has already proven the file readable
+        if preview is None and not validate_image_file(image_path):
             self.status_cb(f"Invalid image file: {image_path}")
             self.show_placeholder()
             return
@@ -172,7 +186,7 @@ class CenterPanel(tk.Frame):
             self._clear_image_references()
             self.image_path = image_path
             self.current_metadata = metadata
-            img = create_image_preview(image_path, (1200, 1200))
+            img = preview if preview is not None else create_image_preview(image_path, (1200, 1200))
 
             if img is None:
                 raise ValueError("Failed to create image preview")
@@ -388,10 +388,7 @@ class GridView(tk.Frame):
             
     def _get_image_index(self, img_data: Dict) -> int:
         """Get index of image in main images list."""
-        for i, img in enumerate(self.controller.main_window.images):
-            if img.get('url') == img_data.get('url'):
-                return i
-        return -1
+        return self.controller.main_window.index_of_url(img_data.get('url'))
         
     def _show_placeholder(self, message="No images available"):
         """Display placeholder message."""
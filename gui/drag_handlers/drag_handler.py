@@ -133,8 +133,13 @@ class DragHandler:
             # Get image index from drag data
             img_index = self.drag_data['index']
             
-            # Call main window's move method
-            self.main_window.move_image_to_folder(img_index, folder_path)
+            # Dragging one of several selected thumbnails moves the whole selection
+            grid_view = getattr(self.main_window.center_panel, 'grid_view', None)
+            selected = getattr(grid_view, 'selected_indices', set())
+            if img_index in selected and len(selected) > 1:
+                self.main_window.move_images_to_folder(list(selected), folder_path)
+            else:
+                self.main_window.move_image_to_folder(img_index, folder_path)
             return True
         return False
     
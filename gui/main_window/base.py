@@ -17,14 +17,17 @@ Dependencies:
 """
 
 import os
+import re
 import json
 import shutil
+import threading
+import unicodedata
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Set
 from pathlib import Path
 from datetime import datetime
-from PIL import Image
+from functools import lru_cache
 
 from config import get_color
 
@@ -39,7 +42,9 @@ from core.schema_validator import SchemaValidator
 from core.migration import JsonMigrator  # or wherever your JsonMigrator class is defined
 
 # Utilities
-from utils.thread_utils import run_in_thread
+from utils.file_utils import move_file
+from utils.image_utils import has_image_signature
+from utils.thread_utils import run_in_thread, process_pending_callbacks, TaskError
 
 # Core Systems
 from core.gallery_manager import GalleryManager
@@ -52,6 +57,81 @@ from .handlers.batch_processor import BatchProcessor
 from .handlers.image_sorter import ImageSorter
 from ..drag_handlers.drag_handler import DragHandler
 
+# Optional fast JSON backend - falls back to the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
+
+
+@lru_cache(maxsize=1024)
+def _slugify(text: str) -> str:
+    """Convert text to URL-friendly slug (memoized - folder names and tags repeat)."""
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return _SLUG_DASH.sub('-', _SLUG_STRIP.sub('', text).strip().lower())
+
+
+@lru_cache(maxsize=64)
+def _folder_title_slug(folder: str) -> Tuple[str, str]:
+    """Gallery title and slug for a folder (memoized - pure in the path)."""
+    folder_name = os.path.basename(folder)
+    return folder_name, folder_name.lower().replace(" ", "-")
+
+
+def _meta_for(folder: str) -> Dict[str, Any]:
+    """Build v2.0 gallery metadata for a folder (fresh dict and timestamps per call)."""
+    title, slug = _folder_title_slug(folder)
+    now = datetime.now().isoformat()
+    
+    return {
+        "gallery_title": title,
+        "gallery_slug": slug,
+        "created_date": now,  # Would ideally load from original if available
+        "last_updated": now,
+        "export_profiles": []
+    }
+
+
+def _load_json_file(path) -> Any:
+    """Read and parse a gallery JSON file, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _dump_json_file(path, data: Any) -> None:
+    """
+    Serialize gallery data to a JSON file (2-space indent, UTF-8).
+    
+    The data is written to a temporary sibling, fsynced and then swapped
+    in with os.replace, so a crash mid-write never leaves a truncated file.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        if ORJSON_AVAILABLE:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 class MainWindow(tk.Frame):
     """Main application window controller."""
     
@@ -74,6 +154,17 @@ class MainWindow(tk.Frame):
         self.current_folder: Optional[str] = None
         self.current_image_index: int = 0
         self.images: List[Dict[str, Any]] = []
+        self._url_to_index: Dict[str, int] = {}
+        
+        # Parsed JSON keyed by path -> (mtime, data), see _load_json_cached()
+        self._json_cache: Dict[str, Tuple[int, Any]] = {}
+        self._dirty_json: Set[str] = set()  # Cached entries not yet on disk
+        self._json_lock = threading.Lock()  # Guards the two above for move workers
+        
+        # Pending UI refreshes, see _schedule_refresh()
+        self._ui_refresh_scheduled = False
+        self._refresh_flags: Set[str] = set()
+        self._refresh_folder_counts: Dict[str, int] = {}
         
         # Setup UI and handlers
         self._setup_window()
@@ -219,6 +310,12 @@ class MainWindow(tk.Frame):
         self.bind_events()
         self._setup_view_specific_bindings()
         self._create_menu()
+        self._poll_background_callbacks()
+        
+    def _poll_background_callbacks(self):
+        """Deliver run_in_thread callbacks on the Tk main thread."""
+        process_pending_callbacks()
+        self.after(50, self._poll_background_callbacks)
         
     def setup_navigation_callbacks(self):
         """Connect navigation controls."""
@@ -278,8 +375,7 @@ class MainWindow(tk.Frame):
                 
             # Load and validate data
             print("Loading JSON data...")
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json_file(json_path)
             
             # Initialize migration tools
             migrator = JsonMigrator(backup_dir=os.path.join(folder['path'], "backups"))
@@ -298,8 +394,7 @@ class MainWindow(tk.Frame):
                 
                 # Reload after migration
                 print("Reloading migrated data...")
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _load_json_file(json_path)
             
             # Process images - modified section
             print("Processing images...")
@@ -331,6 +426,7 @@ class MainWindow(tk.Frame):
                 img.setdefault('alt_text', '')
                 img.setdefault('order', img.get('sort_order', 0))
                 img.setdefault('keywords', img.get('tags', []))
+            self.reindex_images()
             
             # Update UI
             print("Updating UI...")
@@ -387,6 +483,7 @@ class MainWindow(tk.Frame):
     def _handle_empty_gallery(self, folder: Dict[str, str]) -> None:
         """Handle empty or invalid gallery state"""
         self.images = []
+        self._url_to_index.clear()
         self.center_panel.folder_name_var.set(folder['name'])  # Add this line
         self.center_panel.show_placeholder()
         self.right_panel.load_image_data({})
@@ -409,7 +506,10 @@ class MainWindow(tk.Frame):
         img_data['total'] = len(self.images)
         
         # Update all UI components
-        self.center_panel.show_image(img_path, img_data)
+        self.center_panel.show_image(
+            img_path, img_data, self.image_manager.get_preview(img_path)
+        )
+        self.image_manager.prefetch_neighbours()
         self.right_panel.load_image_data(img_data)
         self.update_navigation_buttons()
         
@@ -544,8 +644,7 @@ class MainWindow(tk.Frame):
                     shutil.copy2(json_path, backup_path)
                 
                 # Save new version
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                _dump_json_file(json_path, data)
                     
             except Exception as e:
                 self.status_bar.update_status(f"Save failed: {str(e)}", alert=True)
@@ -564,7 +663,17 @@ class MainWindow(tk.Frame):
     
     # -------------------- Menu Actions -------------------- #
     def _create_menu(self):
-        """Create the main menu bar using the MainMenu class."""
+        """
+        Create the main menu bar using the MainMenu class.
+        
+        Construction is deferred to the first idle tick so the window can
+        paint before any menu Tcl work runs; ``self.menu`` is None until then.
+        """
+        self.menu = None
+        self.root.after_idle(self._build_menu)
+
+    def _build_menu(self):
+        """Build the MainMenu once the event loop is idle."""
         from .menu import MainMenu
         self.menu = MainMenu(self)
 
@@ -593,19 +702,21 @@ class MainWindow(tk.Frame):
             
         migrator = JsonMigrator()
         
-        for item in sorted(os.listdir(self.gallery_manager.root_folder)):
-            full_path = os.path.join(self.gallery_manager.root_folder, item)
+        with os.scandir(self.gallery_manager.root_folder) as it:
+            entries = sorted(
+                (entry for entry in it if entry.is_dir(follow_symlinks=False)),
+                key=lambda entry: entry.name
+            )
             
-            if not os.path.isdir(full_path):
-                continue
+        for entry in entries:
+            item, full_path = entry.name, entry.path
                 
             try:
                 json_path = os.path.join(full_path, f"{item}.json")
                 image_count = 0  # Default count
                 
                 if os.path.exists(json_path):
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = _load_json_file(json_path)
                     # Get image count from either v1 or v2 format
                     image_count = len(data.get('images', [])) if isinstance(data, dict) else len(data)
                 
@@ -635,15 +746,16 @@ class MainWindow(tk.Frame):
         valid_extensions = ('.jpg', '.jpeg', '.png', '.webp', '.bmp', '.gif')
         
         try:
-            for f in sorted(os.listdir(folder_path)):
-                if f.lower().endswith(valid_extensions):
-                    full_path = os.path.join(folder_path, f)
-                    try:
-                        with Image.open(full_path) as img:
-                            img.verify()
-                        return full_path
-                    except (IOError, SyntaxError):
-                        continue
+            with os.scandir(folder_path) as it:
+                candidates = sorted(
+                    (entry for entry in it if entry.name.lower().endswith(valid_extensions)),
+                    key=lambda entry: entry.name
+                )
+                
+            # Header sniff only - the thumbnail loader fully validates the chosen file
+            for entry in candidates:
+                if has_image_signature(entry.path):
+                    return entry.path
         except PermissionError:
             self.status_bar.update_status(f"Permission denied accessing images in {folder_path}", temporary=True)
             
@@ -660,7 +772,10 @@ class MainWindow(tk.Frame):
             img_data['index'] = self.current_image_index
             img_data['total'] = len(self.images)
             
-            self.center_panel.show_image(img_path, img_data)
+            self.center_panel.show_image(
+                img_path, img_data, self.image_manager.get_preview(img_path)
+            )
+            self.image_manager.prefetch_neighbours()
             self.right_panel.load_image_data(img_data)
             
             # Update button states
@@ -689,6 +804,7 @@ class MainWindow(tk.Frame):
         if 0 < self.current_image_index < len(self.images):
             self.images[self.current_image_index], self.images[self.current_image_index - 1] = \
                 self.images[self.current_image_index - 1], self.images[self.current_image_index]
+            self.reindex_images(self.current_image_index - 1, self.current_image_index + 1)
             self.current_image_index -= 1
             self.save_folder_data()
             self.show_current_image()
@@ -699,6 +815,7 @@ class MainWindow(tk.Frame):
         if 0 <= self.current_image_index < len(self.images) - 1:
             self.images[self.current_image_index], self.images[self.current_image_index + 1] = \
                 self.images[self.current_image_index + 1], self.images[self.current_image_index]
+            self.reindex_images(self.current_image_index, self.current_image_index + 2)
             self.current_image_index += 1
             self.save_folder_data()
             self.show_current_image()
@@ -714,33 +831,7 @@ class MainWindow(tk.Frame):
 
     def start_batch_process(self) -> None:
         """Start batch processing of all folders."""
-        if not hasattr(self.gallery_manager, 'root_folder'):
-            messagebox.showerror("Error", "Please select root folder first")
-            return
-
-        def process_task() -> int:
-            """Background task to process all folders."""
-            total = 0
-            folders = self.get_folder_list()
-            for i, folder in enumerate(folders):
-                count = self.gallery_manager.process_folder(folder['path'])
-                total += count
-                progress = (i + 1) / len(folders) * 100
-                self.status_bar.update_status(
-                    f"Processed {folder['name']} ({count} new images)", 
-                    progress
-                )
-            return total
-
-        def on_complete(total: int) -> None:
-            """Callback when batch processing completes."""
-            messagebox.showinfo(
-                "Complete", 
-                f"Batch processing completed\n{total} new images processed"
-            )
-            self.left_panel.load_folders(self.get_folder_list())
-
-        run_in_thread(process_task, on_complete)
+        self.batch_processor.process_all_folders()
 
     def refresh_current_folder(self) -> None:
         """Reload the currently selected folder."""
@@ -759,6 +850,9 @@ class MainWindow(tk.Frame):
             item = self.images.pop(from_index)
             self.images.insert(to_index, item)
             
+            # Only positions between the two indexes shifted
+            self.reindex_images(min(from_index, to_index), max(from_index, to_index) + 1)
+            
             # Update current image index if needed
             if self.current_image_index == from_index:
                 self.current_image_index = to_index
@@ -774,8 +868,63 @@ class MainWindow(tk.Frame):
             if self.current_image_index == to_index:
                 self.show_current_image()
 
+    def move_images_to_folder(self, indices: List[int], folder_path: str) -> None:
+        """
+        Move several images to another folder.
+        
+        The file moves run in one background thread and the destination
+        JSON is written once at the end instead of once per image.
+        
+        Args:
+            indices: Positions of the images in self.images
+            folder_path: Target gallery folder
+        """
+        jobs = [self._prepare_move(i, folder_path) for i in sorted(set(indices))]
+        
+        def task() -> Dict[str, Any]:
+            moved = []
+            error = None
+            try:
+                for job in jobs:
+                    moved.append(self._do_move_worker(job, defer_write=True))
+            except Exception as e:
+                error = e
+                
+            failed = self._flush_dirty_json()
+            if failed:
+                # The destination JSON never reached disk: put those files
+                # back so the source gallery keeps its entries
+                for job in moved:
+                    if job['dest_json'] in failed:
+                        try:
+                            move_file(job['dest_file'], job['src_file'])
+                        except OSError as e:
+                            print(f"Could not restore {job['src_file']}: {str(e)}")
+                moved = [job for job in moved if job['dest_json'] not in failed]
+                if error is None:
+                    key, e = next(iter(failed.items()))
+                    error = IOError(f"Failed to save {os.path.basename(key)}: {str(e)}")
+            return {'moved': moved, 'error': error}
+            
+        run_in_thread(task, self._on_move_complete, self._on_move_failed)
+
     def move_image_to_folder(self, index: int, folder_path: str) -> None:
-        """Enhanced folder move with transaction safety"""
+        """
+        Enhanced folder move with transaction safety
+        
+        Validation happens immediately; hashing, the physical move and the
+        destination JSON update run in a background thread, and the source
+        gallery is updated from _on_move_complete on the Tk thread.
+        """
+        job = self._prepare_move(index, folder_path)
+        run_in_thread(
+            lambda: {'moved': [self._do_move_worker(job)], 'error': None},
+            self._on_move_complete,
+            self._on_move_failed
+        )
+
+    def _prepare_move(self, index: int, folder_path: str) -> Dict[str, Any]:
+        """Validate a move request on the Tk thread and snapshot its inputs."""
         try:
             # Validate paths
             src_path = Path(self.current_folder)
@@ -797,30 +946,57 @@ class MainWindow(tk.Frame):
             if not src_file.exists():
                 raise FileNotFoundError(f"Source image missing: {src_file}")
                 
-            # Generate new filename using gallery naming convention
-            folder_name = dest_path.name
-            tags = img_data.get('keywords', [])
-            img_hash = self.compute_image_hash(src_file)
-            new_name = f"{self.slugify(folder_name)}-{self.slugify('-'.join(tags[:2]))}-{img_hash[:6]}{src_file.suffix.lower()}"
-            new_name = "".join(c for c in new_name if c.isalnum() or c in ('-', '_', '.'))
-            dest_file = dest_path / new_name
-
-            # Transaction block
-            try:
-                # Move physical file
-                shutil.move(src_file, dest_file)
-                
-                # Update source JSON
-                self.images.pop(index)
-                self.save_folder_data()
+        except Exception as e:
+            self.status_bar.update_status(f"Move failed: {str(e)}")
+            raise
+            
+        return {
+            'src_folder': self.current_folder,
+            'src_file': src_file,
+            'dest_path': dest_path,
+            'folder_path': folder_path,
+            'src_url': img_data['url'],
+            'img_data': img_data.copy()
+        }
+
+    def _do_move_worker(self, job: Dict[str, Any], defer_write: bool = False) -> Dict[str, Any]:
+        """
+        Move one image file and add it to the destination JSON.
+        
+        Runs in a background thread - must not touch Tk widgets or
+        self.images.
+        
+        Args:
+            job: Move description from _prepare_move()
+            defer_write: Leave the destination JSON dirty in the cache; the
+                caller is responsible for calling _flush_dirty_json()
                 
+        Returns:
+            The job dict, with img_data updated to its new filename
+        """
+        src_file = job['src_file']
+        dest_path = job['dest_path']
+        img_data = job['img_data']
+        
+        # Generate new filename using gallery naming convention
+        folder_name = dest_path.name
+        tags = img_data.get('keywords', [])
+        img_hash = self.compute_image_hash(src_file)
+        new_name = f"{self.slugify(folder_name)}-{self.slugify('-'.join(tags[:2]))}-{img_hash[:6]}{src_file.suffix.lower()}"
+        new_name = "".join(c for c in new_name if c.isalnum() or c in ('-', '_', '.'))
+        dest_file = dest_path / new_name
+        dest_json = dest_path / f"{dest_path.name}.json"
+        dest_data = {"images": []}
+
+        # Transaction block
+        try:
+            # Move physical file
+            move_file(src_file, dest_file)
+            
+            with self._json_lock:
                 # Update destination JSON
-                dest_json = dest_path / f"{dest_path.name}.json"
-                dest_data = {"images": []}
-                
-                if dest_json.exists():
-                    with open(dest_json, 'r', encoding='utf-8') as f:
-                        dest_data = json.load(f)
+                if str(dest_json) in self._dirty_json or dest_json.exists():
+                    dest_data = self._load_json_cached(dest_json)
                     
                 # Update image data with new filename
                 img_data['url'] = new_name
@@ -829,26 +1005,201 @@ class MainWindow(tk.Frame):
                 dest_data['images'].insert(0, img_data)
                 
                 # Save destination JSON
-                with open(dest_json, 'w', encoding='utf-8') as f:
-                    json.dump(dest_data, f, indent=2, ensure_ascii=False)
-                    
-                # Update UI
-                self.refresh_current_folder()  # This reloads the current folder
-                self.left_panel.load_folders(self.get_folder_list())  # Updates folder list
-                self.center_panel.update_grid_view()  # Force immediate grid refresh
-                
-            except Exception as e:
-                # Try to move file back if something failed
-                if dest_file.exists():
-                    try:
-                        shutil.move(dest_file, src_file)
-                    except Exception:
-                        pass
-                raise
+                self._dump_json_cached(dest_json, dest_data, defer=defer_write)
+                job['dest_count'] = len(dest_data['images'])
                 
         except Exception as e:
-            self.status_bar.update_status(f"Move failed: {str(e)}")
+            # Cached destination data may have been modified in place
+            images = dest_data.get('images', [])
+            if images and images[0] is img_data:
+                images.pop(0)
+                
+            # Try to move file back if something failed
+            if dest_file.exists():
+                try:
+                    move_file(dest_file, src_file)
+                except Exception:
+                    pass
             raise
+            
+        job['dest_file'] = dest_file
+        job['dest_json'] = str(dest_json)
+        return job
+
+    def _on_move_complete(self, result: Dict[str, Any]) -> None:
+        """
+        Drop moved images from their source gallery and refresh the UI.
+        
+        The user may have opened another folder while the move ran; the
+        open gallery is only edited when it is still the source, otherwise
+        the source folder's JSON is updated on disk.
+        """
+        current_changed = False
+        elsewhere: Dict[str, Set[str]] = {}
+        for job in result['moved']:
+            if job['src_folder'] != self.current_folder:
+                elsewhere.setdefault(job['src_folder'], set()).add(job['src_url'])
+                continue
+            index = self.index_of_url(job['src_url'])
+            if index >= 0:
+                self.images.pop(index)
+                self._url_to_index.pop(job['src_url'], None)
+                self.reindex_images(index)
+                current_changed = True
+                
+        if current_changed:
+            self.save_folder_data()
+        for folder, urls in elsewhere.items():
+            count = self._drop_from_gallery_json(folder, urls)
+            if count is not None:
+                self._refresh_folder_counts[folder] = count
+            
+        if result['moved']:
+            # Update UI once the event queue is idle
+            for job in result['moved']:
+                self._refresh_folder_counts[job['folder_path']] = job['dest_count']
+            self._schedule_refresh('current', 'folders', 'grid')
+            
+        if result['error'] is not None:
+            self.status_bar.update_status(f"Move failed: {str(result['error'])}", alert=True)
+
+    def _drop_from_gallery_json(self, folder: str, urls: Set[str]) -> Optional[int]:
+        """
+        Remove entries by url from a gallery JSON that is not open.
+        
+        Returns:
+            The gallery's remaining image count, or None if the update failed
+        """
+        json_path = Path(folder) / f"{os.path.basename(folder)}.json"
+        try:
+            with self._json_lock:
+                data = self._load_json_cached(json_path)
+                # Build new containers: the cached data must stay as on disk
+                # if the write fails
+                images = data['images'] if isinstance(data, dict) else data
+                images = [img for img in images if img.get('url') not in urls]
+                self._dump_json_cached(
+                    json_path, {**data, 'images': images} if isinstance(data, dict) else images
+                )
+                return len(images)
+        except Exception as e:
+            self.status_bar.update_status(
+                f"Failed to update {json_path.name}: {str(e)}", alert=True
+            )
+            return None
+
+    def _schedule_refresh(self, *flags: str) -> None:
+        """
+        Request UI refreshes, coalesced into one pass on the next idle.
+        
+        Args:
+            flags: Any of 'current' (reload current folder), 'folders'
+                (folder list) and 'grid' (grid view)
+        """
+        self._refresh_flags.update(flags)
+        if not self._ui_refresh_scheduled:
+            self._ui_refresh_scheduled = True
+            self.after_idle(self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        """Perform each pending UI refresh once."""
+        flags = self._refresh_flags
+        counts = self._refresh_folder_counts
+        self._refresh_flags = set()
+        self._refresh_folder_counts = {}
+        self._ui_refresh_scheduled = False
+        
+        if 'current' in flags:
+            self.refresh_current_folder()  # This reloads the current folder
+            
+        if 'folders' in flags:
+            # Moves only change image counts - rescan only if a folder is unknown
+            if all(path in self.left_panel.folder_buttons for path in counts):
+                for path, count in counts.items():
+                    self.left_panel.update_folder_display(path, count)
+            else:
+                self.left_panel.load_folders(self.get_folder_list())
+                
+        if 'grid' in flags:
+            self.center_panel.update_grid_view()
+
+    def _on_move_failed(self, error: TaskError) -> None:
+        """Report a move that failed in the background thread."""
+        self.status_bar.update_status(f"Move failed: {str(error.exception)}", alert=True)
+
+    def index_of_url(self, url: str) -> int:
+        """Return the position of the image with the given url, or -1."""
+        return self._url_to_index.get(url, -1)
+
+    def reindex_images(self, start: int = 0, stop: Optional[int] = None) -> None:
+        """
+        Refresh the url -> index map for images[start:stop].
+        
+        Called with a narrow range after swaps/reorders and with no
+        arguments after the whole list is replaced or sorted.
+        """
+        if start == 0 and stop is None:
+            self._url_to_index.clear()
+        if stop is None:
+            stop = len(self.images)
+        for i in range(start, stop):
+            self._url_to_index[self.images[i].get('url')] = i
+
+    def _load_json_cached(self, path: Path) -> Any:
+        """
+        Load a JSON file, reusing the parsed data while its mtime is unchanged.
+        
+        Avoids re-parsing the destination gallery JSON on every move when
+        several images are dropped onto the same folder.
+        """
+        key = str(path)
+        cached = self._json_cache.get(key)
+        if key in self._dirty_json:
+            return cached[1]
+            
+        mtime = os.stat(key).st_mtime_ns
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+            
+        data = _load_json_file(key)
+        self._json_cache[key] = (mtime, data)
+        return data
+
+    def _dump_json_cached(self, path: Path, data: Any, defer: bool = False) -> None:
+        """
+        Write a JSON file and refresh its cache entry with the new mtime.
+        
+        With defer=True the data is only stored in the cache and marked
+        dirty until the next _flush_dirty_json().
+        """
+        key = str(path)
+        if defer:
+            self._json_cache[key] = (self._json_cache.get(key, (0, None))[0], data)
+            self._dirty_json.add(key)
+            return
+            
+        _dump_json_file(key, data)
+        self._json_cache[key] = (os.stat(key).st_mtime_ns, data)
+        self._dirty_json.discard(key)
+
+    def _flush_dirty_json(self) -> Dict[str, Exception]:
+        """
+        Write every deferred JSON cache entry to disk (safe from worker threads).
+        
+        Returns:
+            Failed paths mapped to their errors; their cache entries are
+            dropped, so callers must undo whatever the entries recorded
+        """
+        failed: Dict[str, Exception] = {}
+        with self._json_lock:
+            while self._dirty_json:
+                key = self._dirty_json.pop()
+                try:
+                    self._dump_json_cached(key, self._json_cache[key][1])
+                except Exception as e:
+                    self._json_cache.pop(key, None)
+                    failed[key] = e
+        return failed
 
     def compute_image_hash(self, filepath: Path) -> str:
         """Compute a simple hash of an image file for naming purposes"""
@@ -862,6 +1213,7 @@ class MainWindow(tk.Frame):
         """Sort images A-Z by filename"""
         if self.images:
             self.images.sort(key=lambda x: x['url'].lower())
+            self.reindex_images()
             self.current_image_index = 0
             self.save_folder_data()
             self.show_current_image()
@@ -872,6 +1224,7 @@ class MainWindow(tk.Frame):
         """Sort images Z-A by filename"""
         if self.images:
             self.images.sort(key=lambda x: x['url'].lower(), reverse=True)
+            self.reindex_images()
             self.current_image_index = 0
             self.save_folder_data()
             self.show_current_image()
@@ -882,6 +1235,7 @@ class MainWindow(tk.Frame):
         """Sort images with featured first"""
         if self.images:
             self.images.sort(key=lambda x: not x.get('featured', False))
+            self.reindex_images()
             self.current_image_index = 0
             self.save_folder_data()
             self.show_current_image()
@@ -899,24 +1253,11 @@ class MainWindow(tk.Frame):
                 - timestamps
                 - Empty export_profiles
         """
-        folder_name = os.path.basename(self.current_folder)
-        now = datetime.now().isoformat()
-        
-        return {
-            "gallery_title": folder_name,
-            "gallery_slug": folder_name.lower().replace(" ", "-"),
-            "created_date": now,  # Would ideally load from original if available
-            "last_updated": now,
-            "export_profiles": []
-        }
+        return _meta_for(self.current_folder)
     
     def slugify(self, text: str) -> str:
         """Convert text to URL-friendly slug"""
-        import unicodedata
-        import re
-        text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
-        text = re.sub(r'[^\w\s-]', '', text).strip().lower()
-        return re.sub(r'[-\s]+', '-', text)
+        return _slugify(text)
     
     from contextlib import contextmanager
     import tempfile
@@ -8,6 +8,7 @@ Responsibilities:
 - Thread management for background processing
 - Progress reporting
 - Coordinating with GalleryManager for actual processing
+- Running folders concurrently (via GalleryManager.process_folders)
 
 Dependencies:
 - MainWindow (for access to other components)
@@ -15,9 +16,8 @@ Dependencies:
 - ThreadUtils (for background operations)
 """
 
-from typing import Callable
 from tkinter import messagebox
-from utils.thread_utils import run_in_thread
+from utils.thread_utils import run_in_thread, schedule_callback
 
 class BatchProcessor:
     """Handles batch processing operations with thread safety."""
@@ -49,23 +49,40 @@ class BatchProcessor:
         return True
 
     def _process_folders_task(self) -> int:
-        """Background task to process folders."""
-        total = 0
+        """
+        Background task to process folders.
+        
+        GalleryManager.process_folders runs the folders on a small bounded
+        thread pool against one shared hash index; status updates are sent
+        back through schedule_callback so Tk is only touched on the main thread.
+        """
         folders = self.main.folder_manager.scan_gallery_structure()
+        if not folders:
+            return 0
+            
+        done = 0
         
-        for i, folder in enumerate(folders):
-            count = self.main.gallery_manager.process_folder(folder['path'])
-            total += count
-            self._update_progress(i, len(folders), count, folder['name'])
+        def folder_done(name: str, count: int) -> None:
+            nonlocal done
+            self._update_progress(done, len(folders), count, name)
+            done += 1
             
-        return total
+        return self.main.gallery_manager.process_folders(
+            folders, folder_callback=folder_done
+        )
 
     def _update_progress(self, current: int, total: int, count: int, name: str) -> None:
-        """Update progress status."""
+        """Update progress status (delivered on the Tk main thread).
+        
+        Coalesced, so ticks that arrive between GUI polls collapse into
+        the newest one instead of queueing.
+        """
         progress = (current + 1) / total * 100
-        self.main.status_bar.update_status(
+        schedule_callback(
+            self.main.status_bar.update_status,
             f"Processed {name} ({count} new images)", 
-            progress
+            progress,
+            coalesce_key=('batch-progress', id(self))
         )
 
     def _handle_completion(self, total: int) -> None:
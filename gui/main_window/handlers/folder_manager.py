@@ -22,7 +22,8 @@ import json
 from typing import List, Dict, Optional, Any
 from pathlib import Path
 from tkinter import filedialog
-from PIL import Image, UnidentifiedImageError
+
+from utils.image_utils import has_image_signature
 
 class FolderManager:
     """Central handler for all folder management operations."""
@@ -78,13 +79,15 @@ class FolderManager:
             return folders
             
         try:
-            for item in sorted(os.listdir(self.main.gallery_manager.root_folder)):
-                full_path = os.path.join(self.main.gallery_manager.root_folder, item)
+            # DirEntry.is_dir() comes from the directory read - no extra stat per entry
+            with os.scandir(self.main.gallery_manager.root_folder) as it:
+                entries = sorted(
+                    (entry for entry in it if entry.is_dir(follow_symlinks=False)),
+                    key=lambda entry: entry.name
+                )
                 
-                if not os.path.isdir(full_path):
-                    continue
-                    
-                folder_data = self._process_gallery_folder(item, full_path)
+            for entry in entries:
+                folder_data = self._process_gallery_folder(entry.name, entry.path)
                 if folder_data:
                     folders.append(folder_data)
                     
@@ -105,7 +108,11 @@ class FolderManager:
             Folder data dict if valid, None otherwise
         """
         try:
-            if not os.listdir(folder_path):
+            # Only need to know whether there is at least one entry
+            with os.scandir(folder_path) as it:
+                is_empty = next(it, None) is None
+                
+            if is_empty:
                 self.main.status_bar.update_status(
                     f"Skipped empty folder: {folder_name}", 
                     temporary=True
@@ -115,7 +122,7 @@ class FolderManager:
             return {
                 'name': folder_name,
                 'path': folder_path,
-                'thumbnail_path': self.find_first_image(full_path)
+                'thumbnail_path': self.find_first_image(folder_path)
             }
             
         except PermissionError:
@@ -136,38 +143,26 @@ class FolderManager:
             Path to first valid image file or None
             
         Handles:
-        - Image verification
+        - Image signature check
         - Permission errors
-        - Corrupt image files
+        - Non-image files with image extensions
         """
         VALID_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.bmp', '.gif')
         
         try:
-            for f in sorted(os.listdir(folder_path)):
-                if f.lower().endswith(VALID_EXTENSIONS):
-                    full_path = os.path.join(folder_path, f)
-                    if self._validate_image_file(full_path):
-                        return full_path
+            with os.scandir(folder_path) as it:
+                candidates = sorted(
+                    (entry for entry in it if entry.name.lower().endswith(VALID_EXTENSIONS)),
+                    key=lambda entry: entry.name
+                )
+                
+            # Header sniff only - the thumbnail loader fully validates the chosen file
+            for entry in candidates:
+                if has_image_signature(entry.path):
+                    return entry.path
         except PermissionError:
             self.main.status_bar.update_status(
                 f"Permission denied accessing images in {folder_path}", 
                 temporary=True
             )
         return None
-
-    def _validate_image_file(self, file_path: str) -> bool:
-        """
-        Validate that a file is a loadable image.
-        
-        Args:
-            file_path: Path to image file
-            
-        Returns:
-            True if valid image, False otherwise
-        """
-        try:
-            with Image.open(file_path) as img:
-                img.verify()
-            return True
-        except (IOError, SyntaxError, UnidentifiedImageError):
-            return False
\ No newline at end of file
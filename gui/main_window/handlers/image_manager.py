@@ -17,25 +17,37 @@ Dependencies:
 """
 
 import json
+import threading
+from collections import ChainMap, OrderedDict
 from pathlib import Path
 from typing import Dict, Any, Optional
 from tkinter import messagebox
 from PIL import Image, UnidentifiedImageError
 
+from utils.image_utils import create_image_preview
+from utils.thread_utils import run_in_thread
+
 class ImageManager:  # Changed from ImageHandler
     """Main controller for image operations."""
     
-    def __init__(self, main_window, cache_size: int = 50):
+    def __init__(self, main_window, cache_size: int = 50, cache_bytes: int = 512 << 20):
         """
         Initialize image handler.
         
         Args:
             main_window: Reference to main application window
             cache_size: Maximum images to cache (default: 50)
+            cache_bytes: Budget for decoded pixel data in the cache (default: 512 MB)
         """
         self.main = main_window
-        self._image_cache = {}
+        self._image_cache: OrderedDict = OrderedDict()
         self._max_cache_size = cache_size
+        self._cache_bytes = 0
+        self._max_cache_bytes = cache_bytes
+        self._preview_size = (1200, 1200)  # Matches CenterPanel.show_image preview
+        self._cache_lock = threading.Lock()  # Cache is also filled by prefetch threads
+        self._prefetching = set()  # Paths currently being warmed
+        self._max_prefetch = 2  # Queue depth - deeper prefetch would evict useful entries
         self._valid_extensions = ('.jpg', '.jpeg', '.png', '.webp', '.bmp', '.gif')
 
     def show_current_image(self) -> None:
@@ -86,7 +98,14 @@ class ImageManager:  # Changed from ImageHandler
     def set_cache_size(self, size: int) -> None:
         """Set maximum number of images to cache."""
         self._max_cache_size = max(1, size)
-        self._trim_cache()
+        with self._cache_lock:
+            self._trim_cache()
+
+    def set_cache_budget(self, size_bytes: int) -> None:
+        """Set maximum decoded bytes held by the image cache."""
+        self._max_cache_bytes = max(0, size_bytes)
+        with self._cache_lock:
+            self._trim_cache()
 
     def set_valid_extensions(self, extensions: tuple) -> None:
         """Set valid image file extensions."""
@@ -102,14 +121,19 @@ class ImageManager:  # Changed from ImageHandler
             and self.main.current_folder
         )
 
-    def _prepare_image_metadata(self) -> Dict[str, Any]:
-        """Prepare image metadata with navigation context."""
-        img_data = self.main.images[self.main.current_image_index].copy()
-        img_data.update({
+    def _prepare_image_metadata(self) -> ChainMap:
+        """
+        Prepare image metadata with navigation context.
+        
+        Returns a ChainMap overlaying index/total on the stored image dict
+        instead of copying it; writes land in the overlay, never in
+        self.main.images.
+        """
+        nav = {
             'index': self.main.current_image_index,
             'total': len(self.main.images)
-        })
-        return img_data
+        }
+        return ChainMap(nav, self.main.images[self.main.current_image_index])
 
     def _resolve_image_path(self, img_data: Dict[str, Any]) -> Path:
         """Get absolute path from image metadata."""
@@ -129,6 +153,9 @@ class ImageManager:  # Changed from ImageHandler
             self._update_interface(image, img_path, img_data)
         except (IOError, UnidentifiedImageError) as e:
             self.main.status_bar.update_status(f"Error loading image: {str(e)}")
+            return
+            
+        self.prefetch_neighbours()
 
     def _update_image_metadata(self, new_data: Dict[str, Any]) -> None:
         """Update metadata for current image."""
@@ -137,31 +164,104 @@ class ImageManager:  # Changed from ImageHandler
     # -------------------- Cache Management -------------------- #
 
     def _get_cached_or_load_image(self, img_path: Path) -> Image.Image:
-        """Get image from cache or load new."""
+        """
+        Get the display preview from cache or build it.
+        
+        The cache holds exactly what CenterPanel.show_image displays: the
+        oriented preview at _preview_size (create_image_preview drafts
+        JPEGs at reduced scale), so a hit skips decoding entirely.
+        """
         path_str = str(img_path)
-        if path_str in self._image_cache:
-            return self._image_cache[path_str]
+        with self._cache_lock:
+            if path_str in self._image_cache:
+                self._image_cache.move_to_end(path_str)
+                return self._image_cache[path_str]
             
-        image = Image.open(img_path)
-        self._cache_image(path_str, image)
+        # Decode outside the lock so the UI and prefetch threads don't serialize
+        image = create_image_preview(img_path, self._preview_size)
+        if image is None:
+            raise IOError(f"Cannot decode image {img_path}")
+        
+        with self._cache_lock:
+            self._cache_image(path_str, image)
         return image
 
+    def get_preview(self, img_path: Path) -> Optional[Image.Image]:
+        """
+        Get the cached display preview for an image, decoding it on a miss.
+        
+        Returns:
+            PIL Image, or None if the file cannot be decoded (the caller
+            then falls back to CenterPanel's own error reporting)
+        """
+        try:
+            return self._get_cached_or_load_image(img_path)
+        except (IOError, UnidentifiedImageError):
+            return None
+
+    def prefetch_neighbours(self) -> None:
+        """
+        Warm the preview cache with the next and previous images in the background.
+        
+        Called after each display so stepping through a folder hits the
+        cache that show_image is fed from.
+        """
+        index = self.main.current_image_index
+        for neighbour in (index + 1, index - 1):
+            if not 0 <= neighbour < len(self.main.images):
+                continue
+                
+            img_path = self._resolve_image_path(self.main.images[neighbour])
+            path_str = str(img_path)
+            with self._cache_lock:
+                if len(self._prefetching) >= self._max_prefetch:
+                    continue
+                if path_str in self._image_cache or path_str in self._prefetching:
+                    continue
+                self._prefetching.add(path_str)
+                
+            run_in_thread(lambda p=img_path: self._warm(p))
+
+    def _warm(self, img_path: Path) -> None:
+        """Load an image into the cache (runs in a background thread)."""
+        try:
+            if self._validate_image_path(img_path):
+                self._get_cached_or_load_image(img_path)
+        except (IOError, UnidentifiedImageError):
+            pass  # Reported if and when the image is actually shown
+        finally:
+            with self._cache_lock:
+                self._prefetching.discard(str(img_path))
+
+    @staticmethod
+    def _image_cost(image: Image.Image) -> int:
+        """Approximate decoded size of an image in bytes."""
+        width, height = image.size
+        return width * height * 4
+
     def _cache_image(self, path: str, image: Image.Image) -> None:
-        """Cache image with LRU strategy."""
-        if len(self._image_cache) >= self._max_cache_size:
-            self._image_cache.pop(next(iter(self._image_cache)))
+        """Cache image with LRU strategy (caller holds _cache_lock)."""
+        previous = self._image_cache.pop(path, None)
+        if previous is not None:
+            self._cache_bytes -= self._image_cost(previous)
         self._image_cache[path] = image
+        self._cache_bytes += self._image_cost(image)
+        self._trim_cache()
 
     def _trim_cache(self) -> None:
-        """Reduce cache size if needed."""
-        while len(self._image_cache) > self._max_cache_size:
-            self._image_cache.pop(next(iter(self._image_cache)))
+        """Evict least recently used images until within the count and byte limits."""
+        while self._image_cache and (
+            len(self._image_cache) > self._max_cache_size
+            or (self._cache_bytes > self._max_cache_bytes and len(self._image_cache) > 1)
+        ):
+            _, evicted = self._image_cache.popitem(last=False)
+            self._cache_bytes -= self._image_cost(evicted)
 
     # -------------------- UI Coordination -------------------- #
 
     def _update_interface(self, image: Image.Image, path: Path, data: Dict[str, Any]) -> None:
         """Update all UI elements with new image."""
-        self.main.center_panel.show_image(path, data)
+        self.main.center_panel.show_image(path, data, image)
         self.main.right_panel.load_image_data(data)
         self.main.update_navigation_buttons()
         self.main.status_bar.update_status(
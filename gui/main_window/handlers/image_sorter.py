@@ -39,8 +39,8 @@ class ImageSorter:
         if not self.main.images:
             return
             
-        self.main.images.sort(
-            key=lambda x: x['url'].lower(), 
+        self._sort_by_column(
+            [img['url'].lower() for img in self.main.images],
             reverse=reverse
         )
         self._finalize_operation(f"Images sorted {'Z-A' if reverse else 'A-Z'} by filename")
@@ -50,8 +50,8 @@ class ImageSorter:
         if not self.main.images:
             return
             
-        self.main.images.sort(
-            key=lambda x: not x.get('featured', False)
+        self._sort_by_column(
+            [not img.get('featured', False) for img in self.main.images]
         )
         self._finalize_operation("Featured images moved to top")
 
@@ -66,12 +66,27 @@ class ImageSorter:
         if not self.main.images:
             return
             
-        self.main.images.sort(
-            key=lambda x: str(x.get(key, '')).lower(),
+        self._sort_by_column(
+            [str(img.get(key, '')).lower() for img in self.main.images],
             reverse=reverse
         )
         self._finalize_operation(f"Sorted by {key} ({'Z-A' if reverse else 'A-Z'})")
 
+    def _sort_by_column(self, keys: List, reverse: bool = False) -> None:
+        """
+        Reorder images by a precomputed key column.
+        
+        Sorting indexes over a flat list of keys keeps the comparisons off
+        the image dicts; the list is then rearranged in place in one pass.
+        
+        Args:
+            keys: One sort key per image, in current image order
+            reverse: Sort descending if True
+        """
+        images = self.main.images
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+        images[:] = [images[i] for i in order]
+
     def _finalize_operation(self, message: str) -> None:
         """
         Common post-sort operations.
@@ -79,6 +94,9 @@ class ImageSorter:
         Args:
             message: Status message to display
         """
+        # Sorting moved every image - rebuild the url index
+        self.main.reindex_images()
+        
         # Reset to first image
         self.main.current_image_index = 0
         
@@ -8,14 +8,23 @@ Provides:
 - Theming support using config colors
 """
 
+from __future__ import annotations
+
 import tkinter as tk
-from tkinter import ttk, messagebox
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from config import get_color
 
 if TYPE_CHECKING:
     from .base import MainWindow
 
+
+@lru_cache(maxsize=1)
+def _bg() -> str:
+    """Menu background colour; call ``_bg.cache_clear()`` after a theme change."""
+    return get_color("background", "#F9F7F4")
+
+
 class MainMenu:
     """
     Handles creation and management of the main application menu.
@@ -23,9 +32,29 @@ class MainMenu:
     Attributes:
         main_window (MainWindow): Reference to the main window instance
         menubar (tk.Menu): The main menu bar
+        file_menu (tk.Menu): File cascade, populated on first open
+        edit_menu (tk.Menu): Edit cascade, populated on first open
     """
+
+    # (label, command name, accelerator text, key sequence);
+    # (None, None, None, None) marks a separator. Command names are
+    # MainWindow methods, except "exit" (see _resolve_commands). Sequences
+    # avoid the Ctrl+Z/Y/S/A/+/-/0 bindings used elsewhere and the
+    # Entry/Text emacs keys.
+    _FILE_ITEMS = (
+        ("Select Root Folder", "select_root_folder", None, None),
+        ("Batch Process", "start_batch_process", "Ctrl+Shift+B", "<Control-B>"),
+        (None, None, None, None),
+        ("Exit", "exit", "Ctrl+Q", "<Control-q>"),
+    )
+    _EDIT_ITEMS = (
+        ("Refresh", "refresh_current_folder", "F5", "<F5>"),
+        ("Sort Images (A-Z)", "sort_images_az", "F6", "<F6>"),
+        ("Sort Images (Z-A)", "sort_images_za", "F7", "<F7>"),
+        ("Sort by Featured", "sort_images_featured", "F8", "<F8>"),
+    )
     
-    def __init__(self, main_window: 'MainWindow'):
+    def __init__(self, main_window: MainWindow):
         """
         Initialize the menu system.
         
@@ -33,58 +62,110 @@ class MainMenu:
             main_window: Reference to the main window instance
         """
         self.main_window = main_window
-        self.menubar = tk.Menu(main_window.root, bg=get_color("background", "#F9F7F4"))
+        # Option-database defaults apply to every Menu created afterwards,
+        # including the lazily built submenus
+        main_window.root.option_add("*Menu.tearOff", 0)
+        main_window.root.option_add("*Menu.background", _bg())
+        self.menubar = tk.Menu(main_window.root)
+        self._commands = self._resolve_commands()
         self._create_menu()
 
+    def _resolve_commands(self) -> dict:
+        """Look up every table command once, keyed by command name."""
+        mw = self.main_window
+        commands = {
+            name: getattr(mw, name)
+            for _label, name, _accel, _sequence in self._FILE_ITEMS + self._EDIT_ITEMS
+            if name and name != "exit"
+        }
+        commands["exit"] = mw.root.destroy
+        return commands
+
     def _create_menu(self):
-        """Create and configure the main menu bar."""
+        """
+        Create and configure the main menu bar.
+        
+        Only the top-level cascades are created here; their items are added
+        by the postcommand builders the first time each menu is opened.
+        """
         # File Menu
-        file_menu = tk.Menu(self.menubar, tearoff=0)
-        file_menu.add_command(
-            label="Select Root Folder", 
-            command=self.main_window.select_root_folder
-        )
-        file_menu.add_command(
-            label="Batch Process", 
-            command=self.main_window.start_batch_process
-        )
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.main_window.root.quit)
-        self.menubar.add_cascade(label="File", menu=file_menu)
+        self.file_menu = tk.Menu(self.menubar, postcommand=self._build_file_menu)
+        self._file_built = False
+        self.menubar.add_cascade(label="File", menu=self.file_menu)
 
         # Edit Menu
-        edit_menu = tk.Menu(self.menubar, tearoff=0)
-        edit_menu.add_command(
-            label="Refresh", 
-            command=self.main_window.refresh_current_folder
-        )
-        edit_menu.add_command(
-            label="Sort Images (A-Z)", 
-            command=self.main_window.sort_images_az
-        )
-        edit_menu.add_command(
-            label="Sort Images (Z-A)", 
-            command=self.main_window.sort_images_za
-        )
-        edit_menu.add_command(
-            label="Sort by Featured", 
-            command=self.main_window.sort_images_featured
-        )
-        self.menubar.add_cascade(label="Edit", menu=edit_menu)
-
-        # Set the menu
-        self.main_window.root.config(menu=self.menubar)
-
-def create_main_menu(main_window: 'MainWindow'):
+        self.edit_menu = tk.Menu(self.menubar, postcommand=self._build_edit_menu)
+        self._edit_built = False
+        self.menubar.add_cascade(label="Edit", menu=self.edit_menu)
+
+        # Shortcuts must work before the submenus are first built
+        self._bind_accelerators()
+
+        # Set the menu (skip if already installed, e.g. on an idempotent rebuild)
+        root = self.main_window.root
+        if str(root.cget("menu")) != str(self.menubar):
+            root.config(menu=self.menubar)
+
+    def _bind_accelerators(self):
+        """Bind every table item's key sequence application-wide."""
+        bind_all = self.main_window.root.bind_all
+        cbs = self._commands
+        for _label, name, _accel, sequence in self._FILE_ITEMS + self._EDIT_ITEMS:
+            if sequence:
+                bind_all(sequence, lambda e, cb=cbs[name]: cb())
+
+    def _build_file_menu(self):
+        """Populate the File menu on first post (Tk calls this on every post)."""
+        if self._file_built:
+            return
+        self._file_built = True
+        self._populate(self.file_menu, self._FILE_ITEMS)
+
+    def _build_edit_menu(self):
+        """Populate the Edit menu on first post (Tk calls this on every post)."""
+        if self._edit_built:
+            return
+        self._edit_built = True
+        self._populate(self.edit_menu, self._EDIT_ITEMS)
+
+    def _populate(self, menu: tk.Menu, items) -> None:
+        """
+        Add items from a menu table to a submenu.
+        
+        Args:
+            menu: Submenu to fill
+            items: Item table rows; a row with no label is a separator
+        """
+        cbs = self._commands
+        path = str(menu)
+        lines = []
+        for label, name, accel, _sequence in items:
+            if label is None:
+                lines.append(f"{path} add separator")
+            else:
+                # register() ties the Tcl command's lifetime to this menu;
+                # labels are static table text, so {} quoting is safe
+                lines.append(
+                    f"{path} add command -label {{{label}}} "
+                    f"-command {menu.register(cbs[name])} "
+                    f"-accelerator {{{accel or ''}}}"
+                )
+        menu.tk.eval("\n".join(lines))
+
+def create_main_menu(main_window: MainWindow):
     """
     Legacy function for backward compatibility.
     Creates a MainMenu instance and returns the menubar.
     
+    The instance is stored on ``main_window.menu`` (as MainWindow does
+    itself) so it lives as long as the window whose menubar calls into it.
+    New code should construct ``MainMenu(main_window)`` directly.
+    
     Args:
         main_window: Reference to the main window instance
         
     Returns:
         tk.Menu: The created menu bar
     """
-    menu = MainMenu(main_window)
-    return menu.menubar
\ No newline at end of file
+    main_window.menu = MainMenu(main_window)
+    return main_window.menu.menubar
\ No newline at end of file
@@ -6,50 +6,105 @@ Complete implementation with improved button layout for better visibility.
 Changes made:
 1. Fixed initialization order to prevent AttributeError
 2. Enhanced featured checkbox visibility
-3. Added debug prints for troubleshooting
+3. Added debug logging for troubleshooting
 """
 
+import logging
+import re
 import tkinter as tk
 import threading
+from collections import deque
 from tkinter import ttk, messagebox
-from typing import Dict, Callable, Optional, List, Any
+from typing import Deque, Dict, Callable, ClassVar, Optional, List, Any, Tuple
 from pathlib import Path
 from datetime import datetime
-from PIL import Image, ImageTk
 
 from gui.styles import COLORS, FONTS
 from utils.file_utils import slugify
 
+logger = logging.getLogger(__name__)
+
+_KEYWORD_SPLIT = re.compile(r"\s*,\s*")
+
 class HistoryManager:
-    """Track changes for undo/redo functionality with thread safety."""
+    """
+    Track changes for undo/redo functionality.
+    
+    Single-stack operations need no lock: deque.append and deque.pop are
+    atomic under the GIL, and edits are only recorded from the Tk thread.
+    The lock only guards the two-stack transfers in pop_to_redo/pop_to_undo.
+    has_undo/has_redo are refreshed after every mutation so callers can
+    read availability without touching the deques.
+    """
     def __init__(self, max_steps: int = 50):
-        self.undo_stack: List[Dict] = []
-        self.redo_stack: List[Dict] = []
+        # maxlen makes append evict the oldest entry in O(1)
+        self.undo_stack: Deque[Dict] = deque(maxlen=max_steps)
+        self.redo_stack: Deque[Dict] = deque(maxlen=max_steps)
         self.max_steps = max_steps
         self._lock = threading.Lock()
+        self.has_undo = False
+        self.has_redo = False
+
+    def _sync_flags(self) -> None:
+        """Refresh the cached availability flags."""
+        self.has_undo = bool(self.undo_stack)
+        self.has_redo = bool(self.redo_stack)
 
     def record_change(self, field: str, old_value: Any, new_value: Any) -> None:
-        """Record a change to the history with thread safety."""
-        with self._lock:
-            self.undo_stack.append({
-                'field': field,
-                'old_value': old_value,
-                'new_value': new_value,
-                'timestamp': datetime.now()
-            })
-            if len(self.undo_stack) > self.max_steps:
-                self.undo_stack.pop(0)
-            self.redo_stack.clear()
+        """Record a change to the history."""
+        self.undo_stack.append({
+            'field': field,
+            'old_value': old_value,
+            'new_value': new_value
+        })
+        self.redo_stack.clear()
+        self.has_undo = True
+        self.has_redo = False
 
     def get_undo_change(self) -> Optional[Dict]:
-        """Get the next undo change if available with thread safety."""
-        with self._lock:
-            return self.undo_stack.pop() if self.undo_stack else None
+        """Get the next undo change if available."""
+        try:
+            return self.undo_stack.pop()
+        except IndexError:
+            return None
+        finally:
+            self._sync_flags()
 
     def get_redo_change(self) -> Optional[Dict]:
-        """Get the next redo change if available with thread safety."""
+        """Get the next redo change if available."""
+        try:
+            return self.redo_stack.pop()
+        except IndexError:
+            return None
+        finally:
+            self._sync_flags()
+
+    def clear(self) -> None:
+        """Empty both stacks in place."""
+        with self._lock:
+            self.undo_stack.clear()
+            self.redo_stack.clear()
+            self.has_undo = self.has_redo = False
+
+    def pop_to_redo(self) -> Optional[Dict]:
+        """Move the latest undo change onto the redo stack in one step."""
+        with self._lock:
+            if not self.undo_stack:
+                return None
+            change = self.undo_stack.pop()
+            self.redo_stack.append(change)
+            self._sync_flags()
+            return change
+
+    def pop_to_undo(self) -> Optional[Dict]:
+        """Move the latest redo change back onto the undo stack in one step."""
         with self._lock:
-            return self.redo_stack.pop() if self.redo_stack else None
+            if not self.redo_stack:
+                return None
+            change = self.redo_stack.pop()
+            self.undo_stack.append(change)
+            self._sync_flags()
+            return change
 
 class RightPanel(tk.Frame):
     """
@@ -68,6 +123,12 @@ class RightPanel(tk.Frame):
         "max_width": 1200,
         "max_height": 1200
     }
+    # Quiet period after the last keystroke before a field edit is recorded
+    COMMIT_DELAY_MS = 300
+    # User-editable fields compared against original_state
+    _COMPARE_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'filename', 'title', 'caption', 'keywords', 'alt_text', 'headline', 'featured'
+    )
 
     def __init__(
         self,
@@ -85,11 +146,20 @@ class RightPanel(tk.Frame):
         )
         self.pack_propagate(False)
         
-        self.status_cb = status_callback
+        self._real_status_cb = status_callback
+        self._status_msg: Optional[str] = None  # latest message awaiting idle flush
         self.config = config
         self.current_data: Optional[Dict] = None
         self.history = HistoryManager()
         self.tag_suggestions: List[str] = []
+        self._tag_set: frozenset = frozenset()
+        self._tags_before_select: List[str] = []
+        self._pending_after: Dict[str, str] = {}  # field -> pending after() id
+        self._dirty = False  # set by recorded edits, cleared on load/save
+        self._last_undo_state: Optional[Tuple[bool, bool]] = None  # (has_undo, has_redo) shown
+        self._kw_cache: Tuple[str, List[str]] = ("", [])  # (raw entry text, parsed tags)
+        self._original_keywords_key: Tuple[str, ...] = ()
+        self._kw_committed_raw = ""  # keywords text at the last commit/load/save
         
         # Initialize export settings
         self.export_settings = {
@@ -106,31 +176,35 @@ class RightPanel(tk.Frame):
         # Finally set up bindings
         self.setup_bindings()
 
-        print("RightPanel initialized successfully")  # Debug confirmation
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("RightPanel initialized successfully")
 
     def create_widgets(self) -> None:
         """Initialize all UI components with improved button layout."""
+        bg = COLORS["background"]
+        accent = COLORS["accent"]
+        
         # Header
-        self.header = tk.Frame(self, bg=COLORS["accent"])
+        self.header = tk.Frame(self, bg=accent)
         self.header.pack(fill="x", pady=(0, 15))
         
         tk.Label(
             self.header,
             text="Edit Image Details",
             font=FONTS["heading"],
-            bg=COLORS["accent"],
+            bg=accent,
             fg="white",
             padx=10,
             pady=5
         ).pack()
 
         # Main form with scrollbar
-        self.form_container = tk.Frame(self, bg=COLORS["background"])
+        self.form_container = tk.Frame(self, bg=bg)
         self.form_container.pack(fill="both", expand=True)
         
         self.canvas = tk.Canvas(
             self.form_container,
-            bg=COLORS["background"],
+            bg=bg,
             highlightthickness=0
         )
         self.scrollbar = ttk.Scrollbar(
@@ -138,7 +212,7 @@ class RightPanel(tk.Frame):
             orient="vertical",
             command=self.canvas.yview
         )
-        self.form_frame = tk.Frame(self.canvas, bg=COLORS["background"])
+        self.form_frame = tk.Frame(self.canvas, bg=bg)
         
         self.form_frame.bind(
             "<Configure>",
@@ -150,6 +224,7 @@ class RightPanel(tk.Frame):
         
         # Form elements
         self.create_form_fields()
+        self._build_appliers()
         
         # Pack scrollable area
         self.canvas.pack(side="left", fill="both", expand=True)
@@ -158,23 +233,28 @@ class RightPanel(tk.Frame):
         # Navigation controls
         self.create_navigation_controls()
         
-        # Export section
-        self.create_export_section()
+        # Export section (widgets are built on first expand)
+        self._install_export_stub()
 
     def create_form_fields(self) -> None:
         """Create metadata editing form fields with enhanced featured checkbox."""
+        bg = COLORS["background"]
+        dark = COLORS["dark"]
+        primary = COLORS["primary"]
+        body = FONTS["body"]
+        
         # Filename field
         tk.Label(
             self.form_frame,
             text="Filename:",
-            font=FONTS["body"],
-            bg=COLORS["background"],
-            fg=COLORS["dark"]
+            font=body,
+            bg=bg,
+            fg=dark
         ).pack(anchor="w", pady=(5, 0))
         
         self.filename_entry = tk.Entry(
             self.form_frame,
-            font=FONTS["body"],
+            font=body,
             width=30
         )
         self.filename_entry.pack(fill="x", pady=(0, 10))
@@ -184,14 +264,14 @@ class RightPanel(tk.Frame):
         tk.Label(
             self.form_frame,
             text="Title:",
-            font=FONTS["body"],
-            bg=COLORS["background"],
-            fg=COLORS["dark"]
+            font=body,
+            bg=bg,
+            fg=dark
         ).pack(anchor="w", pady=(5, 0))
         
         self.title_entry = tk.Entry(
             self.form_frame,
-            font=FONTS["body"],
+            font=body,
             width=30
         )
         self.title_entry.pack(fill="x", pady=(0, 10))
@@ -201,80 +281,85 @@ class RightPanel(tk.Frame):
         tk.Label(
             self.form_frame,
             text="Caption:",
-            font=FONTS["body"],
-            bg=COLORS["background"],
-            fg=COLORS["dark"]
+            font=body,
+            bg=bg,
+            fg=dark
         ).pack(anchor="w", pady=(5, 0))
         
         self.caption_entry = tk.Text(
             self.form_frame,
             height=3,
             width=30,
-            font=FONTS["body"],
+            font=body,
             wrap=tk.WORD,
             padx=5,
             pady=5
         )
         self.caption_entry.pack(fill="x", pady=(0, 10))
-        self.caption_entry.bind("<KeyRelease>", self.on_caption_change)
+        self.caption_entry.bind("<<Modified>>", self._on_text_modified)
 
         # Keywords with tag suggestions
-        self.tag_frame = tk.Frame(self.form_frame, bg=COLORS["background"])
+        self.tag_frame = tk.Frame(self.form_frame, bg=bg)
         self.tag_frame.pack(fill="x", pady=(5, 0))
         
         tk.Label(
             self.tag_frame,
             text="Keywords:",
-            font=FONTS["body"],
-            bg=COLORS["background"],
-            fg=COLORS["dark"]
+            font=body,
+            bg=bg,
+            fg=dark
         ).pack(anchor="w")
         
         self.keywords_entry = ttk.Combobox(
             self.tag_frame,
-            font=FONTS["body"],
-            values=self.tag_suggestions
+            font=body,
+            values=self.tag_suggestions,
+            postcommand=self._snapshot_tags
         )
         self.keywords_entry.pack(fill="x", pady=(0, 5))
         self.keywords_entry.bind("<KeyRelease>", self.on_tags_change)
         self.keywords_entry.bind("<<ComboboxSelected>>", self.on_tag_selected)
         
-        self.tag_list_frame = tk.Frame(self.form_frame, bg=COLORS["background"])
+        self.tag_list_frame = tk.Frame(self.form_frame, bg=bg)
         self.tag_list_frame.pack(fill="x")
 
         # Alt Text
         tk.Label(
             self.form_frame,
             text="Alt Text:",
-            font=FONTS["body"],
-            bg=COLORS["background"],
-            fg=COLORS["dark"]
+            font=body,
+            bg=bg,
+            fg=dark
         ).pack(anchor="w", pady=(5, 0))
         
         self.alt_text_entry = tk.Text(
             self.form_frame,
             height=3,
             width=30,
-            font=FONTS["body"],
+            font=body,
             wrap=tk.WORD,
             padx=5,
             pady=5
         )
         self.alt_text_entry.pack(fill="x", pady=(0, 10))
-        self.alt_text_entry.bind("<KeyRelease>", self.on_alt_text_change)
+        self.alt_text_entry.bind("<<Modified>>", self._on_text_modified)
+        self._text_widget_to_field = {
+            self.caption_entry: 'caption',
+            self.alt_text_entry: 'alt_text',
+        }
 
         # Headline
         tk.Label(
             self.form_frame,
             text="Headline:",
-            font=FONTS["body"],
-            bg=COLORS["background"],
-            fg=COLORS["dark"]
+            font=body,
+            bg=bg,
+            fg=dark
         ).pack(anchor="w", pady=(5, 0))
         
         self.headline_entry = tk.Entry(
             self.form_frame,
-            font=FONTS["body"],
+            font=body,
             width=30
         )
         self.headline_entry.pack(fill="x", pady=(0, 10))
@@ -287,118 +372,54 @@ class RightPanel(tk.Frame):
             text="★ Featured Image",  # Added visual indicator
             variable=self.featured_var,
             font=("Georgia", 12, "bold"),  # More prominent
-            bg=COLORS["background"],
+            bg=bg,
             fg="#FFD700",  # Gold color
-            selectcolor=COLORS["primary"],
+            selectcolor=primary,
             command=self.on_featured_change,
             padx=5,
             pady=3
         )
         self.featured_cb.pack(anchor="w", pady=(15, 20), ipadx=5, ipady=3)
-        print("Featured checkbox created and packed")  # Debug confirmation
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Featured checkbox created and packed")
 
     def create_navigation_controls(self) -> None:
         """Create navigation and action buttons with improved layout."""
-        # Main container for all buttons
-        nav_container = tk.Frame(self, bg=COLORS["background"])
-        nav_container.pack(fill="x", pady=(15, 0))
-        
-        # Row 1: Undo/Redo buttons
-        undo_frame = tk.Frame(nav_container, bg=COLORS["background"])
-        undo_frame.pack(fill="x", pady=(0, 5))
-        
-        self.undo_btn = ttk.Button(
-            undo_frame,
-            text="Undo",
-            command=self.undo_change,
-            style="Secondary.TButton",
-            width=12
-        )
-        self.undo_btn.pack(side="left", padx=2)
-        
-        self.redo_btn = ttk.Button(
-            undo_frame,
-            text="Redo",
-            command=self.redo_change,
-            style="Secondary.TButton",
-            width=12
+        # One grid holds every row of buttons
+        nav_grid = tk.Frame(self, bg=COLORS["background"])
+        nav_grid.pack(fill="x", pady=(15, 0))
+        
+        secondary = "Secondary.TButton"
+        # Row 0: Undo/Redo
+        self.undo_btn = self._mk_btn(nav_grid, "Undo", secondary, self.undo_change, 0, 0)
+        self.redo_btn = self._mk_btn(nav_grid, "Redo", secondary, self.redo_change, 0, 1)
+        # Row 1: Previous/Next navigation (commands set via set_button_commands)
+        self.prev_btn = self._mk_btn(nav_grid, "◄ Previous", secondary, None, 1, 0)
+        self.next_btn = self._mk_btn(nav_grid, "Next ►", secondary, None, 1, 1)
+        # Row 2: Up/Down movement
+        self.up_btn = self._mk_btn(nav_grid, "▲ Move Up", secondary, None, 2, 0)
+        self.down_btn = self._mk_btn(nav_grid, "▼ Move Down", secondary, None, 2, 1)
+        # Row 3: Save actions
+        self.save_btn = self._mk_btn(nav_grid, "Save", "Primary.TButton", self.save_current, 3, 0)
+        self.save_exit_btn = self._mk_btn(
+            nav_grid, "Save & Exit", "Accent.TButton", self.save_and_exit, 3, 1
         )
-        self.redo_btn.pack(side="left", padx=2)
+        # Row 4: Exit
+        self.exit_btn = self._mk_btn(nav_grid, "Exit", "Accent.TButton", self.on_exit, 4, 0)
 
-        # Row 2: Previous/Next navigation
-        nav_frame = tk.Frame(nav_container, bg=COLORS["background"])
-        nav_frame.pack(fill="x", pady=(0, 5))
-        
-        self.prev_btn = ttk.Button(
-            nav_frame,
-            text="◄ Previous",
-            style="Secondary.TButton",
-            width=12
-        )
-        self.prev_btn.pack(side="left", padx=2)
-        
-        self.next_btn = ttk.Button(
-            nav_frame,
-            text="Next ►",
-            style="Secondary.TButton",
-            width=12
-        )
-        self.next_btn.pack(side="left", padx=2)
-
-        # Row 3: Up/Down movement
-        move_frame = tk.Frame(nav_container, bg=COLORS["background"])
-        move_frame.pack(fill="x", pady=(0, 5))
-        
-        self.up_btn = ttk.Button(
-            move_frame,
-            text="▲ Move Up",
-            style="Secondary.TButton",
-            width=12
-        )
-        self.up_btn.pack(side="left", padx=2)
-        
-        self.down_btn = ttk.Button(
-            move_frame,
-            text="▼ Move Down",
-            style="Secondary.TButton",
-            width=12
-        )
-        self.down_btn.pack(side="left", padx=2)
-
-        # Row 4: Save actions
-        save_frame = tk.Frame(nav_container, bg=COLORS["background"])
-        save_frame.pack(fill="x", pady=(0, 5))
-        
-        self.save_btn = ttk.Button(
-            save_frame,
-            text="Save",
-            style="Primary.TButton",
-            width=12,
-            command=self.save_current
-        )
-        self.save_btn.pack(side="left", padx=2)
-        
-        self.save_exit_btn = ttk.Button(
-            save_frame,
-            text="Save & Exit",
-            style="Accent.TButton",
-            width=12,
-            command=self.save_and_exit
-        )
-        self.save_exit_btn.pack(side="left", padx=2)
-
-        # Row 5: Exit button
-        exit_frame = tk.Frame(nav_container, bg=COLORS["background"])
-        exit_frame.pack(fill="x", pady=(0, 5))
-        
-        self.exit_btn = ttk.Button(
-            exit_frame,
-            text="Exit",
-            style="Accent.TButton",
-            width=12,
-            command=self.on_exit
-        )
-        self.exit_btn.pack(side="left", padx=2)
+    def _mk_btn(
+        self,
+        parent: tk.Widget,
+        text: str,
+        style: str,
+        cmd: Optional[Callable],
+        row: int,
+        column: int
+    ) -> ttk.Button:
+        """Create a fixed-width action button and place it in the nav grid."""
+        btn = ttk.Button(parent, text=text, style=style, width=12, command=cmd)
+        btn.grid(row=row, column=column, padx=2, pady=(0, 5), sticky="w")
+        return btn
 
     def set_button_commands(
         self,
@@ -427,8 +448,34 @@ class RightPanel(tk.Frame):
         self.down_btn.config(command=down_command)
         self.exit_btn.config(command=exit_command)
 
-    def create_export_section(self) -> None:
+    def _install_export_stub(self) -> None:
+        """Create the collapsed export toggle; the controls are built on demand."""
+        self._export_built = False
+        self._export_visible = False
+        self.export_toggle_btn = ttk.Button(
+            self,
+            text="Export ▸",
+            style="Secondary.TButton",
+            command=self._toggle_export_section
+        )
+        self.export_toggle_btn.pack(fill="x", pady=(10, 0))
+
+    def _toggle_export_section(self) -> None:
+        """Expand or collapse the export controls, building them the first time."""
+        if not self._export_built:
+            self._build_export_section()
+            self._export_built = True
+        self._export_visible = not self._export_visible
+        if self._export_visible:
+            self.export_frame.pack(fill="x")
+            self.export_toggle_btn.config(text="Export ▾")
+        else:
+            self.export_frame.pack_forget()
+            self.export_toggle_btn.config(text="Export ▸")
+
+    def _build_export_section(self) -> None:
         """Create export controls with proper config handling."""
+        self.export_frame = ttk.Frame(self)
         ttk.Label(
             self.export_frame,
             text="Export Settings:",
@@ -506,18 +553,21 @@ class RightPanel(tk.Frame):
 
     def setup_bindings(self) -> None:
         """Set up keyboard and mouse bindings."""
-        # Undo/Redo shortcuts
-        self.bind_all("<Control-z>", lambda e: self.undo_change())
-        self.bind_all("<Control-y>", lambda e: self.redo_change())
-        self.bind_all("<Control-s>", lambda e: self.save_current())
+        # Undo/Redo shortcuts, scoped to this panel's window: every widget
+        # in it carries the toplevel in its bindtags
+        top = self.winfo_toplevel()
+        top.bind("<Control-z>", lambda e: self.undo_change())
+        top.bind("<Control-y>", lambda e: self.redo_change())
+        top.bind("<Control-s>", lambda e: self.save_current())
 
     def load_tag_suggestions(self) -> None:
         """Load tag suggestions from configuration."""
         self.tag_suggestions = self.config.get("tag_suggestions", [])
+        self._tag_set = frozenset(self.tag_suggestions)
         if hasattr(self, 'keywords_entry'):  # Safety check
             self.keywords_entry["values"] = self.tag_suggestions
         else:
-            print("Warning: keywords_entry not available when loading suggestions")
+            logger.warning("keywords_entry not available when loading suggestions")
 
     def load_image_data(self, data: Dict) -> None:
         """
@@ -539,22 +589,15 @@ class RightPanel(tk.Frame):
             'featured': data.get('featured', False)
         }
         
-        # Clear previous entries
-        self.filename_entry.delete(0, tk.END)
-        self.title_entry.delete(0, tk.END)
-        self.caption_entry.delete("1.0", tk.END)
-        self.keywords_entry.delete(0, tk.END)
-        self.alt_text_entry.delete("1.0", tk.END)
-        self.headline_entry.delete(0, tk.END)
+        # Replace every text field in one pass (empty data clears them);
+        # layout and redraw are deferred by Tk until the next idle tick
+        appliers = self._appliers
+        for field in self._COMPARE_FIELDS:
+            if field != 'featured':
+                appliers[field](self.original_state[field])
         
         # Populate form fields
         if data:
-            self.filename_entry.insert(0, self.original_state['filename'])
-            self.title_entry.insert(0, self.original_state['title'])
-            self.caption_entry.insert("1.0", self.original_state['caption'])
-            self.keywords_entry.insert(0, ", ".join(self.original_state['keywords']))
-            self.alt_text_entry.insert("1.0", self.original_state['alt_text'])
-            self.headline_entry.insert(0, self.original_state['headline'])
             self.featured_var.set(self.original_state['featured'])
             
             # Visual feedback for featured state
@@ -566,10 +609,15 @@ class RightPanel(tk.Frame):
             # Update modified date if available
             if "modified_date" in data:
                 mod_date = datetime.fromisoformat(data["modified_date"]).strftime("%Y-%m-%d %H:%M")
-                self.status_cb(f"Last modified: {mod_date}")
+                self._post_status(f"Last modified: {mod_date}")
 
         # Clear history for new image
-        self.history = HistoryManager()
+        self._set_keywords_baseline()
+        self._reset_text_modified(self.caption_entry)
+        self._reset_text_modified(self.alt_text_entry)
+        self._cancel_pending_commits()
+        self._dirty = False
+        self.history.clear()
         self.update_undo_redo_buttons()
 
     def get_image_data(self) -> Dict:
@@ -586,7 +634,7 @@ class RightPanel(tk.Frame):
             "filename": self.filename_entry.get().strip(),
             "title": self.title_entry.get().strip(),
             "caption": self.caption_entry.get("1.0", "end-1c").strip(),
-            "keywords": [k.strip() for k in self.keywords_entry.get().split(",") if k.strip()],
+            "keywords": list(self._parse_keywords()),
             "alt_text": self.alt_text_entry.get("1.0", "end-1c").strip(),
             "headline": self.headline_entry.get().strip(),
             "featured": self.featured_var.get(),
@@ -600,9 +648,30 @@ class RightPanel(tk.Frame):
             
         new_data = self.get_image_data()
         self.current_data.update(new_data)
-        self.status_cb("Changes saved successfully")
+        self._post_status("Changes saved successfully")
         self.original_state = new_data.copy()
-        self.history = HistoryManager()  # Clear history after save
+        self._set_keywords_baseline()
+        self._cancel_pending_commits()
+        self._dirty = False
+        self.history.clear()  # Clear history after save
+        self.update_undo_redo_buttons()
+
+    def _post_status(self, message: str) -> None:
+        """
+        Queue a status message for the next idle tick.
+        
+        Undo/redo bursts post many messages; only the latest is delivered,
+        and the status sink never runs inside the key handler itself.
+        """
+        if self._status_msg is None:
+            self.after_idle(self._flush_status)
+        self._status_msg = message
+
+    def _flush_status(self) -> None:
+        """Deliver the most recent queued status message."""
+        message, self._status_msg = self._status_msg, None
+        if message is not None:
+            self._real_status_cb(message)
 
     def save_and_exit(self) -> None:
         """Save current changes and exit."""
@@ -610,69 +679,123 @@ class RightPanel(tk.Frame):
         self.on_exit()
 
     # Event handlers
+    def _schedule_commit(self, field: str) -> None:
+        """Restart the field's debounce timer; the edit is recorded when typing pauses."""
+        aid = self._pending_after.pop(field, None)
+        if aid:
+            self.after_cancel(aid)
+        self._pending_after[field] = self.after(self.COMMIT_DELAY_MS, self._commit_change, field)
+
+    def _on_text_modified(self, event) -> None:
+        """Schedule a commit when a Text widget's content actually changes."""
+        widget = event.widget
+        if not widget.edit_modified():
+            return  # clearing the flag below raises <<Modified>> as well
+        widget.edit_modified(False)
+        self._schedule_commit(self._text_widget_to_field[widget])
+
+    def _reset_text_modified(self, widget: tk.Text) -> None:
+        """Forget a programmatic Text write so it is not recorded as an edit."""
+        widget.edit_modified(False)
+        aid = self._pending_after.pop(self._text_widget_to_field[widget], None)
+        if aid:
+            self.after_cancel(aid)
+
+    def _cancel_pending_commits(self) -> None:
+        """Drop any edits still waiting on their debounce timer."""
+        for aid in self._pending_after.values():
+            self.after_cancel(aid)
+        self._pending_after.clear()
+
+    def _read_field(self, field: str) -> Any:
+        """Read the current form value for a text field."""
+        if field == 'keywords':
+            return self._parse_keywords()
+        widget = getattr(self, f"{field}_entry")
+        if isinstance(widget, tk.Text):
+            return widget.get("1.0", "end-1c").strip()
+        return widget.get().strip()
+
+    def _parse_keywords(self) -> List[str]:
+        """
+        Parse the keywords entry into a tag list, reusing the last result
+        while the raw text is unchanged. The returned list is shared and
+        must not be mutated.
+        """
+        raw = self.keywords_entry.get()
+        if raw == self._kw_cache[0]:
+            return self._kw_cache[1]
+        parts = [p for p in _KEYWORD_SPLIT.split(raw.strip()) if p]
+        self._kw_cache = (raw, parts)
+        return parts
+
+    def _set_keywords_baseline(self) -> None:
+        """Snapshot the saved keywords for cheap comparison in _commit_change."""
+        self._original_keywords_key = tuple(self.original_state.get('keywords', []))
+        self._kw_committed_raw = self.keywords_entry.get()
+
+    def _commit_change(self, field: str) -> None:
+        """Record a field edit in history once its debounce timer fires."""
+        self._pending_after.pop(field, None)
+        if not self.current_data:
+            return
+        if field == 'keywords':
+            # Skip when the text is unchanged since the last commit, else
+            # compare as one tuple (order matters: reordering is an edit)
+            raw = self.keywords_entry.get()
+            if raw == self._kw_committed_raw:
+                return
+            self._kw_committed_raw = raw
+            new_val = self._parse_keywords()
+            changed = tuple(new_val) != self._original_keywords_key
+        else:
+            new_val = self._read_field(field)
+            changed = new_val != self.original_state.get(field, '')
+        if changed:
+            self.history.record_change(field, self.original_state.get(field), new_val)
+            self._dirty = True
+            self.update_undo_redo_buttons()
+
     def on_filename_change(self, event=None) -> None:
         """Handle filename changes."""
-        if self.current_data:
-            old_val = self.original_state.get('filename', '')
-            new_val = self.filename_entry.get().strip()
-            if old_val != new_val:
-                self.history.record_change('filename', old_val, new_val)
-                self.update_undo_redo_buttons()
+        self._schedule_commit('filename')
 
     def on_title_change(self, event=None) -> None:
         """Handle title changes."""
-        if self.current_data:
-            old_val = self.original_state.get('title', '')
-            new_val = self.title_entry.get().strip()
-            if old_val != new_val:
-                self.history.record_change('title', old_val, new_val)
-                self.update_undo_redo_buttons()
+        self._schedule_commit('title')
 
     def on_caption_change(self, event=None) -> None:
         """Handle caption changes."""
-        if self.current_data:
-            old_val = self.original_state.get('caption', '')
-            new_val = self.caption_entry.get("1.0", "end-1c").strip()
-            if old_val != new_val:
-                self.history.record_change('caption', old_val, new_val)
-                self.update_undo_redo_buttons()
+        self._schedule_commit('caption')
 
     def on_tags_change(self, event=None) -> None:
         """Handle tag changes."""
-        if self.current_data:
-            old_val = self.original_state.get('keywords', [])
-            new_val = [k.strip() for k in self.keywords_entry.get().split(",") if k.strip()]
-            if old_val != new_val:
-                self.history.record_change('keywords', old_val, new_val)
-                self.update_undo_redo_buttons()
+        self._schedule_commit('keywords')
+
+    def _snapshot_tags(self) -> None:
+        """Remember the typed tags before the dropdown replaces the entry text."""
+        self._tags_before_select = self._parse_keywords()
 
     def on_tag_selected(self, event=None) -> None:
         """Handle tag selection from dropdown."""
-        current_tags = [k.strip() for k in self.keywords_entry.get().split(",") if k.strip()]
+        # The entry now holds only the selected suggestion
+        current_tags = self._tags_before_select
         selected = self.keywords_entry.get()
         
-        if selected and selected not in current_tags:
+        if selected in self._tag_set and selected not in set(current_tags):
             new_tags = current_tags + [selected]
-            self.keywords_entry.set(", ".join(new_tags))
-            self.on_tags_change()
+        else:
+            new_tags = current_tags
+        self.keywords_entry.set(", ".join(new_tags))
+        self.on_tags_change()
 
     def on_alt_text_change(self, event=None) -> None:
         """Handle alt text changes."""
-        if self.current_data:
-            old_val = self.original_state.get('alt_text', '')
-            new_val = self.alt_text_entry.get("1.0", "end-1c").strip()
-            if old_val != new_val:
-                self.history.record_change('alt_text', old_val, new_val)
-                self.update_undo_redo_buttons()
+        self._schedule_commit('alt_text')
 
     def on_headline_change(self, event=None) -> None:
         """Handle headline changes."""
-        if self.current_data:
-            old_val = self.original_state.get('headline', '')
-            new_val = self.headline_entry.get().strip()
-            if old_val != new_val:
-                self.history.record_change('headline', old_val, new_val)
-                self.update_undo_redo_buttons()
+        self._schedule_commit('headline')
 
     def on_featured_change(self) -> None:
         """Handle featured checkbox changes."""
@@ -681,6 +804,7 @@ class RightPanel(tk.Frame):
             new_val = self.featured_var.get()
             if old_val != new_val:
                 self.history.record_change('featured', old_val, new_val)
+                self._dirty = True
                 self.update_undo_redo_buttons()
                 # Update visual feedback
                 if new_val:
@@ -696,70 +820,87 @@ class RightPanel(tk.Frame):
         self.master.quit()
 
     def has_unsaved_changes(self) -> bool:
-        """Check if there are unsaved changes."""
-        if not self.current_data:
+        """
+        Check if there are unsaved changes.
+        
+        The dirty flag (or a still-debouncing edit) is the cheap gate; the
+        form is only read when it is set, so edits undone back to the
+        loaded values do not count as unsaved.
+        """
+        if not self.current_data or not (self._dirty or self._pending_after):
             return False
-        current_state = self.get_image_data()
-        return any(
-            current_state[key] != self.original_state.get(key, '')
-            for key in current_state
-        )
+        current = self.get_image_data()
+        original = self.original_state
+        return any(current[f] != original[f] for f in self._COMPARE_FIELDS)
 
     # Undo/Redo functionality
     def undo_change(self, event=None) -> None:
         """Undo the last change with thread safety."""
-        change = self.history.get_undo_change()
+        change = self.history.pop_to_redo()
         if change:
-            with self.history._lock:
-                self.history.redo_stack.append(change)
             self.apply_change(change['field'], change['old_value'])
-            self.status_cb(f"Undo: {change['field']}")
+            self._post_status(f"Undo: {change['field']}")
             self.update_undo_redo_buttons()
 
     def redo_change(self, event=None) -> None:
         """Redo the last undone change with thread safety."""
-        change = self.history.get_redo_change()
+        change = self.history.pop_to_undo()
         if change:
-            with self.history._lock:
-                self.history.undo_stack.append(change)
             self.apply_change(change['field'], change['new_value'])
-            self.status_cb(f"Redo: {change['field']}")
+            self._post_status(f"Redo: {change['field']}")
             self.update_undo_redo_buttons()
 
-    def apply_change(self, field: str, value: Any) -> None:
-        """Apply a change to the appropriate field."""
-        if field == 'filename':
-            self.filename_entry.delete(0, tk.END)
-            self.filename_entry.insert(0, value)
-        elif field == 'title':
-            self.title_entry.delete(0, tk.END)
-            self.title_entry.insert(0, value)
-        elif field == 'caption':
-            self.caption_entry.delete("1.0", tk.END)
-            self.caption_entry.insert("1.0", value)
-        elif field == 'keywords':
-            self.keywords_entry.delete(0, tk.END)
-            self.keywords_entry.insert(0, ", ".join(value))
-        elif field == 'alt_text':
-            self.alt_text_entry.delete("1.0", tk.END)
-            self.alt_text_entry.insert("1.0", value)
-        elif field == 'headline':
-            self.headline_entry.delete(0, tk.END)
-            self.headline_entry.insert(0, value)
-        elif field == 'featured':
+    def _build_appliers(self) -> None:
+        """Map each field name to a setter that writes a value into its widget."""
+        def entry_setter(widget: tk.Entry) -> Callable[[Any], None]:
+            def apply(value: Any) -> None:
+                widget.delete(0, tk.END)
+                widget.insert(0, value)
+            return apply
+
+        def text_setter(widget: tk.Text) -> Callable[[Any], None]:
+            def apply(value: Any) -> None:
+                widget.delete("1.0", tk.END)
+                widget.insert("1.0", value)
+                self._reset_text_modified(widget)
+            return apply
+
+        set_keywords = entry_setter(self.keywords_entry)
+
+        def set_featured(value: Any) -> None:
             self.featured_var.set(value)
             self.on_featured_change()  # Update visual state
 
+        self._appliers: Dict[str, Callable[[Any], None]] = {
+            'filename': entry_setter(self.filename_entry),
+            'title': entry_setter(self.title_entry),
+            'caption': text_setter(self.caption_entry),
+            'keywords': lambda value: set_keywords(", ".join(value)),
+            'alt_text': text_setter(self.alt_text_entry),
+            'headline': entry_setter(self.headline_entry),
+            'featured': set_featured,
+        }
+
+    def apply_change(self, field: str, value: Any) -> None:
+        """Apply a change to the appropriate field."""
+        applier = self._appliers.get(field)
+        if applier:
+            applier(value)
+
     def update_undo_redo_buttons(self) -> None:
-        """Update undo/redo button states based on history."""
-        self.undo_btn["state"] = "normal" if self.history.undo_stack else "disabled"
-        self.redo_btn["state"] = "normal" if self.history.redo_stack else "disabled"
+        """Update undo/redo button states, skipping Tk calls when unchanged."""
+        state = (self.history.has_undo, self.history.has_redo)
+        if state == self._last_undo_state:
+            return
+        self._last_undo_state = state
+        self.undo_btn["state"] = "normal" if state[0] else "disabled"
+        self.redo_btn["state"] = "normal" if state[1] else "disabled"
 
     # Export functionality
     def on_export(self) -> None:
         """Handle export button click."""
         if not self.current_data:
-            self.status_cb("No image selected for export")
+            self._post_status("No image selected for export")
             return
             
         export_settings = {
@@ -772,5 +913,5 @@ class RightPanel(tk.Frame):
         
         # Update config
         self.config["export_settings"] = export_settings
-        self.status_cb(f"Exporting with settings: {export_settings}")
+        self._post_status(f"Exporting with settings: {export_settings}")
         # Actual export implementation would go here
\ No newline at end of file
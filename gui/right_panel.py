@@ -6,49 +6,60 @@ Complete implementation with improved layout and collapsible export section.
 
 import tkinter as tk
 import threading
+from contextlib import nullcontext
+from collections import deque
+from functools import partial
+from itertools import islice
 from tkinter import ttk, messagebox
-from typing import Dict, Callable, Optional, List, Any
+from typing import Deque, Dict, Callable, Iterator, Optional, List, Any
 from datetime import datetime
 from gui.styles import COLORS, FONTS
-
-def _create_rounded_rect(self, x1, y1, x2, y2, radius=25, **kwargs):
-    points = []
-    # Top left
-    points.extend([x1+radius, y1, x2-radius, y1])
-    # Top right
-    points.extend([x2, y1, x2, y1+radius])
-    points.extend([x2, y1+radius, x2, y2-radius])
-    # Bottom right
-    points.extend([x2-radius, y2, x1+radius, y2])
-    # Bottom left
-    points.extend([x1, y2-radius, x1, y1+radius])
-    points.extend([x1, y1+radius, x1+radius, y1])
-    return self.create_polygon(points, **kwargs, smooth=True)
-
-# Add the method to Canvas class
-tk.Canvas.create_rounded_rect = _create_rounded_rect
+from utils.thread_utils import run_in_thread
+from utils.diff import compute_delta, apply_delta
 
 class HistoryManager:
-    """Track changes for undo/redo functionality with thread safety."""
-    def __init__(self, max_steps: int = 50):
-        self.undo_stack: List[Dict] = []
-        self.redo_stack: List[Dict] = []
+    """Track changes for undo/redo functionality.
+
+    History is driven from the Tk thread, so locking is off by default;
+    pass thread_safe=True for a history shared with worker threads.
+    """
+    def __init__(self, max_steps: int = 50, thread_safe: bool = False):
+        # maxlen makes append evict the oldest entry in O(1)
+        self.undo_stack: Deque[Dict] = deque(maxlen=max_steps)
+        self.redo_stack: Deque[Dict] = deque(maxlen=max_steps)
         self.max_steps = max_steps
-        self._lock = threading.Lock()
+        # nullcontext keeps the `with self._lock:` call sites unchanged
+        self._lock = threading.Lock() if thread_safe else nullcontext()
 
     def record_change(self, field: str, old_value: Any, new_value: Any) -> None:
-        """Record a change to the history with thread safety."""
+        """Record a change to the history with thread safety.
+
+        Text and keyword lists keep old_value (shared with the form's
+        original state) plus a single-span delta instead of a second copy.
+        """
         with self._lock:
-            self.undo_stack.append({
-                'field': field,
-                'old_value': old_value,
-                'new_value': new_value,
-                'timestamp': datetime.now()
-            })
-            if len(self.undo_stack) > self.max_steps:
-                self.undo_stack.pop(0)
+            # Re-setting the value already on top (checkbox spam, non-edit
+            # keys) would only spend a history slot - but only when there is
+            # no redo branch for a real edit to discard
+            top = self.undo_stack[-1] if self.undo_stack else None
+            if (not self.redo_stack and top is not None and top['field'] == field
+                    and self.new_value(top) == new_value):
+                return
+            change = {'field': field, 'old_value': old_value}
+            if isinstance(old_value, (str, list)) and type(new_value) is type(old_value):
+                change['delta'] = compute_delta(old_value, new_value)
+            else:
+                change['new_value'] = new_value
+            self.undo_stack.append(change)
             self.redo_stack.clear()
 
+    @staticmethod
+    def new_value(change: Dict) -> Any:
+        """Return the value a recorded change set the field to."""
+        if 'delta' in change:
+            return apply_delta(change['old_value'], change['delta'])
+        return change['new_value']
+
     def get_undo_change(self) -> Optional[Dict]:
         """Get the next undo change if available with thread safety."""
         with self._lock:
@@ -59,6 +70,42 @@ class HistoryManager:
         with self._lock:
             return self.redo_stack.pop() if self.redo_stack else None
 
+class TagTrie:
+    """Prefix trie over tag suggestions, matched case-insensitively."""
+    _END = ""  # terminal key holding the tag as first seen; never a character
+
+    def __init__(self, tags=()):
+        self._root: Dict[str, Any] = {}
+        for tag in tags:
+            self.insert(tag)
+
+    def insert(self, tag: str) -> None:
+        """Add a tag; later case variants of the same tag are ignored."""
+        node = self._root
+        for ch in tag.lower():
+            node = node.setdefault(ch, {})
+        node.setdefault(self._END, tag)
+
+    def iter_complete(self, prefix: str) -> Iterator[str]:
+        """Yield tags starting with prefix lazily, shortest first (breadth-first)."""
+        node = self._root
+        for ch in prefix.lower():
+            node = node.get(ch)
+            if node is None:
+                return
+        queue = deque([node])
+        while queue:
+            node = queue.popleft()
+            for key, child in node.items():
+                if key == self._END:
+                    yield child
+                else:
+                    queue.append(child)
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Return tags starting with prefix, shortest first (breadth-first)."""
+        return list(islice(self.iter_complete(prefix), limit))
+
 class RightPanel(tk.Frame):
     """Enhanced right panel with improved layout and collapsible export section."""
     DEFAULT_EXPORT_SETTINGS = {
@@ -68,6 +115,12 @@ class RightPanel(tk.Frame):
         "max_width": 1200,
         "max_height": 1200
     }
+    # First insert/delete index per form widget type (Entry/Combobox use 0)
+    _START_INDEX = {tk.Text: "1.0"}
+    # Quiet period before a Text edit burst is recorded in history
+    TEXT_COMMIT_DELAY_MS = 250
+    # Dropdown entries per refresh; keeps Tcl list/render cost bounded
+    MAX_TAG_SUGGESTIONS = 50
 
     def __init__(self, parent, status_callback, config, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
@@ -81,12 +134,30 @@ class RightPanel(tk.Frame):
         self.grid_propagate(False)  # Prevent auto-resizing
         self.columnconfigure(0, weight=1)  # Make column expandable
         
-        self.pack_propagate(False)
         self.status_cb = status_callback
         self.config = config
         self.current_data = None
         self.history = HistoryManager()
         self.tag_suggestions = []
+        self.tag_trie = TagTrie()
+        self._trie_generation = 0  # ignores trie builds superseded by a reload
+        self._tags_before_token: List[str] = []  # committed tags ahead of the typed token
+        self._active_token = ""  # text after the last comma
+        self._used_tags_lower: set = set()  # lowercased _tags_before_token
+        self._keywords_raw: Optional[str] = None  # entry text the fields above reflect
+        self._tag_refresh_job: Optional[str] = None  # pending after() id for on_tags_change
+        self._dirty = False  # set by recorded edits, cleared on load/save
+        self._last_suggestion_tuple: tuple = ()  # values last pushed to the combobox
+        self._updating_tags = False  # reentrancy guard for update_tag_suggestions
+        self._pending_text_fields: set = set()  # Text fields edited since last history record
+        self._pending_after: Dict[str, str] = {}  # key -> after() id for trailing commits
+        # apply_change dispatch: field -> setter (used by undo/redo)
+        self._apply_handlers: Dict[str, Callable[[Any], None]] = {
+            field: partial(self._set_field, field)
+            for field in ('filename', 'title', 'caption', 'alt_text', 'headline')
+        }
+        self._apply_handlers['keywords'] = self._set_keywords
+        self._apply_handlers['featured'] = self._set_featured
         
         # Initialize export settings
         self.export_settings = {
@@ -94,13 +165,10 @@ class RightPanel(tk.Frame):
             **self.config.get("export_settings", {})
         }
         
-        # Main layout structure
-        self.grid_rowconfigure(0, weight=0)  # Header
-        self.grid_rowconfigure(1, weight=1)  # Edit form
-        self.grid_rowconfigure(2, weight=0)  # Action buttons
-        self.grid_rowconfigure(3, weight=0)  # Export section
-        self.grid_rowconfigure(4, weight=0)  # (reserved)
-        self.grid_rowconfigure(5, weight=0)  # Exit section
+        # Main layout structure: header, edit form (stretches), action
+        # buttons, export section, (reserved), exit section
+        for row, weight in enumerate((0, 1, 0, 0, 0, 0)):
+            self.grid_rowconfigure(row, weight=weight)
             #self.grid_columnconfigure(0, weight=1)
         
         #self.grid_rowconfigure(6, weight=0)  # Exit button
@@ -139,14 +207,15 @@ class RightPanel(tk.Frame):
 
     def _create_edit_form(self):
         """Create the main edit form with scrollbar."""
+        bg = COLORS["background"]
         # Container frame
-        form_container = tk.Frame(self, bg=COLORS["background"])
+        form_container = tk.Frame(self, bg=bg)
         form_container.grid(row=1, column=0, sticky="nsew", padx=(0, 10))
         
         # Canvas and scrollbar
         self.form_canvas = tk.Canvas(
             form_container,
-            bg=COLORS["background"],
+            bg=bg,
             highlightthickness=0
         )
         scrollbar = ttk.Scrollbar(
@@ -156,7 +225,7 @@ class RightPanel(tk.Frame):
         )
         
         # Form frame inside canvas
-        self.form_frame = tk.Frame(self.form_canvas, bg=COLORS["background"])
+        self.form_frame = tk.Frame(self.form_canvas, bg=bg)
         self.form_frame.bind(
             "<Configure>",
             lambda e: self.form_canvas.configure(scrollregion=self.form_canvas.bbox("all"))
@@ -185,8 +254,11 @@ class RightPanel(tk.Frame):
 
     def _create_form_fields(self):
         """Create all form fields with improved spacing."""
+        form = self.form_frame
+        bg, dark, primary = COLORS["background"], COLORS["dark"], COLORS["primary"]
+        body_font = FONTS["body"]
         # Configure form frame columns
-        self.form_frame.columnconfigure(1, weight=1)
+        form.columnconfigure(1, weight=1)
         
         # List of fields to create (label, var_name, row, type)
         fields = [
@@ -200,18 +272,19 @@ class RightPanel(tk.Frame):
         ]
         
         # Create fields
+        self.entries: Dict[str, tk.Widget] = {}
         for label, var_name, row, field_type in fields:
             if field_type == "checkbox":
                 # Special handling for featured checkbox
                 self.featured_var = tk.BooleanVar()
                 self.featured_cb = tk.Checkbutton(
-                    self.form_frame,
+                    form,
                     text="★ Featured Image",
                     variable=self.featured_var,
                     font=("Georgia", 12, "bold"),
-                    bg=COLORS["background"],
-                    fg=COLORS["dark"],
-                    selectcolor=COLORS["primary"],
+                    bg=bg,
+                    fg=dark,
+                    selectcolor=primary,
                     command=self.on_featured_change,
                     padx=5,
                     pady=10
@@ -219,83 +292,119 @@ class RightPanel(tk.Frame):
                 self.featured_cb.grid(row=row, column=0, columnspan=2, sticky="w", pady=(15, 20))
             else:
                 tk.Label(
-                    self.form_frame,
+                    form,
                     text=label,
-                    font=FONTS["body"],
-                    bg=COLORS["background"],
-                    fg=COLORS["dark"]
+                    font=body_font,
+                    bg=bg,
+                    fg=dark
                 ).grid(row=row, column=0, sticky="nw", pady=(10, 0))
                 
                 if field_type == "entry":
                     entry = tk.Entry(
-                        self.form_frame,
-                        font=FONTS["body"],
+                        form,
+                        font=body_font,
                         width=30
                     )
                     entry.grid(row=row, column=1, sticky="ew", pady=(10, 0), padx=5)
-                    setattr(self, f"{var_name}_entry", entry)
+                    entry.bind("<KeyRelease>", partial(self._on_entry_change, var_name))
+                    self.entries[var_name] = entry
                     
                 elif field_type == "text":
                     text = tk.Text(
-                        self.form_frame,
+                        form,
                         height=3,
                         width=30,
-                        font=FONTS["body"],
+                        font=body_font,
                         wrap=tk.WORD,
                         padx=5,
                         pady=5
                     )
                     text.grid(row=row, column=1, sticky="ew", pady=(10, 0), padx=5)
-                    setattr(self, f"{var_name}_entry", text)
+                    # <<Modified>> only flags the edit; the text is read
+                    # for history once typing pauses, on focus-out, or
+                    # before an undo
+                    text.bind("<<Modified>>", partial(self._on_text_modified, var_name))
+                    text.bind("<FocusOut>", lambda e: self._record_text_changes())
+                    self.entries[var_name] = text
                     
                 elif field_type == "combo":
                     combo = ttk.Combobox(
-                        self.form_frame,
-                        font=FONTS["body"],
+                        form,
+                        font=body_font,
                         values=self.tag_suggestions,
                         postcommand=self.update_tag_suggestions
                     )
                     combo.grid(row=row, column=1, sticky="ew", pady=(10, 0), padx=5)
                     combo.bind('<KeyRelease>', self.on_tags_change)
                     combo.bind('<<ComboboxSelected>>', self.on_tag_selected)
-                    setattr(self, f"{var_name}_entry", combo)
+                    self.entries[var_name] = combo
                     # Initialize with empty values to prevent recursion
                     combo['values'] = []
 
+        # Named aliases used throughout the panel
+        entries = self.entries
+        self.filename_entry = entries["filename"]
+        self.title_entry = entries["title"]
+        self.caption_entry = entries["caption"]
+        self.keywords_entry = entries["keywords"]
+        self.alt_text_entry = entries["alt_text"]
+        self.headline_entry = entries["headline"]
+
     def update_tag_suggestions(self) -> None:
         """Update the tag suggestions based on current input"""
         if not hasattr(self, 'keywords_entry'):
             return
             
-        # Temporarily unbind the postcommand to prevent recursion
-        self.keywords_entry.configure(postcommand=None)
-        
+        # Reentrancy guard: a plain attribute check instead of two
+        # configure(postcommand=...) round-trips per dropdown open
+        if self._updating_tags:
+            return
+        self._updating_tags = True
         try:
-            current_text = self.keywords_entry.get()
-            current_tags = [k.strip() for k in current_text.split(",") if k.strip()]
+            # Complete the token after the last comma; earlier tokens are
+            # kept for on_tag_selected, which fires after the combobox has
+            # replaced the entry text with the chosen value
+            self._refresh_used_tags(self.keywords_entry.get())
+            used = self._used_tags_lower
             
-            # Filter suggestions to exclude already added tags
-            filtered_suggestions = [
-                tag for tag in self.tag_suggestions 
-                if tag.lower() not in [t.lower() for t in current_tags]]
+            # Filter suggestions to exclude already added tags; the trie is
+            # walked lazily, so only enough of it for one page is visited
+            candidates = (
+                tag for tag in self.tag_trie.iter_complete(self._active_token)
+                if tag.lower() not in used)
             
-            self.keywords_entry['values'] = filtered_suggestions
+            # Skip the Tcl write (and dropdown rebuild) when nothing changed
+            new_values = tuple(islice(candidates, self.MAX_TAG_SUGGESTIONS))
+            if new_values != self._last_suggestion_tuple:
+                self.keywords_entry['values'] = new_values
+                self._last_suggestion_tuple = new_values
         finally:
-            # Re-bind the postcommand after updating
-            self.keywords_entry.configure(postcommand=self.update_tag_suggestions)
+            self._updating_tags = False
+
+    def _refresh_used_tags(self, text: str) -> None:
+        """Re-split the keywords text only when it differs from the last call."""
+        if text == self._keywords_raw:
+            return
+        self._keywords_raw = text
+        head, _, token = text.rpartition(",")
+        self._tags_before_token = [k.strip() for k in head.split(",") if k.strip()]
+        self._active_token = token.strip()
+        self._used_tags_lower = {t.lower() for t in self._tags_before_token}
 
     def _create_collapsible_export_section(self):
         """Create export section with rounded corners."""
+        bg, accent = COLORS["background"], COLORS["accent"]
+        body_font = FONTS["body"]
         # Main container
-        self.export_container = tk.Frame(self, bg=COLORS["background"],padx=5)  # Additional padding)
+        self.export_container = tk.Frame(self, bg=bg,padx=5)  # Additional padding)
         self.export_container.grid(row=3, column=0, sticky="ew", pady=(10, 0))
         
         # Toggle button with rounded corners
         self.export_toggle_btn = tk.Button(
             self.export_container,
             text="► Export Settings",
-            font=FONTS["body"],
-            bg=COLORS["accent"],
+            font=body_font,
+            bg=accent,
             fg="white",
             bd=0,
             relief="flat",
@@ -303,57 +412,9 @@ class RightPanel(tk.Frame):
         )
         self.export_toggle_btn.pack(fill="x", padx=5, pady=(0, 5))
         
-        # Export content frame
-        self.export_frame = tk.Frame(
-            self.export_container,
-            bg=COLORS["export_bg"],
-            padx=10,
-            pady=10,
-            highlightthickness=1,
-            highlightbackground=COLORS["export_border"]
-        )
-        
-        # Add controls
-        self._create_export_controls()
-        
-        # Start collapsed
+        # Start collapsed; the content frame and its controls are built by
+        # _toggle_export_section on first expand
         self.export_visible = False
-        self.export_frame.pack_forget()
-
-    def _draw_rounded_rect(self):
-        """Draw rounded rectangle on canvas."""
-        width = self.export_container.winfo_width()
-        self.export_canvas.delete("all")
-        self.export_canvas.create_rounded_rect(
-            0, 0, width, 40,
-            radius=8,
-            fill=COLORS["accent"],
-            outline=COLORS["export_border"]
-        )
-
-    def _on_resize(self, event):
-        """Handle window resize."""
-        self._draw_rounded_rect()
-        if hasattr(self, 'export_toggle_id'):
-            self.export_canvas.itemconfigure(
-                self.export_toggle_id,
-                width=self.winfo_width()-10
-            )
-
-    def create_rounded_rect(self, x1, y1, x2, y2, radius=25, **kwargs):
-        """Create rounded rectangle coordinates."""
-        points = []
-        # Top left
-        points.extend([x1+radius, y1, x2-radius, y1])
-        # Top right
-        points.extend([x2, y1, x2, y1+radius])
-        points.extend([x2, y1+radius, x2, y2-radius])
-        # Bottom right
-        points.extend([x2-radius, y2, x1+radius, y2])
-        # Bottom left
-        points.extend([x1, y2-radius, x1, y1+radius])
-        points.extend([x1, y1+radius, x1+radius, y1])
-        return self.export_canvas.create_polygon(points, **kwargs, smooth=True)
 
     def _create_export_controls(self):
         """Create export controls."""
@@ -523,8 +584,22 @@ class RightPanel(tk.Frame):
         )
         self.exit_btn.pack(fill="x", expand=True)
         
+    def _build_export_frame(self):
+        """Create the export content frame and its controls."""
+        self.export_frame = tk.Frame(
+            self.export_container,
+            bg=COLORS["export_bg"],
+            padx=10,
+            pady=10,
+            highlightthickness=1,
+            highlightbackground=COLORS["export_border"]
+        )
+        self._create_export_controls()
+
     def _toggle_export_section(self):
         """Toggle export section visibility."""
+        if not hasattr(self, 'export_frame'):
+            self._build_export_frame()
         if self.export_visible:
             self.export_frame.pack_forget()
             self.export_toggle_btn.config(text="► Export Settings")
@@ -569,34 +644,54 @@ class RightPanel(tk.Frame):
 
     # [All other existing methods remain exactly the same as in your original script]
     # Including: load_image_data, get_image_data, save_current, save_and_exit,
-    # all event handlers (on_featured_change, on_filename_change, etc.),
+    # all event handlers (on_featured_change, _on_entry_change, etc.),
     # undo/redo functionality, and export functionality
     
     def setup_bindings(self) -> None:
         """Set up keyboard and mouse bindings."""
-        self.bind_all("<Control-z>", lambda e: self.undo_change())
-        self.bind_all("<Control-y>", lambda e: self.redo_change())
-        self.bind_all("<Control-s>", lambda e: self.save_current())
+        # Scoped to the panel's widgets rather than bind_all, so keystrokes
+        # elsewhere in the app don't route through these handlers
+        shortcuts = (
+            ("<Control-z>", lambda e: self.undo_change()),
+            ("<Control-y>", lambda e: self.redo_change()),
+            ("<Control-s>", lambda e: self.save_current()),
+        )
+        for widget in (self, *self.entries.values()):
+            for sequence, handler in shortcuts:
+                widget.bind(sequence, handler)
         self.keywords_entry.bind('<KeyRelease>', self.on_tags_change)
         self.keywords_entry.bind('<<ComboboxSelected>>', self.on_tag_selected)
 
     def load_tag_suggestions(self) -> None:
         """Load tag suggestions from configuration."""
-        self.tag_suggestions = self.config.get("tag_suggestions", [])
+        suggestions = list(self.config.get("tag_suggestions", []))
+        self.tag_suggestions = suggestions
+        
+        # Large tag lists make the trie build noticeable; do it off the Tk thread
+        self._trie_generation += 1
+        generation = self._trie_generation
+        run_in_thread(
+            lambda: TagTrie(suggestions),
+            lambda trie: self._install_trie(generation, trie)
+        )
+
+    def _install_trie(self, generation: int, trie: TagTrie) -> None:
+        """Adopt a trie built in the background (Tk thread) and refresh values."""
+        if generation != self._trie_generation or not self.winfo_exists():
+            return
+        self.tag_trie = trie
         if hasattr(self, 'keywords_entry'):
-            self.keywords_entry['values'] = self.tag_suggestions
             # Initialize with all suggestions
             self.update_tag_suggestions()
 
     def load_image_data(self, data: Dict) -> None:
         """Load image metadata into the form."""
-        self.current_data = data
         # Convert keywords to list if it's not already
         keywords = data.get('keywords', [])
         if isinstance(keywords, str):
             keywords = [k.strip() for k in keywords.split(",") if k.strip()]
 
-        self.original_state = {
+        state = {
             'filename': data.get('filename', data.get('url', '')),
             'title': data.get('title', ''),
             'caption': data.get('caption', ''),
@@ -606,36 +701,39 @@ class RightPanel(tk.Frame):
             'featured': data.get('featured', False)
         }
         
+        # Re-selecting the loaded image with no edits: the widgets already
+        # show this state, so skip the delete/insert round-trips
+        if (self.current_data is not None and not self._dirty
+                and self._tag_refresh_job is None
+                and state == getattr(self, 'original_state', None)):
+            self.current_data = data
+            return
+        
+        self.current_data = data
+        self.original_state = state
+        
         # Clear and populate form fields
-        self.filename_entry.delete(0, tk.END)
-        self.title_entry.delete(0, tk.END)
-        self.caption_entry.delete("1.0", tk.END)
-        self.keywords_entry.delete(0, tk.END)
-        self.alt_text_entry.delete("1.0", tk.END)
-        self.headline_entry.delete(0, tk.END)
+        values = {**self.original_state, 'keywords': ", ".join(keywords)}
+        for name, widget in self.entries.items():
+            start = self._START_INDEX.get(type(widget), 0)
+            widget.delete(start, tk.END)
+            if data:
+                widget.insert(start, values[name])
+            if start == "1.0":
+                widget.edit_modified(False)  # programmatic fill isn't an edit
+        self._pending_text_fields.clear()
+        self._cancel_scheduled()
         
         if data:
-            self.filename_entry.insert(0, self.original_state['filename'])
-            self.title_entry.insert(0, self.original_state['title'])
-            self.caption_entry.insert("1.0", self.original_state['caption'])
-            
-            #self.keywords_entry.insert(0, ", ".join(self.original_state['keywords']))
-            self.keywords_entry.delete(0, tk.END)
-            self.keywords_entry.insert(0, ", ".join(keywords))
-
-            self.alt_text_entry.insert("1.0", self.original_state['alt_text'])
-            self.headline_entry.insert(0, self.original_state['headline'])
             self.featured_var.set(self.original_state['featured'])
-            
-            if self.original_state['featured']:
-                self.featured_cb.config(fg="#FFD700")
-            else:
-                self.featured_cb.config(fg=COLORS["dark"])
+            self._update_featured_visual(self.original_state['featured'])
             
             if "modified_date" in data:
                 mod_date = datetime.fromisoformat(data["modified_date"]).strftime("%Y-%m-%d %H:%M")
                 self.status_cb(f"Last modified: {mod_date}")
 
+        self._cancel_tag_refresh()
+        self._dirty = False
         self.history = HistoryManager()
         self.update_undo_redo_buttons()
 
@@ -644,13 +742,14 @@ class RightPanel(tk.Frame):
         if not self.current_data:
             return {}
 
-        # Get and clean keywords - preserve existing comma-separated parsing
-        keywords_text = self.keywords_entry.get()
-        keywords = [k.strip() for k in keywords_text.split(",") if k.strip()]
+        # Get and clean keywords - reuses the cached split when unchanged
+        self._refresh_used_tags(self.keywords_entry.get())
+        keywords = self._tags_before_token + ([self._active_token] if self._active_token else [])
+        filename = self.filename_entry.get().strip()
         
         # Build data dict with all existing fields plus backwards compatibility
         data = {
-            "filename": self.filename_entry.get().strip(),
+            "filename": filename,
             "title": self.title_entry.get().strip(),
             "caption": self.caption_entry.get("1.0", "end-1c").strip(),
             "keywords": keywords,
@@ -659,14 +758,13 @@ class RightPanel(tk.Frame):
             "featured": self.featured_var.get(),
             "modified_date": datetime.now().isoformat(),
             # Backward compatibility
-            "tags": keywords,  # Mirror keywords to tags
-            "url": self.filename_entry.get().strip()  # Mirror filename to url
+            "tags": keywords,  # Mirror keywords to tags (same list)
+            "url": filename  # Mirror filename to url
         }
         
         # Preserve any existing fields from current_data not in our form
-        for key in self.current_data:
-            if key not in data and key not in ['modified_date']:
-                data[key] = self.current_data[key]
+        skip = data.keys()
+        data.update({k: v for k, v in self.current_data.items() if k not in skip})
                 
         return data
 
@@ -679,6 +777,10 @@ class RightPanel(tk.Frame):
         self.current_data.update(new_data)
         self.status_cb("Changes saved successfully")
         self.original_state = new_data.copy()
+        self._cancel_tag_refresh()
+        self._pending_text_fields.clear()
+        self._cancel_scheduled()
+        self._dirty = False
         self.history = HistoryManager()
 
     def save_and_exit(self) -> None:
@@ -686,57 +788,19 @@ class RightPanel(tk.Frame):
         self.save_current()
         self.on_exit()
 
-    def on_exit(self) -> None:
-        """Handle exit button click."""
-        if self.current_data and self.has_unsaved_changes():
-            if messagebox.askyesno("Unsaved Changes", "Save changes before exiting?"):
-                self.save_current()
-        self.master.quit()
-
-    def has_unsaved_changes(self) -> bool:
-        """Check if there are unsaved changes."""
-        if not self.current_data:
-            return False
-        current_state = self.get_image_data()
-        return any(
-            current_state[key] != self.original_state.get(key, '')
-            for key in current_state
-        )
-
-    def on_featured_change(self) -> None:
-        """Handle featured checkbox changes."""
-        if self.current_data:
-            old_val = self.original_state.get('featured', False)
-            new_val = self.featured_var.get()
-            if old_val != new_val:
-                self.history.record_change('featured', old_val, new_val)
-                self.update_undo_redo_buttons()
-                if new_val:
-                    self.featured_cb.config(fg="#FFD700")
-                else:
-                    self.featured_cb.config(fg=COLORS["dark"])
-
     # [Include all other existing event handlers here]
-    # on_filename_change, on_title_change, on_caption_change, etc.
+    # _on_entry_change, on_caption_change, etc.
     # These remain exactly the same as in your original script
 
     # Event handlers
-    def on_filename_change(self, event=None) -> None:
-        """Handle filename changes."""
-        if self.current_data:
-            old_val = self.original_state.get('filename', '')
-            new_val = self.filename_entry.get().strip()
-            if old_val != new_val:
-                self.history.record_change('filename', old_val, new_val)
-                self.update_undo_redo_buttons()
-
-    def on_title_change(self, event=None) -> None:
-        """Handle title changes."""
+    def _on_entry_change(self, field: str, event=None) -> None:
+        """Handle filename/title/headline changes (bound per field via partial)."""
         if self.current_data:
-            old_val = self.original_state.get('title', '')
-            new_val = self.title_entry.get().strip()
+            old_val = self.original_state.get(field, '')
+            new_val = self.entries[field].get().strip()
             if old_val != new_val:
-                self.history.record_change('title', old_val, new_val)
+                self.history.record_change(field, old_val, new_val)
+                self._dirty = True
                 self.update_undo_redo_buttons()
 
     def on_caption_change(self, event=None) -> None:
@@ -746,17 +810,67 @@ class RightPanel(tk.Frame):
             new_val = self.caption_entry.get("1.0", "end-1c").strip()
             if old_val != new_val:
                 self.history.record_change('caption', old_val, new_val)
+                self._dirty = True
                 self.update_undo_redo_buttons()
 
+    def _on_text_modified(self, field: str, event) -> None:
+        """Flag a caption/alt text edit without reading the widget contents."""
+        widget = event.widget
+        # Clearing the flag below re-fires <<Modified>>; ignore that echo
+        if not widget.edit_modified():
+            return
+        widget.edit_modified(False)
+        if self.current_data:
+            self._pending_text_fields.add(field)
+            self._dirty = True
+            self._schedule(field, self._record_text_changes)
+
+    def _schedule(self, key: str, fn: Callable[[], None]) -> None:
+        """Run fn once input under key has been quiet for TEXT_COMMIT_DELAY_MS."""
+        job = self._pending_after.pop(key, None)
+        if job is not None:
+            self.after_cancel(job)
+        self._pending_after[key] = self.after(
+            self.TEXT_COMMIT_DELAY_MS, partial(self._run_scheduled, key, fn))
+
+    def _run_scheduled(self, key: str, fn: Callable[[], None]) -> None:
+        self._pending_after.pop(key, None)
+        fn()
+
+    def _cancel_scheduled(self) -> None:
+        """Drop every trailing commit still waiting on its timer."""
+        for job in self._pending_after.values():
+            self.after_cancel(job)
+        self._pending_after.clear()
+
+    def _record_text_changes(self) -> None:
+        """Snapshot flagged Text fields into history (one read per field)."""
+        self._cancel_scheduled()
+        while self._pending_text_fields:
+            getattr(self, f"on_{self._pending_text_fields.pop()}_change")()
+
     def on_tags_change(self, event=None) -> None:
-        """Handle manual editing of keywords field"""
+        """Handle manual editing of keywords field (debounced per typing burst)"""
+        self._cancel_tag_refresh()
+        self._tag_refresh_job = self.after(80, self._do_tag_refresh)
+
+    def _cancel_tag_refresh(self) -> None:
+        """Drop a keyword refresh still waiting on its timer."""
+        if self._tag_refresh_job is not None:
+            self.after_cancel(self._tag_refresh_job)
+            self._tag_refresh_job = None
+
+    def _do_tag_refresh(self) -> None:
+        """Record the keyword edit and refilter suggestions once typing pauses."""
+        self._tag_refresh_job = None
         if self.current_data:
             old_val = self.original_state.get('keywords', [])
-            current_text = self.keywords_entry.get()
-            new_val = [k.strip() for k in current_text.split(",") if k.strip()]
+            self._refresh_used_tags(self.keywords_entry.get())
+            new_val = self._tags_before_token + ([self._active_token] if self._active_token else [])
             
             if old_val != new_val:
                 self.history.record_change('keywords', old_val, new_val)
+                self._dirty = True
                 self.update_undo_redo_buttons()
             self.update_tag_suggestions()  # Update suggestions after change
 
@@ -765,15 +879,17 @@ class RightPanel(tk.Frame):
         if not self.current_data:
             return
             
-        # Get current text and selected value
-        current_text = self.keywords_entry.get()
-        selected = event.widget.get()
+        self._cancel_tag_refresh()  # this handler records the edit itself
         
-        # Clean existing tags
-        current_tags = [k.strip() for k in current_text.split(",") if k.strip()]
+        # The entry now holds only the selected value; rebuild from the
+        # tags captured before the dropdown opened (the partial token the
+        # user was typing is replaced by the selection)
+        selected = event.widget.get()
+        current_tags = list(self._tags_before_token)
         
-        # Add new tag if not already present (case insensitive)
-        if selected and selected.lower() not in [t.lower() for t in current_tags]:
+        # Add new tag if not already present (case insensitive); the
+        # lowercased set was built alongside _tags_before_token
+        if selected and selected.lower() not in self._used_tags_lower:
             current_tags.append(selected)
             new_text = ", ".join(current_tags)
             self.keywords_entry.delete(0, tk.END)
@@ -782,7 +898,12 @@ class RightPanel(tk.Frame):
             # Record change
             old_val = self.original_state.get('keywords', [])
             self.history.record_change('keywords', old_val, current_tags)
+            self._dirty = True
             self.update_undo_redo_buttons()
+        else:
+            # Already tagged: put back the text the selection replaced
+            self.keywords_entry.delete(0, tk.END)
+            self.keywords_entry.insert(0, ", ".join(current_tags))
 
     def on_alt_text_change(self, event=None) -> None:
         """Handle alt text changes."""
@@ -791,15 +912,7 @@ class RightPanel(tk.Frame):
             new_val = self.alt_text_entry.get("1.0", "end-1c").strip()
             if old_val != new_val:
                 self.history.record_change('alt_text', old_val, new_val)
-                self.update_undo_redo_buttons()
-
-    def on_headline_change(self, event=None) -> None:
-        """Handle headline changes."""
-        if self.current_data:
-            old_val = self.original_state.get('headline', '')
-            new_val = self.headline_entry.get().strip()
-            if old_val != new_val:
-                self.history.record_change('headline', old_val, new_val)
+                self._dirty = True
                 self.update_undo_redo_buttons()
 
     def on_featured_change(self) -> None:
@@ -809,12 +922,13 @@ class RightPanel(tk.Frame):
             new_val = self.featured_var.get()
             if old_val != new_val:
                 self.history.record_change('featured', old_val, new_val)
+                self._dirty = True
                 self.update_undo_redo_buttons()
-                # Update visual feedback
-                if new_val:
-                    self.featured_cb.config(fg="#FFD700")
-                else:
-                    self.featured_cb.config(fg=COLORS["dark"])
+            self._update_featured_visual(new_val)
+
+    def _update_featured_visual(self, value: bool) -> None:
+        """Color the featured checkbox to match its state (UI only)."""
+        self.featured_cb.config(fg="#FFD700" if value else COLORS["dark"])
 
     def on_exit(self) -> None:
         """Handle exit button click."""
@@ -824,18 +938,19 @@ class RightPanel(tk.Frame):
         self.master.quit()
 
     def has_unsaved_changes(self) -> bool:
-        """Check if there are unsaved changes."""
-        if not self.current_data:
-            return False
-        current_state = self.get_image_data()
-        return any(
-            current_state[key] != self.original_state.get(key, '')
-            for key in current_state
-        )
+        """
+        Check if there are unsaved changes.
+        
+        Answered from the dirty flag (or a still-debouncing keyword edit)
+        without reading the form. Edits undone back to the loaded values
+        still count, which errs on the side of prompting.
+        """
+        return bool(self.current_data) and (self._dirty or self._tag_refresh_job is not None)
 
     # Undo/Redo functionality
     def undo_change(self, event=None) -> None:
         """Undo the last change with thread safety."""
+        self._record_text_changes()
         change = self.history.get_undo_change()
         if change:
             with self.history._lock:
@@ -846,37 +961,35 @@ class RightPanel(tk.Frame):
 
     def redo_change(self, event=None) -> None:
         """Redo the last undone change with thread safety."""
+        self._record_text_changes()
         change = self.history.get_redo_change()
         if change:
             with self.history._lock:
                 self.history.undo_stack.append(change)
-            self.apply_change(change['field'], change['new_value'])
+            self.apply_change(change['field'], self.history.new_value(change))
             self.status_cb(f"Redo: {change['field']}")
             self.update_undo_redo_buttons()
 
     def apply_change(self, field: str, value: Any) -> None:
         """Apply a change to the appropriate field."""
-        if field == 'filename':
-            self.filename_entry.delete(0, tk.END)
-            self.filename_entry.insert(0, value)
-        elif field == 'title':
-            self.title_entry.delete(0, tk.END)
-            self.title_entry.insert(0, value)
-        elif field == 'caption':
-            self.caption_entry.delete("1.0", tk.END)
-            self.caption_entry.insert("1.0", value)
-        elif field == 'keywords':
-            self.keywords_entry.delete(0, tk.END)
-            self.keywords_entry.insert(0, ", ".join(value))
-        elif field == 'alt_text':
-            self.alt_text_entry.delete("1.0", tk.END)
-            self.alt_text_entry.insert("1.0", value)
-        elif field == 'headline':
-            self.headline_entry.delete(0, tk.END)
-            self.headline_entry.insert(0, value)
-        elif field == 'featured':
-            self.featured_var.set(value)
-            self.on_featured_change()  # Update visual state
+        self._apply_handlers[field](value)
+
+    def _set_field(self, field: str, value: str) -> None:
+        """Replace the text of an Entry, Combobox or Text form widget."""
+        widget = self.entries[field]
+        start = self._START_INDEX.get(type(widget), 0)
+        widget.delete(start, tk.END)
+        widget.insert(start, value)
+        if start == "1.0":
+            widget.edit_modified(False)  # programmatic fill isn't an edit
+
+    def _set_keywords(self, value: List[str]) -> None:
+        self._set_field('keywords', ", ".join(value))
+
+    def _set_featured(self, value: bool) -> None:
+        # Visual only: undo/redo must not record the change again
+        self.featured_var.set(value)
+        self._update_featured_visual(value)
 
     def update_undo_redo_buttons(self) -> None:
         """Update undo/redo button states based on history."""
@@ -7,11 +7,19 @@ Now with alert message support.
 import tkinter as tk
 from tkinter import ttk
 from typing import Callable, Optional, Tuple
-import psutil
 import time
-from datetime import datetime
+from collections import deque
 
 from config import get_color
+from utils.thread_utils import run_in_thread
+
+
+def _sample_resources() -> Tuple[float, float]:
+    """Read CPU and memory percentages (runs on a worker thread)."""
+    # Imported here so window startup doesn't pay for psutil's initialization
+    import psutil
+    # Non-blocking: compares against the previous call's sample
+    return psutil.cpu_percent(interval=None), psutil.virtual_memory().percent
 
 class StatusBar(tk.Frame):
     """
@@ -25,8 +33,14 @@ class StatusBar(tk.Frame):
     
     def __init__(self, parent: tk.Widget, update_interval: int = 3, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
+        # Resolve theme colors once; widgets below reuse these attributes
+        self._bg_dark = get_color("dark", "#5A5A5A")
+        self._fg_highlight = get_color("highlight", "#F1D1A1")
+        self._bg_primary = get_color("primary", "#A8D5BA")
+        self._bg_secondary = get_color("secondary", "#D8C6B8")
+        
         self.configure(
-            bg=get_color("dark", "#5A5A5A"),
+            bg=self._bg_dark,
             height=28,  # Slightly taller for better visibility
             relief="sunken",
             borderwidth=1,
@@ -39,6 +53,9 @@ class StatusBar(tk.Frame):
         self.update_interval = update_interval
         self.last_update = 0
         self.current_operation = ""
+        self._last_flush = 0.0  # monotonic time of the last forced redraw
+        self._last_ts_sec = -1  # epoch second behind _last_ts_str
+        self._last_ts_str = ""
         
         # Message styling
         self.normal_fg = "white"
@@ -51,17 +68,21 @@ class StatusBar(tk.Frame):
         self.progress_label_var = tk.StringVar(value="")
         
         # System resources
-        self.cpu_history = []
-        self.mem_history = []
         self.max_history = 10
+        self.cpu_history = deque(maxlen=self.max_history)
+        self.mem_history = deque(maxlen=self.max_history)
+        self._cpu_sum = 0.0  # running sums so averages don't re-sum history
+        self._mem_sum = 0.0
+        self._sampling = False  # a worker sample is in flight
         
         self.create_widgets()
-        self.update_resources()
+        # Let the window paint before the first sample
+        self.after(100, self.update_resources)
 
     def create_widgets(self) -> None:
         """Initialize all UI components with enhanced layout."""
         # Main status frame (left-aligned)
-        status_frame = tk.Frame(self, bg=get_color("dark", "#5A5A5A"))
+        status_frame = tk.Frame(self, bg=self._bg_dark)
         status_frame.pack(side="left", fill="x", expand=True)
         
         # Operation label (shows current activity)
@@ -69,8 +90,8 @@ class StatusBar(tk.Frame):
             status_frame,
             textvariable=self.progress_label_var,
             font=("Georgia", 10),
-            fg=get_color("highlight", "#F1D1A1"),
-            bg=get_color("dark", "#5A5A5A"),
+            fg=self._fg_highlight,
+            bg=self._bg_dark,
             anchor="w",
             width=25
         )
@@ -82,13 +103,13 @@ class StatusBar(tk.Frame):
             text="Ready",
             font=("Georgia", 10),
             fg=self.normal_fg,
-            bg=get_color("dark", "#5A5A5A"),
+            bg=self._bg_dark,
             anchor="w"
         )
         self.status_label.pack(side="left", fill="x", expand=True)
         
         # Progress bar with percentage
-        progress_container = tk.Frame(self, bg=get_color("dark", "#5A5A5A"))
+        progress_container = tk.Frame(self, bg=self._bg_dark)
         progress_container.pack(side="left", padx=10)
         
         self.progress_bar = ttk.Progressbar(
@@ -106,12 +127,12 @@ class StatusBar(tk.Frame):
             textvariable=self.progress_label_var,
             font=("Georgia", 10),
             fg="white",
-            bg=get_color("dark", "#5A5A5A")
+            bg=self._bg_dark
         )
         self.progress_text.pack(side="top")
         
         # System resources frame (right-aligned)
-        resource_frame = tk.Frame(self, bg=get_color("dark", "#5A5A5A"))
+        resource_frame = tk.Frame(self, bg=self._bg_dark)
         resource_frame.pack(side="right")
         
         # CPU/Memory indicators
@@ -120,7 +141,7 @@ class StatusBar(tk.Frame):
             text="Loading system info...",
             font=("Georgia", 10),
             fg="white",
-            bg=get_color("dark", "#5A5A5A"),
+            bg=self._bg_dark,
             anchor="e"
         )
         self.resource_label.pack()
@@ -129,8 +150,8 @@ class StatusBar(tk.Frame):
         self.style = ttk.Style()
         self.style.configure(
             "Gallery.Horizontal.TProgressbar",
-            background=get_color("primary", "#A8D5BA"),
-            troughcolor=get_color("secondary", "#D8C6B8")
+            background=self._bg_primary,
+            troughcolor=self._bg_secondary
         )
 
     def update_status(
@@ -151,8 +172,12 @@ class StatusBar(tk.Frame):
             alert: Whether to show as alert/error message
             temporary: If True, message will clear after 5 seconds
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.status_label.config(text=f"[{timestamp}] {message}")
+        # Bursts land within the same second; format each second once
+        sec = int(time.time())
+        if sec != self._last_ts_sec:
+            self._last_ts_sec = sec
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        self.status_label.config(text=f"[{self._last_ts_str}] {message}")
         
         # Set message color based on alert status
         if alert:
@@ -169,51 +194,71 @@ class StatusBar(tk.Frame):
             self.progress_label_var.set(
                 f"{self.current_operation}: {int(progress)}%"
             )
-            self.progress_bar.update()
         
         if temporary:
             self.after(5000, self.clear_status)
         
-        self.update_idletasks()
+        # One idle flush repaints label and progress bar together; capped
+        # at ~30 Hz so tight progress loops don't round-trip every step
+        now = time.monotonic()
+        if now - self._last_flush > 0.033:
+            self._last_flush = now
+            self.update_idletasks()
 
     def update_resources(self) -> None:
         """Enhanced system resource monitoring with history tracking."""
-        current_time = time.time()
-        if current_time - self.last_update >= self.update_interval:
-            try:
-                # Get current stats
-                cpu = psutil.cpu_percent()
-                memory = psutil.virtual_memory().percent
-                
-                # Update history
-                self.cpu_history.append(cpu)
-                self.mem_history.append(memory)
-                if len(self.cpu_history) > self.max_history:
-                    self.cpu_history.pop(0)
-                    self.mem_history.pop(0)
-                
-                # Calculate averages
-                avg_cpu = sum(self.cpu_history) / len(self.cpu_history)
-                avg_mem = sum(self.mem_history) / len(self.mem_history)
-                
-                self.resource_label.config(
-                    text=f"CPU: {avg_cpu:.1f}% | Mem: {avg_mem:.1f}%"
-                )
-                self.last_update = current_time
-                
-                # Change color if resources are stressed
-                if avg_cpu > 80 or avg_mem > 80:
-                    self.resource_label.config(fg=self.warning_fg)
-                else:
-                    self.resource_label.config(fg="white")
-                    
-            except Exception as e:
-                self.resource_label.config(
-                    text="Resource stats unavailable",
-                    fg=self.alert_fg
-                )
+        # Wakes only once per update_interval; psutil runs on a worker and
+        # results come back on the Tk thread
+        if not self._sampling:
+            self._sampling = True
+            self.last_update = time.time()
+            run_in_thread(
+                _sample_resources,
+                self._apply_resources,
+                self._on_resources_error
+            )
+        
+        self.after(int(self.update_interval * 1000), self.update_resources)
+
+    def _apply_resources(self, sample: Tuple[float, float]) -> None:
+        """Fold a worker sample into the history and refresh the label."""
+        self._sampling = False
+        if not self.winfo_exists():
+            return
+        cpu, memory = sample
+        
+        # Update history; the full deques evict their oldest sample
+        # on append, so take it out of the running sums first
+        if len(self.cpu_history) == self.max_history:
+            self._cpu_sum -= self.cpu_history[0]
+            self._mem_sum -= self.mem_history[0]
+        self.cpu_history.append(cpu)
+        self.mem_history.append(memory)
+        self._cpu_sum += cpu
+        self._mem_sum += memory
+        
+        # Calculate averages
+        avg_cpu = self._cpu_sum / len(self.cpu_history)
+        avg_mem = self._mem_sum / len(self.mem_history)
         
-        self.after(1000, self.update_resources)
+        self.resource_label.config(
+            text=f"CPU: {avg_cpu:.1f}% | Mem: {avg_mem:.1f}%"
+        )
+        
+        # Change color if resources are stressed
+        if avg_cpu > 80 or avg_mem > 80:
+            self.resource_label.config(fg=self.warning_fg)
+        else:
+            self.resource_label.config(fg="white")
+
+    def _on_resources_error(self, error) -> None:
+        """Show that stats are unavailable when sampling fails."""
+        self._sampling = False
+        if self.winfo_exists():
+            self.resource_label.config(
+                text="Resource stats unavailable",
+                fg=self.alert_fg
+            )
 
     def start_operation(self, operation_name: str) -> None:
         """
@@ -235,14 +280,18 @@ class StatusBar(tk.Frame):
         self.show_progress(False)
 
     def show_progress(self, show: bool = True) -> None:
-        """Show or hide the progress bar section."""
+        """
+        Show or hide the progress bar section.
+        
+        The change is drawn on the next idle pass; long work should run via
+        run_in_thread so the event loop gets to redraw.
+        """
         if show:
             self.progress_bar.pack(side="top", fill="x")
             self.progress_text.pack(side="top")
         else:
             self.progress_bar.pack_forget()
             self.progress_text.pack_forget()
-        self.update_idletasks()
 
     def clear_status(self) -> None:
         """Clear the status display and reset to normal state."""
@@ -69,81 +69,67 @@ FONTS: Dict[str, Tuple] = {
     "code": ("Courier New", 11)
 }
 
+# ========== BUTTON STYLES ==========
+# Special button styles with better contrast (built once at import)
+_BUTTON_STYLES: Dict[str, Dict] = {
+    "TButton": {
+        "background": COLORS["primary"],
+        "foreground": COLORS["button_text"],  # White text
+        "active_bg": COLORS["primary_dark"],
+        "disabled_fg": COLORS["dark_light"]
+    },
+    "Primary.TButton": {
+        "background": COLORS["primary"], # Green background
+        "foreground": "#8E0000",  # Force white text
+        "font": FONTS["body_bold"],
+        "active_bg": COLORS["primary_dark"] # Slightly lighter when active
+    },
+    "Accent.TButton": {
+        "background": COLORS["accent"], # Purple background
+        "foreground": "#8E0000",  # Force white text
+        "font": FONTS["body_bold"],
+        "active_bg": COLORS["accent_dark"] # Dark when active
+    },
+    "Warning.TButton": {
+        "background": COLORS["exit_bg"],
+        "foreground": COLORS["button_text"],
+        "font": FONTS["body_bold"],
+        "active_bg": "#8E0000"  # Darker red
+    },
+    "Secondary.TButton": {
+        "background": COLORS["secondary_light"],  # Light background
+        "foreground": COLORS["darker"],  # Dark text
+        "font": FONTS["body"],
+        "active_bg": COLORS["secondary"]
+    }
+}
+
+# Tcl option lists for `ttk::style configure`, built once so startup skips
+# the per-call keyword-to-option translation
+_TBUTTON_OPTS = ("-relief", "raised", "-borderwidth", 1)
+_BUTTON_STYLE_OPTS: Dict[str, Tuple] = {
+    style_name: (
+        "-background", config["background"],
+        "-foreground", config["foreground"],
+        "-font", config.get("font", FONTS["body"]),
+        "-padding", 6
+    )
+    for style_name, config in _BUTTON_STYLES.items()
+}
+
 def configure_styles(root: tk.Tk) -> None:
     """Configure ttk widget styles with improved button contrast."""
     style = ttk.Style(root)
+    tk_call = root.tk.call
     
-    # Base button style
-    style.configure("TButton",
-        font=FONTS["body"],
-        padding=8,  # Increased padding for better spacing
-        relief="raised",
-        borderwidth=1
-    )
+    # Base button border; colors, font and padding come from _BUTTON_STYLES
+    tk_call("ttk::style", "configure", "TButton", *_TBUTTON_OPTS)
 
     # Frame styles
     style.configure("TFrame", background=COLORS["background"])
     
-    # Button styles
-    style.configure("TButton",
-        font=FONTS["body"],
-        padding=6,
-        background=COLORS["primary"],
-        foreground=COLORS["dark"]
-    )
-    style.map("TButton",
-        background=[
-            ("active", COLORS["primary_dark"]),
-            ("disabled", COLORS["background_dark"])
-        ],
-        foreground=[
-            ("disabled", COLORS["dark_light"]),
-            ("pressed", "white"), 
-            ("active", "white")
-        ]
-    )
-    
-    # Special button styles with better contrast
-    button_styles = {
-        "TButton": {
-            "background": COLORS["primary"],
-            "foreground": COLORS["button_text"],  # White text
-            "active_bg": COLORS["primary_dark"],
-            "disabled_fg": COLORS["dark_light"]
-        },
-        "Primary.TButton": {
-            "background": COLORS["primary"], # Green background
-            "foreground": "#8E0000",  # Force white text
-            "font": FONTS["body_bold"],
-            "active_bg": COLORS["primary_dark"] # Slightly lighter when active
-        },
-        "Accent.TButton": {
-            "background": COLORS["accent"], # Purple background
-            "foreground": "#8E0000",  # Force white text
-            "font": FONTS["body_bold"],
-            "active_bg": COLORS["accent_dark"] # Dark when active
-        },
-        "Warning.TButton": {
-            "background": COLORS["exit_bg"],
-            "foreground": COLORS["button_text"],
-            "font": FONTS["body_bold"],
-            "active_bg": "#8E0000"  # Darker red
-        },
-        "Secondary.TButton": {
-            "background": COLORS["secondary_light"],  # Light background
-            "foreground": COLORS["darker"],  # Dark text
-            "font": FONTS["body"],
-            "active_bg": COLORS["secondary"]
-        }
-    }
-    
-    for style_name, config in button_styles.items():
-        style.configure(style_name,
-            background=config["background"],
-            foreground=config["foreground"],
-            font=config.get("font", FONTS["body"]),
-            padding=6
-        )
+    for style_name, config in _BUTTON_STYLES.items():
+        tk_call("ttk::style", "configure", style_name, *_BUTTON_STYLE_OPTS[style_name])
         style.map(style_name,
             background=[
                 ("active", config["active_bg"]),
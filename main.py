@@ -2,23 +2,25 @@
 """Main entry point with window identification"""
 import sys
 import os
-import shutil
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
+# Source directory; absolute() only joins with cwd, unlike resolve(),
+# which walks symlinks with a stat per path component
+PROJECT_ROOT = Path(__file__).absolute().parent
+
 # Set up correct base path depending on if frozen or not
 if getattr(sys, 'frozen', False):
-    BASE_DIR = os.path.dirname(sys.executable)
+    BASE_DIR = Path(sys.executable).parent
 else:
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    BASE_DIR = PROJECT_ROOT
 
-CONFIG_DIR = os.path.join(BASE_DIR, "config")
-CACHE_FILE = os.path.join(BASE_DIR, "file_cache.json")
+CONFIG_DIR = BASE_DIR / "config"
+CACHE_FILE = BASE_DIR / "file_cache.json"
 
 # Add project root to Python path
-PROJECT_ROOT = Path(__file__).parent.resolve()
-sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, os.fspath(PROJECT_ROOT))
 
 from gui.main_window import MainWindow
 from config import load_config
@@ -26,6 +28,7 @@ from config import load_config
 CREDENTIAL_FOLDER = PROJECT_ROOT / "config"
 CREDENTIAL_FILENAME = "silknstoneproduction_vision_api_key.json"
 CREDENTIAL_PATH = CREDENTIAL_FOLDER / CREDENTIAL_FILENAME
+CREDENTIAL_PATH_STR = os.fspath(CREDENTIAL_PATH)
 
 
 def ensure_google_credentials():
@@ -53,11 +56,16 @@ def ensure_google_credentials():
             sys.exit(1)
 
         os.makedirs(CREDENTIAL_FOLDER, exist_ok=True)
-        shutil.copy(selected_file, CREDENTIAL_PATH)
+        # Write beside the target, then rename over it so an interrupted
+        # copy never leaves a partial credential file (the JSON is tiny)
+        tmp_path = CREDENTIAL_PATH.with_name(CREDENTIAL_FILENAME + ".tmp")
+        with open(selected_file, "rb") as src, open(tmp_path, "wb") as dst:
+            dst.write(src.read())
+        os.replace(tmp_path, CREDENTIAL_PATH)
         messagebox.showinfo("Success", "Credential file saved successfully.")
 
     # Set environment variable
-    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(CREDENTIAL_PATH)
+    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = CREDENTIAL_PATH_STR
 
 
 class Application:
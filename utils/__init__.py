@@ -6,13 +6,17 @@ Contains helper functions and tools.
 # Import utility modules
 from .image_utils import (
     validate_image_file,
+    has_image_signature,
     compute_image_hash,
+    compute_image_fingerprint,
     generate_thumbnail,
     resize_image,
     convert_to_webp,
     get_image_metadata,
     normalize_image_orientation,
-    create_image_preview
+    create_image_preview,
+    hash_many,
+    thumbnail_many
 )
 from .file_utils import (
     slugify,
@@ -21,6 +25,7 @@ from .file_utils import (
     save_json_data,
     get_files_by_extensions,
     safe_rename,
+    move_file,
     copy_file_with_backup,
     get_file_modified_time,
     get_directory_size,
@@ -29,22 +34,31 @@ from .file_utils import (
 )
 from .thread_utils import (
     run_in_thread,
+    get_shared_pool,
     schedule_callback,
     process_pending_callbacks,
     ThreadPool,
     CancellableTask
 )
+from .diff import (
+    compute_delta,
+    apply_delta
+)
 
 __all__ = [
     # Image utils
     'validate_image_file',
+    'has_image_signature',
     'compute_image_hash',
+    'compute_image_fingerprint',
     'generate_thumbnail',
     'resize_image',
     'convert_to_webp',
     'get_image_metadata',
     'normalize_image_orientation',
     'create_image_preview',
+    'hash_many',
+    'thumbnail_many',
     
     # File utils
     'slugify',
@@ -53,6 +67,7 @@ __all__ = [
     'save_json_data',
     'get_files_by_extensions',
     'safe_rename',
+    'move_file',
     'copy_file_with_backup',
     'get_file_modified_time',
     'get_directory_size',
@@ -61,8 +76,13 @@ __all__ = [
     
     # Thread utils
     'run_in_thread',
+    'get_shared_pool',
     'schedule_callback',
     'process_pending_callbacks',
     'ThreadPool',
-    'CancellableTask'
+    'CancellableTask',
+    
+    # Diff utils
+    'compute_delta',
+    'apply_delta'
 ]
\ No newline at end of file
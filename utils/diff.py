@@ -0,0 +1,33 @@
+"""
+Compact single-span deltas for undo history in Henna Gallery Editor.
+Works on any sliceable sequence (str or list).
+"""
+
+from typing import Any, Sequence, Tuple
+
+Delta = Tuple[int, int, Any]
+
+
+def compute_delta(old: Sequence, new: Sequence) -> Delta:
+    """Return (i, j, insert) such that old[:i] + insert + old[j:] == new.
+
+    The span is found by trimming the common prefix and suffix, so a
+    typical edit stores only the typed or deleted characters.
+    """
+    limit = min(len(old), len(new))
+    start = 0
+    while start < limit and old[start] == new[start]:
+        start += 1
+
+    limit -= start
+    tail = 0
+    while tail < limit and old[-1 - tail] == new[-1 - tail]:
+        tail += 1
+
+    return start, len(old) - tail, new[start:len(new) - tail]
+
+
+def apply_delta(old: Sequence, delta: Delta) -> Sequence:
+    """Rebuild the new value from old and a delta from compute_delta."""
+    start, end, insert = delta
+    return old[:start] + insert + old[end:]
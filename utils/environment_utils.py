@@ -4,11 +4,16 @@ Handles system and dependency validation.
 """
 
 from __future__ import annotations
+import re
 import sys
 import platform
 from typing import Dict, Tuple, List
 from pathlib import Path
 
+def _normalize_name(name: str) -> str:
+    """Normalize a distribution name for comparison (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
 def validate_environment(requirements: List[str] = None) -> Dict[str, Any]:
     """
     Validate the system environment meets requirements.
@@ -35,22 +40,25 @@ def validate_environment(requirements: List[str] = None) -> Dict[str, Any]:
     }
     
     if requirements:
+        # One scan of installed metadata instead of a sys.path walk per package
         try:
-            from importlib.metadata import distribution
-            for pkg in requirements:
-                try:
-                    distribution(pkg)
-                except:
-                    result['missing_packages'].append(pkg)
-            result['all_valid'] = len(result['missing_packages']) == 0
+            from importlib.metadata import distributions
+            installed = {
+                _normalize_name(dist.metadata["Name"])
+                for dist in distributions()
+                if dist.metadata["Name"]
+            }
         except ImportError:
             # Fallback for older Python versions
             import pkg_resources
-            for pkg in requirements:
-                try:
-                    pkg_resources.get_distribution(pkg)
-                except:
-                    result['missing_packages'].append(pkg)
-            result['all_valid'] = len(result['missing_packages']) == 0
+            installed = {
+                _normalize_name(dist.project_name)
+                for dist in pkg_resources.working_set
+            }
+        result['missing_packages'] = [
+            pkg for pkg in requirements
+            if _normalize_name(pkg) not in installed
+        ]
+        result['all_valid'] = not result['missing_packages']
     
     return result
\ No newline at end of file
@@ -5,20 +5,64 @@ Handles file operations, JSON management, path utilities, and asset loading.
 
 from __future__ import annotations
 import os
+import errno
 import json
 import shutil
 import re
 import hashlib
+import mmap
+import sys
 import mimetypes
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, Tuple, BinaryIO
 from datetime import datetime
 from PIL import Image, UnidentifiedImageError
 
+# C-level read/update loop for hashing (Python 3.11+)
+_file_digest = getattr(hashlib, "file_digest", None)
+
+# Files at least this large are hashed through mmap instead of reads
+MMAP_HASH_THRESHOLD = 1 << 20
+
+# Optional fast JSON backend - falls back to the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _read_json(filepath: Union[str, Path]) -> Any:
+    """Parse a JSON file, using orjson on the raw bytes when available."""
+    if ORJSON_AVAILABLE:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_json(
+    filepath: Union[str, Path],
+    data: Any,
+    indent: Optional[int] = 2,
+    ensure_ascii: bool = False
+) -> None:
+    """Serialize data to a JSON file, using orjson when it can match the layout."""
+    # orjson only emits UTF-8 with 2-space or no indentation
+    if ORJSON_AVAILABLE and not ensure_ascii and indent in (2, None):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=option | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
+
 # --------------------------
 # Configuration Handling
 # --------------------------
 
+# Parsed config files keyed by path -> ((mtime_ns, size), parsed JSON)
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
 def load_config(
     config_path: Union[str, Path],
     default_config: Optional[Dict[str, Any]] = None
@@ -42,28 +86,36 @@ def load_config(
     default = default_config or {}
     config_path = Path(config_path)
     
-    if not config_path.exists():
-        return default.copy()
-    
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-            if not isinstance(config, dict):
-                return default.copy()
-            
-            # Set Google credentials environment variable if specified
-            if 'google_credentials' in config:
-                creds_path = Path(config['google_credentials'])
-                if creds_path.exists():
-                    os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = str(creds_path)
-            
-            # Only keep keys that exist in default config (if provided)
-            if default:
-                return {
-                    **default,
-                    **{k: v for k, v in config.items() if k in default}
-                }
-            return config
+        # Re-parse only when the file changed since the last call
+        st = config_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = os.fspath(config_path)
+        cached = _CONFIG_CACHE.get(key)
+        if cached and cached[0] == stamp:
+            config = cached[1]
+        else:
+            config = _read_json(config_path)
+            _CONFIG_CACHE[key] = (stamp, config)
+        if not isinstance(config, dict):
+            return default.copy()
+        
+        # Set Google credentials environment variable if specified
+        if 'google_credentials' in config:
+            creds_path = Path(config['google_credentials'])
+            if creds_path.exists():
+                os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = str(creds_path)
+        
+        # Only keep keys that exist in default config (if provided)
+        if default:
+            return {
+                **default,
+                **{k: v for k, v in config.items() if k in default}
+            }
+        # Copy so callers can't mutate the cached parse
+        return config.copy()
+    except FileNotFoundError:
+        return default.copy()
     except (json.JSONDecodeError, IOError, OSError) as e:
         print(f"Error loading config: {str(e)}")
         return default.copy()
@@ -72,6 +124,10 @@ def load_config(
 # Text and Path Utilities
 # --------------------------
 
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEP_RE = re.compile(r'[-\s]+')
+_UNSAFE_FILENAME_RE = re.compile(r'[\\/*?:"<>|\r\n]')
+
 def slugify(text: str) -> str:
     """
     Convert text to a URL/filesystem-safe slug.
@@ -82,8 +138,8 @@ def slugify(text: str) -> str:
     Returns:
         str: URL-safe version of the text
     """
-    text = re.sub(r'[^\w\s-]', '', text.lower())
-    return re.sub(r'[-\s]+', '-', text).strip('-_')
+    text = _SLUG_STRIP_RE.sub('', text.lower())
+    return _SLUG_SEP_RE.sub('-', text).strip('-_')
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -95,8 +151,8 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         str: Sanitized filename
     """
-    filename = re.sub(r'[\\/*?:"<>|]', "", filename)
-    return filename.replace("\n", "").replace("\r", "").strip()
+    # Newlines are in the same character class, so one pass removes all
+    return _UNSAFE_FILENAME_RE.sub("", filename).strip()
 
 def ensure_directory_exists(path: Union[str, Path]) -> bool:
     """
@@ -148,6 +204,61 @@ def safe_rename(
     except (OSError, PermissionError):
         return False
 
+# Chunk size for cross-device copies (kernel copy_file_range or userspace)
+COPY_BUFSIZE = 16 * 1024 * 1024
+
+def move_file(source: Union[str, Path], target: Union[str, Path]) -> None:
+    """
+    Move a file, using a single rename when source and target share a filesystem.
+    
+    An existing target is overwritten on every platform, as shutil.move
+    does (os.replace rather than os.rename, which refuses on Windows).
+    Cross-device moves copy the data (in kernel space where the platform
+    supports it), carry over file metadata and then remove the source.
+    
+    Args:
+        source: Source file path
+        target: Target file path
+        
+    Raises:
+        OSError: If the file cannot be moved
+    """
+    try:
+        os.replace(source, target)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+            
+    try:
+        _copy_file_contents(source, target)
+        shutil.copystat(source, target)
+    except OSError:
+        Path(target).unlink(missing_ok=True)
+        raise
+    os.unlink(source)
+
+def _copy_file_contents(source: Union[str, Path], target: Union[str, Path]) -> None:
+    """Copy file data with copy_file_range where available, else large buffered reads."""
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while os.copy_file_range(src.fileno(), dst.fileno(), COPY_BUFSIZE):
+                    pass
+                return
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+                # Not supported between these filesystems - restart in userspace
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+                
+        shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+
 def copy_file_with_backup(
     source: Union[str, Path],
     target: Union[str, Path],
@@ -168,21 +279,60 @@ def copy_file_with_backup(
     if not source.exists():
         return False
         
+    tmp_path = target.with_name(f"{target.name}.tmp")
     try:
         if backup and target.exists():
             backup_path = target.with_suffix(f"{target.suffix}.bak")
             backup_path.unlink(missing_ok=True)
-            target.rename(backup_path)
-            
-        shutil.copy2(source, target)
+            try:
+                # O(1) hardlink; os.replace below swaps the target's entry,
+                # so the link keeps the old contents
+                os.link(target, backup_path)
+            except OSError:
+                # No hardlinks on this filesystem (FAT, some network shares)
+                os.replace(target, backup_path)
+        
+        # Copy beside the target then swap it in, so readers never see a
+        # half-written file (copy2 uses in-kernel copies where available)
+        shutil.copy2(source, tmp_path)
+        os.replace(tmp_path, target)
         return True
     except (OSError, shutil.Error):
+        tmp_path.unlink(missing_ok=True)
         return False
 
+# Concurrent scandir calls used by get_files_by_extensions(prefetch=True)
+PREFETCH_WORKERS = 4
+
+def _scan_directory(
+    path: str,
+    suffixes: Tuple[str, ...],
+    recursive: bool
+) -> Tuple[List[str], List[str]]:
+    """List one directory: (subdirectories to descend into, matching files)."""
+    subdirs, files = [], []
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return subdirs, files  # unreadable subdirectory, as glob skips it
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    subdirs.append(entry.path)
+                continue
+            # One C-level endswith over all suffixes; a name that is only the
+            # suffix is skipped, matching Path.suffix (".jpg" has none)
+            name = entry.name.lower()
+            if name.endswith(suffixes) and name not in suffixes and entry.is_file():
+                files.append(entry.path)
+    return subdirs, files
+
 def get_files_by_extensions(
     directory: Union[str, Path],
     extensions: List[str],
-    recursive: bool = False
+    recursive: bool = False,
+    prefetch: bool = False
 ) -> List[Path]:
     """
     Get files in directory with specified extensions.
@@ -191,6 +341,10 @@ def get_files_by_extensions(
         directory: Directory to search
         extensions: List of file extensions (e.g. ['.jpg', '.png'])
         recursive: Whether to search subdirectories
+        prefetch: Scan subdirectories on a small thread pool so directory
+            reads overlap. Worth it on network shares (NFS/SMB) where each
+            listing waits on a round trip; on local disks the thread
+            overhead usually outweighs the gain. Only used with recursive.
         
     Returns:
         List of Path objects matching extensions
@@ -199,16 +353,30 @@ def get_files_by_extensions(
     if not directory.is_dir():
         return []
     
-    if recursive:
-        return [
-            p for p in directory.rglob('*')
-            if p.suffix.lower() in extensions and p.is_file()
-        ]
-    else:
-        return [
-            p for p in directory.glob('*')
-            if p.suffix.lower() in extensions and p.is_file()
-        ]
+    # Lowercase dotted suffixes, matched against DirEntry names (scandir
+    # caches the file type, so no extra stat per entry)
+    suffixes = tuple({'.' + ext.lower().lstrip('.') for ext in extensions})
+    results = []
+    
+    if prefetch and recursive:
+        with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as pool:
+            pending = {pool.submit(_scan_directory, os.fspath(directory), suffixes, True)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    subdirs, files = future.result()
+                    results.extend(map(Path, files))
+                    pending.update(
+                        pool.submit(_scan_directory, d, suffixes, True) for d in subdirs
+                    )
+        return results
+    
+    stack = [os.fspath(directory)]
+    while stack:
+        subdirs, files = _scan_directory(stack.pop(), suffixes, recursive)
+        stack.extend(subdirs)
+        results.extend(map(Path, files))
+    return results
 
 def create_unique_filename(
     directory: Union[str, Path],
@@ -227,19 +395,22 @@ def create_unique_filename(
         Path: Unique file path
     """
     directory = Path(directory)
-    counter = 1
     stem = slugify(basename)
     
-    while True:
-        candidate = directory / f"{stem}{extension}"
-        if not candidate.exists():
-            return candidate
-            
-        candidate = directory / f"{stem}-{counter}{extension}"
-        if not candidate.exists():
-            return candidate
-            
+    # One listing instead of a stat per probe; lowercased because the
+    # filesystem may be case-insensitive (Windows, macOS)
+    try:
+        with os.scandir(directory) as it:
+            existing = {entry.name.lower() for entry in it}
+    except OSError:
+        existing = set()
+    
+    name = f"{stem}{extension}"
+    counter = 1
+    while name.lower() in existing:
+        name = f"{stem}-{counter}{extension}"
         counter += 1
+    return directory / name
 
 # --------------------------
 # File Information
@@ -270,16 +441,25 @@ def get_directory_size(directory: Union[str, Path]) -> int:
     Returns:
         int: Total size in bytes
     """
+    # Iterative walk: no recursion limit on deep trees, and DirEntry's
+    # cached type means only regular files need a stat call
     total = 0
-    try:
-        for entry in os.scandir(directory):
-            if entry.is_file():
-                total += entry.stat().st_size
-            elif entry.is_dir():
-                total += get_directory_size(entry.path)
-        return total
-    except (OSError, PermissionError):
-        return 0
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue  # unreadable directory contributes nothing
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+    return total
 
 # --------------------------
 # JSON Handling
@@ -299,8 +479,7 @@ def load_json_data(filepath: Union[str, Path]) -> Any:
         json.JSONDecodeError: If file contains invalid JSON
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _read_json(filepath)
     except FileNotFoundError:
         return {}
     except json.JSONDecodeError as e:
@@ -328,51 +507,11 @@ def save_json_data(
         bool: True if save succeeded
     """
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
+        _write_json(filepath, data, indent, ensure_ascii)
         return True
     except (IOError, TypeError):
         return False
 
-def load_config(
-    config_path: Union[str, Path],
-    default_config: Optional[Dict[str, Any]] = None
-) -> Dict[str, Any]:
-    """
-    Load configuration from JSON file with defaults.
-    
-    Args:
-        config_path: Path to configuration file
-        default_config: Default values if file doesn't exist or is invalid
-        
-    Returns:
-        Dictionary with loaded configuration
-        
-    Example:
-        >>> config = load_config('config.json', {'api_key': '', 'quality': 90})
-    """
-    default = default_config or {}
-    config_path = Path(config_path)
-    
-    if not config_path.exists():
-        return default.copy()
-    
-    try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-            if not isinstance(config, dict):
-                return default.copy()
-            
-            # Only keep keys that exist in default config (if provided)
-            if default:
-                return {
-                    **default,
-                    **{k: v for k, v in config.items() if k in default}
-                }
-            return config
-    except (json.JSONDecodeError, IOError, OSError):
-        return default.copy()
-
 # --------------------------
 # Image Utilities
 # --------------------------
@@ -407,16 +546,30 @@ def compute_image_hash(filepath: Union[str, Path]) -> str:
     Raises:
         IOError: If file cannot be read
     """
-    BLOCK_SIZE = 65536
-    hasher = hashlib.sha256()
+    BLOCK_SIZE = 1 << 20  # 1 MiB reads: far fewer syscalls on multi-MB images
     
     try:
-        with open(filepath, 'rb') as f:
+        # Unbuffered: every path below does its own reads
+        with open(filepath, 'rb', buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            # Large files: hash straight from the page cache, no copy into
+            # Python bytes (sys.maxsize bound skips >2 GiB on 32-bit builds)
+            if MMAP_HASH_THRESHOLD <= size <= sys.maxsize:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    return hashlib.sha256(mm).hexdigest()
+            
+            if _file_digest is not None:
+                # Python 3.11+: read/update loop runs in C
+                return _file_digest(f, 'sha256').hexdigest()
+            
+            hasher = hashlib.sha256()
             buf = f.read(BLOCK_SIZE)
             while len(buf) > 0:
                 hasher.update(buf)
                 buf = f.read(BLOCK_SIZE)
-        return hasher.hexdigest()
+            return hasher.hexdigest()
     except IOError as e:
         raise IOError(f"Could not read file {filepath}: {str(e)}")
 
@@ -440,6 +593,30 @@ def is_supported_image_format(filepath: Union[str, Path]) -> bool:
 # Asset Loading
 # --------------------------
 
+# Leading magic bytes -> MIME type, checked against the first 16 bytes
+_MIME_SIGNATURES = (
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+    (b'II*\x00', 'image/tiff'),
+    (b'MM\x00*', 'image/tiff'),
+    (b'\x00\x00\x01\x00', 'image/x-icon'),
+    (b'%PDF-', 'application/pdf'),
+)
+
+def _sniff_mime_type(header: bytes) -> Optional[str]:
+    """MIME type from a file's leading bytes, or None if unrecognized."""
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'image/webp'
+    # 'BM' alone is too common in text; BMP's reserved header words are zero
+    if header[:2] == b'BM' and header[6:10] == b'\x00\x00\x00\x00':
+        return 'image/bmp'
+    for signature, mime_type in _MIME_SIGNATURES:
+        if header.startswith(signature):
+            return mime_type
+    return None
+
 def load_image_asset(
     filepath: Union[str, Path],
     max_size: Optional[Tuple[int, int]] = None,
@@ -503,27 +680,28 @@ def load_binary_asset(filepath: Union[str, Path]) -> Optional[bytes]:
         bytes content or None if failed
     """
     try:
-        with open(filepath, 'rb') as f:
+        # Slurped in one read(), so skip the BufferedReader layer
+        with open(filepath, 'rb', buffering=0) as f:
             return f.read()
     except IOError:
         return None
 
 def stream_binary_asset(
     filepath: Union[str, Path],
-    chunk_size: int = 4096
+    chunk_size: int = 131072
 ) -> Optional[BinaryIO]:
     """
     Open a binary file for streaming reading.
     
     Args:
         filepath: Path to binary file
-        chunk_size: Suggested chunk size for reading
+        chunk_size: Suggested chunk size for reading (also the buffer size)
         
     Returns:
         Binary file object or None if failed
     """
     try:
-        return open(filepath, 'rb')
+        return open(filepath, 'rb', buffering=chunk_size)
     except IOError:
         return None
 
@@ -549,15 +727,17 @@ def get_asset_metadata(filepath: Union[str, Path]) -> Dict[str, Any]:
         'is_image': False
     }
     
-    if not path.exists() or not path.is_file():
-        return metadata
-    
     try:
-        stat = path.stat()
-        metadata['size'] = stat.st_size
-        metadata['modified'] = datetime.fromtimestamp(stat.st_mtime)
+        # One open serves both the stat and the header read
+        with open(path, 'rb', buffering=0) as f:
+            st = os.fstat(f.fileno())
+            metadata['size'] = st.st_size
+            metadata['modified'] = datetime.fromtimestamp(st.st_mtime)
+            header = f.read(16)
         
-        mime_type, _ = mimetypes.guess_type(path)
+        # Trust the content over the extension; the extension-based guess
+        # only covers non-binary assets (JSON, CSS, ...) the sniffer skips
+        mime_type = _sniff_mime_type(header) or mimetypes.guess_type(path)[0]
         if mime_type:
             metadata['mime_type'] = mime_type
             metadata['is_image'] = mime_type.startswith('image/')
@@ -18,19 +18,56 @@ Key Features:
 """
 
 import os
+import sys
+import mmap
 import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any, List
+from typing import Optional, Tuple, Dict, Any, List, Sequence, Union
 from PIL import Image, ImageOps, UnidentifiedImageError
 
-# Optional import for color extraction
+# C-level read/update loop for hashing (Python 3.11+)
+_file_digest = getattr(hashlib, "file_digest", None)
+
+# Files at least this large are hashed through mmap instead of reads
+MMAP_HASH_THRESHOLD = 1 << 20
+
+# Optional imports for color extraction (NumPy preferred, ColorThief fallback)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 try:
     from colorthief import ColorThief
-    COLOR_EXTRACTION_AVAILABLE = True
+    COLORTHIEF_AVAILABLE = True
+except ImportError:
+    COLORTHIEF_AVAILABLE = False
+
+COLOR_EXTRACTION_AVAILABLE = NUMPY_AVAILABLE or COLORTHIEF_AVAILABLE
+if not COLOR_EXTRACTION_AVAILABLE:
+    print("⚠️ NumPy/ColorThief not installed - color extraction will be disabled")
+    print("Install with: pip install numpy")
+
+# Optional libvips binding for streaming WebP conversion
+try:
+    import pyvips
+    VIPS_AVAILABLE = True
+except (ImportError, OSError):  # OSError: binding present, libvips missing
+    VIPS_AVAILABLE = False
+
+# Optional fast hashers for in-session fingerprints (best available wins)
+try:
+    import blake3
+    FINGERPRINT_BACKEND = "blake3"
 except ImportError:
-    COLOR_EXTRACTION_AVAILABLE = False
-    print("⚠️ ColorThief not installed - color extraction will be disabled")
-    print("Install with: pip install colorthief")
+    try:
+        import xxhash
+        FINGERPRINT_BACKEND = "xxh3_128"
+    except ImportError:
+        FINGERPRINT_BACKEND = "blake2b"
 
 def validate_image_file(filepath: Path) -> bool:
     """
@@ -46,13 +83,117 @@ def validate_image_file(filepath: Path) -> bool:
         >>> validate_image_file(Path("image.jpg"))
         True
     """
+    # The helpers below each validate their input, so one image is often
+    # checked several times; key the cached verify() on the file's stat so
+    # an edited or replaced file is re-checked
+    try:
+        st = os.stat(filepath)
+    except OSError as e:
+        print(f"Image validation failed for {filepath}: {str(e)}")
+        return False
+    return _validate_image_cached(os.fspath(filepath), st.st_mtime_ns, st.st_size)
+
+@lru_cache(maxsize=4096)
+def _validate_image_cached(path_str: str, mtime_ns: int, size: int) -> bool:
+    """Open and verify an image; mtime_ns/size only serve as cache key."""
     try:
-        with Image.open(filepath) as img:
+        with Image.open(path_str) as img:
             img.verify()
         return True
     except (IOError, UnidentifiedImageError, Image.DecompressionBombError) as e:
-        print(f"Image validation failed for {filepath}: {str(e)}")
+        print(f"Image validation failed for {path_str}: {str(e)}")
+        return False
+
+# Leading magic bytes for the formats the gallery accepts
+IMAGE_SIGNATURES = (
+    b'\xff\xd8\xff',           # JPEG
+    b'\x89PNG\r\n\x1a\n',       # PNG
+    b'GIF87a', b'GIF89a',       # GIF
+    b'BM',                      # BMP
+)
+
+def has_image_signature(filepath: Path) -> bool:
+    """
+    Cheap check that a file starts with a known image signature.
+    
+    Reads only the first 32 bytes - much lighter than a full PIL verify()
+    when scanning many folders, but does not detect truncated files.
+    
+    Args:
+        filepath: Path to the candidate file
+        
+    Returns:
+        bool: True if the header matches a supported image format
+        
+    Example:
+        >>> has_image_signature(Path("image.jpg"))
+        True
+    """
+    try:
+        with open(filepath, 'rb', buffering=0) as f:
+            header = f.read(32)
+    except OSError:
         return False
+        
+    if header.startswith(b'RIFF') and header[8:12] == b'WEBP':
+        return True
+    return header.startswith(IMAGE_SIGNATURES)
+
+# PIL format names matching IMAGE_SIGNATURES (plus WebP); limiting
+# Image.open to these skips probing every other registered decoder
+_OPEN_FORMATS = ("JPEG", "PNG", "GIF", "BMP", "WEBP")
+
+def _open_image(
+    image_path: Path,
+    draft_size: Optional[Tuple[int, int]] = None
+) -> Optional[Image.Image]:
+    """
+    Open and fully decode an image in one pass.
+    
+    Decoding doubles as validation: a corrupt or unsupported file fails
+    here, so callers need no separate validate_image_file() open.
+    
+    Args:
+        image_path: Path to the image file
+        draft_size: Target size for JPEG draft decoding. libjpeg then scales
+            by 1/2, 1/4 or 1/8 during the IDCT, staying at or above the
+            target size. This is lossy only in resolution that a downscale
+            discards anyway. Other formats decode at full size.
+    
+    Returns:
+        Loaded PIL Image, or None if the file is not a readable image
+    """
+    try:
+        img = Image.open(image_path, formats=_OPEN_FORMATS)
+    except (IOError, UnidentifiedImageError, Image.DecompressionBombError) as e:
+        print(f"Image validation failed for {image_path}: {str(e)}")
+        return None
+    try:
+        if draft_size and img.format == 'JPEG':
+            # Square box on the longer side so an EXIF 90-degree rotation
+            # applied afterwards still leaves enough pixels on both axes
+            side = max(draft_size)
+            img.draft('RGB', (side, side))
+        img.load()
+    except (IOError, Image.DecompressionBombError) as e:
+        img.close()
+        print(f"Image validation failed for {image_path}: {str(e)}")
+        return None
+    return img
+
+def _open_oriented(
+    image_path: Path,
+    draft_size: Optional[Tuple[int, int]] = None
+) -> Optional[Image.Image]:
+    """Open, decode and EXIF-orient an image in one pass (None on failure)."""
+    img = _open_image(image_path, draft_size)
+    if img is None:
+        return None
+    oriented = normalize_image_orientation(img)
+    if oriented is not img:
+        # Rotation made a new image; GIF/WebP sources still hold their file
+        img.close()
+    return oriented
 
 def compute_image_hash(filepath: Path) -> str:
     """
@@ -71,22 +212,111 @@ def compute_image_hash(filepath: Path) -> str:
         >>> compute_image_hash(Path("image.jpg"))
         'a1b2c3...'
     """
-    BLOCK_SIZE = 65536  # Read in 64kb chunks
-    hasher = hashlib.sha256()
+    BLOCK_SIZE = 1 << 20  # Read in 1 MiB chunks
     
     try:
-        with open(filepath, 'rb') as f:
+        # Unbuffered: every path below does its own reads
+        with open(filepath, 'rb', buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            # Large files: hash straight from the page cache, no copy into
+            # Python bytes (sys.maxsize bound skips >2 GiB on 32-bit builds)
+            if MMAP_HASH_THRESHOLD <= size <= sys.maxsize:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    return hashlib.sha256(mm).hexdigest()
+            
+            if _file_digest is not None:
+                # Python 3.11+: read/update loop runs in C
+                return _file_digest(f, 'sha256').hexdigest()
+            
+            hasher = hashlib.sha256()
             buf = f.read(BLOCK_SIZE)
             while len(buf) > 0:
                 hasher.update(buf)
                 buf = f.read(BLOCK_SIZE)
+            return hasher.hexdigest()
+    except IOError as e:
+        raise IOError(f"Could not read file {filepath}: {str(e)}")
+
+def compute_image_fingerprint(filepath: Path) -> str:
+    """
+    Compute a fast content fingerprint for in-session duplicate checks.
+    
+    Uses BLAKE3 (SIMD, multithreaded, memory-mapped) or xxh3_128 when
+    installed, falling back to hashlib's blake2b. The value depends on
+    FINGERPRINT_BACKEND, so it must not be persisted; use
+    compute_image_hash for hashes stored in gallery data.
+    
+    Args:
+        filepath: Path to the image file
+        
+    Returns:
+        str: Hexadecimal fingerprint
+        
+    Raises:
+        IOError: If file cannot be read
+    """
+    try:
+        if FINGERPRINT_BACKEND == "blake3":
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(filepath)
+            return hasher.hexdigest()
+        
+        hasher = xxhash.xxh3_128() if FINGERPRINT_BACKEND == "xxh3_128" else hashlib.blake2b()
+        with open(filepath, 'rb') as f:
+            for buf in iter(lambda: f.read(65536), b''):
+                hasher.update(buf)
         return hasher.hexdigest()
     except IOError as e:
         raise IOError(f"Could not read file {filepath}: {str(e)}")
 
+# Palette sampling: pixels are binned at 5 bits per channel (32768 bins)
+PALETTE_SAMPLE_SIZE = (200, 200)
+_PALETTE_SHIFT = 3
+
+def _histogram_palette(image_path: Path, num_colors: int) -> List[str]:
+    """
+    Dominant colors as the mean pixel of the most populated color bins.
+    
+    Args:
+        image_path: Path to the image file
+        num_colors: Number of colors to extract
+        
+    Returns:
+        List of hex color strings, most common first
+    """
+    img = _open_image(image_path, draft_size=PALETTE_SAMPLE_SIZE)
+    if img is None:
+        return []
+    try:
+        img.thumbnail(PALETTE_SAMPLE_SIZE)
+        pixels = np.asarray(img.convert('RGB')).reshape(-1, 3)
+    except Exception as e:
+        print(f"Color extraction failed for {image_path}: {str(e)}")
+        return []
+    finally:
+        img.close()
+    
+    q = (pixels >> _PALETTE_SHIFT).astype(np.int32)
+    bins = (q[:, 0] << 10) | (q[:, 1] << 5) | q[:, 2]
+    counts = np.bincount(bins, minlength=1 << 15)
+    top = np.argsort(counts)[::-1][:num_colors]
+    top = top[counts[top] > 0]
+    
+    # Average the real pixels in each bin rather than using bin corners
+    means = np.stack([
+        np.bincount(bins, weights=pixels[:, c], minlength=1 << 15)[top]
+        for c in range(3)
+    ], axis=1) / counts[top, None]
+    return [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in np.rint(means).astype(int)]
+
 def extract_dominant_colors(image_path: Path, num_colors: int = 3) -> List[str]:
     """
-    Extract dominant colors from an image using ColorThief.
+    Extract dominant colors from an image.
+    
+    Uses a vectorized NumPy histogram when available, falling back to
+    ColorThief's pure-Python median cut otherwise.
     
     Args:
         image_path: Path to the image file
@@ -100,9 +330,12 @@ def extract_dominant_colors(image_path: Path, num_colors: int = 3) -> List[str]:
         ["#A8D5BA", "#D8C6B8", "#4A6FA5"]
     """
     if not COLOR_EXTRACTION_AVAILABLE:
-        print("Color extraction disabled - ColorThief not installed")
+        print("Color extraction disabled - NumPy/ColorThief not installed")
         return []
     
+    if NUMPY_AVAILABLE:
+        return _histogram_palette(image_path, num_colors)
+    
     if not validate_image_file(image_path):
         print(f"Invalid image file: {image_path}")
         return []
@@ -134,20 +367,24 @@ def generate_thumbnail(
     Example:
         >>> thumb = generate_thumbnail(Path("image.jpg"), (200, 200))
     """
-    if not validate_image_file(image_path):
+    img = _open_oriented(image_path, draft_size=size)
+    if img is None:
         return None
         
+    thumb = None
     try:
-        with Image.open(image_path) as img:
-            img = normalize_image_orientation(img)
-            if crop_to_fit:
-                thumb = ImageOps.fit(img, size, Image.Resampling.LANCZOS)
-            else:
-                thumb = ImageOps.contain(img, size, Image.Resampling.LANCZOS)
-            return thumb
+        if crop_to_fit:
+            thumb = ImageOps.fit(img, size, Image.Resampling.LANCZOS)
+        else:
+            thumb = ImageOps.contain(img, size, Image.Resampling.LANCZOS)
+        return thumb
     except Exception as e:
         print(f"Thumbnail generation failed for {image_path}: {str(e)}")
         return None
+    finally:
+        # contain() hands back the source itself when it already fits
+        if thumb is not img:
+            img.close()
 
 # [Rest of the existing functions remain exactly the same]
 # [Keep all current implementations of:]
@@ -204,20 +441,38 @@ def convert_to_webp(
     Returns:
         bool: True if conversion succeeded
     """
-    if not validate_image_file(source_path):
+    if VIPS_AVAILABLE:
+        # Sequential access lets libvips decode and encode in strips, so the
+        # full pixel buffer is never materialized; PIL below is the fallback
+        try:
+            pyvips.Image.new_from_file(
+                str(source_path), access='sequential'
+            ).write_to_file(
+                str(destination_path),
+                Q=quality,
+                effort=6,  # libvips' name for PIL's method=6
+                strip=True
+            )
+            return True
+        except pyvips.Error:
+            pass
+    
+    img = _open_image(source_path)
+    if img is None:
         return False
         
     try:
-        with Image.open(source_path) as img:
-            img.save(
-                destination_path,
-                'webp',
-                quality=quality,
-                method=6  # Best quality/slowest
-            )
+        img.save(
+            destination_path,
+            'webp',
+            quality=quality,
+            method=6  # Best quality/slowest
+        )
         return True
     except Exception:
         return False
+    finally:
+        img.close()
 
 def get_image_metadata(image_path: Path) -> Optional[Dict[str, Any]]:
     """
@@ -229,9 +484,8 @@ def get_image_metadata(image_path: Path) -> Optional[Dict[str, Any]]:
     Returns:
         Dict with metadata or None if failed
     """
-    if not validate_image_file(image_path):
-        return None
-        
+    # Everything here comes from the header, so a single lazy open doubles
+    # as validation; the size is read from the already-open descriptor
     try:
         with Image.open(image_path) as img:
             return {
@@ -239,9 +493,10 @@ def get_image_metadata(image_path: Path) -> Optional[Dict[str, Any]]:
                 'height': img.height,
                 'format': img.format,
                 'mode': img.mode,
-                'size_bytes': os.path.getsize(image_path)
+                'size_bytes': os.fstat(img.fp.fileno()).st_size
             }
-    except Exception:
+    except (IOError, UnidentifiedImageError, Image.DecompressionBombError) as e:
+        print(f"Image validation failed for {image_path}: {str(e)}")
         return None
 
 def normalize_image_orientation(image: Image.Image) -> Image.Image:
@@ -293,15 +548,16 @@ def create_image_preview(
     Returns:
         PIL Image or None if failed
     """
-    if not validate_image_file(image_path):
+    img = _open_oriented(image_path, draft_size=preview_size)
+    if img is None:
         return None
         
     try:
-        with Image.open(image_path) as img:
-            img = normalize_image_orientation(img)
-            return resize_image(img, preview_size)
+        return resize_image(img, preview_size)
     except Exception:
         return None
+    finally:
+        img.close()
     
     # utils/image_utils.py (add this function)
 def create_thumbnail(image_path: Path, size: Tuple[int, int]) -> Optional[Image.Image]:
@@ -315,17 +571,80 @@ def create_thumbnail(image_path: Path, size: Tuple[int, int]) -> Optional[Image.
     Returns:
         PIL Image object or None if creation fails
     """
-    if not validate_image_file(image_path):
+    # Decoded at reduced JPEG scale, so it is shrunk in place first; only
+    # the thumbnail-sized result is copied, letting the source (and the
+    # file GIF/WebP keep open for further frames) be closed
+    img = _open_oriented(image_path, draft_size=size)
+    if img is None:
         return None
     try:
-        with Image.open(image_path) as img:
-            # Create a copy of the original image to work with
-            img_copy = img.copy()
-            # Apply orientation correction if needed
-            img_copy = normalize_image_orientation(img_copy)
-            # Create thumbnail
-            img.thumbnail(size, Image.Resampling.LANCZOS)
-            return img.copy()  # Return a copy to avoid file handle issues
+        img.thumbnail(size, Image.Resampling.LANCZOS)
+        return img.copy()
     except Exception as e:
         print(f"Error creating thumbnail from {image_path}: {e}")
-        return None
\ No newline at end of file
+        return None
+    finally:
+        img.close()
+
+# --------------------------
+# Batch Helpers
+# --------------------------
+
+# Below this many files a pool costs more to spin up than it saves
+BATCH_POOL_THRESHOLD = 16
+
+def _hash_or_none(path_str: str) -> Optional[str]:
+    try:
+        return compute_image_hash(path_str)
+    except IOError:
+        return None
+
+def hash_many(paths: Sequence[Union[str, Path]]) -> List[Optional[str]]:
+    """
+    Hash many image files concurrently.
+    
+    Threads suffice: hashlib releases the GIL while digesting, so files
+    hash in parallel without process start-up or pickling costs.
+    
+    Args:
+        paths: Image files to hash
+        
+    Returns:
+        Hashes in input order (None for unreadable files)
+    """
+    path_strs = [os.fspath(p) for p in paths]
+    if len(path_strs) < BATCH_POOL_THRESHOLD:
+        return [_hash_or_none(p) for p in path_strs]
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as pool:
+        return list(pool.map(_hash_or_none, path_strs))
+
+def _thumbnail_worker(path_str: str, size: Tuple[int, int]) -> Optional[Image.Image]:
+    """Module-level so it can be pickled into worker processes."""
+    return generate_thumbnail(Path(path_str), size)
+
+def thumbnail_many(
+    paths: Sequence[Union[str, Path]],
+    size: Tuple[int, int] = (150, 150)
+) -> List[Optional[Image.Image]]:
+    """
+    Generate thumbnails for many images across a process pool.
+    
+    Decoding is CPU-bound, so each core takes a share of the files.
+    
+    Args:
+        paths: Source image files
+        size: Tuple of (width, height) for each thumbnail
+        
+    Returns:
+        Thumbnails in input order (None where generation failed)
+    """
+    path_strs = [os.fspath(p) for p in paths]
+    if len(path_strs) < BATCH_POOL_THRESHOLD:
+        return [_thumbnail_worker(p, size) for p in path_strs]
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(path_strs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(
+            _thumbnail_worker, path_strs, [size] * len(path_strs),
+            chunksize=chunksize
+        ))
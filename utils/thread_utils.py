@@ -3,102 +3,211 @@ Thread utility functions for Henna Gallery Editor.
 Complete thread-safe implementation with all original features.
 """
 
+import os
 import threading
-import queue
-import time
+import random
 import traceback
-from typing import Callable, Any, Optional, Tuple
-from functools import wraps
+from collections import deque
+from typing import Callable, Any, Hashable, Iterable, Optional, Tuple, Union
 from tkinter import messagebox
 
+# Bound once for the exception paths below
+_format_exc = traceback.format_exc
+
+def _format_task_error(exc: Exception, traceback_str: str) -> str:
+    """Build the user-facing text for a failed background task."""
+    return f"Background task failed: {str(exc)}\n\n{traceback_str}"
+
 class TaskError:
     """Container for exception information from failed tasks."""
+    __slots__ = ('exception', 'traceback', '_message')
+    
     def __init__(self, exc: Exception, traceback_str: str):
         self.exception = exc
         self.traceback = traceback_str
+        self._message = None
+        
+    @property
+    def message(self) -> str:
+        """Display text for the error, built on first use and reused after."""
+        if self._message is None:
+            self._message = _format_task_error(self.exception, self.traceback)
+        return self._message
 
-# Global callback queue with thread safety
-_callback_queue = queue.Queue()
-_queue_lock = threading.Lock()
+# Global callback queue - deque append/popleft are atomic under the GIL,
+# so producers and the GUI thread need no extra locking
+_callback_queue = deque()
+# Entries are (callback, args_tuple). Internal hot paths append pre-built
+# entries through _enqueue; schedule_callback is the public varargs form.
+_enqueue = _callback_queue.append  # bound once; called from every worker
 
-def synchronized_queue(func):
-    """Decorator for thread-safe queue operations."""
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        with _queue_lock:
-            return func(*args, **kwargs)
-    return wrapper
+# Newest (callback, args) per coalesce key, awaiting its queued delivery
+_coalesced = {}
+_coalesce_lock = threading.Lock()
+
+def schedule_callback(
+    callback: Callable,
+    *args: Any,
+    coalesce_key: Optional[Hashable] = None
+) -> None:
+    """
+    Schedule a callback to run in the main thread with thread safety.
+    
+    With a coalesce_key, at most one callback per key waits in the queue:
+    later calls replace its callback and arguments in place, so idempotent
+    updates (progress, status text) can't pile up between GUI polls.
+    """
+    if coalesce_key is None:
+        _enqueue((callback, args))
+        return
+    with _coalesce_lock:
+        fresh = coalesce_key not in _coalesced
+        _coalesced[coalesce_key] = (callback, args)
+    if fresh:
+        _enqueue((_deliver_coalesced, (coalesce_key,)))
 
-@synchronized_queue
-def schedule_callback(callback: Callable, *args: Any) -> None:
-    """Schedule a callback to run in the main thread with thread safety."""
-    _callback_queue.put((callback, args))
+def _deliver_coalesced(key: Hashable) -> None:
+    """Run the newest callback scheduled under a coalesce key."""
+    with _coalesce_lock:
+        callback, args = _coalesced.pop(key)
+    callback(*args)
 
-@synchronized_queue
 def process_pending_callbacks() -> None:
     """Process all pending callbacks in the queue with thread safety."""
-    while not _callback_queue.empty():
+    # Drain only what is queued now: callbacks scheduled while draining run
+    # on the next poll, so a busy producer can't keep the GUI thread here.
+    # (Swapping in a fresh deque instead would race with producers that
+    # already looked up the old one.)
+    popleft = _callback_queue.popleft
+    for _ in range(len(_callback_queue)):
+        callback, args = popleft()
         try:
-            callback, args = _callback_queue.get_nowait()
             callback(*args)
-        except queue.Empty:
-            break
         except Exception as e:
-            default_error_handler(e, traceback.format_exc())
+            default_error_handler(e, _format_exc())
 
-def default_error_handler(exc: Exception, traceback_str: str) -> None:
-    """Default handler for uncaught background exceptions."""
-    error_msg = f"Background task failed: {str(exc)}\n\n{traceback_str}"
+def default_error_handler(
+    exc: Union[Exception, TaskError],
+    traceback_str: str = ""
+) -> None:
+    """Default handler for uncaught background exceptions (or a TaskError)."""
+    if isinstance(exc, TaskError):
+        error_msg = exc.message
+    else:
+        error_msg = _format_task_error(exc, traceback_str)
     messagebox.showerror("Task Error", error_msg)
 
+def _run_task(
+    task_func: Callable[[], Any],
+    callback: Optional[Callable[[Any], None]],
+    error_callback: Optional[Callable[[TaskError], None]]
+) -> None:
+    """Run one background task and queue its result or error for the GUI thread."""
+    try:
+        result = task_func()
+        if callback is not None:
+            # Per-task hot path: enqueue the entry directly rather than
+            # paying for a call and *args packing
+            _enqueue((callback, (result,)))
+    except Exception as e:
+        # Format once, here, while the exception is current; on the GUI
+        # thread _format_exc() would no longer see it
+        tb = _format_exc()
+        if error_callback is not None:
+            # Only the caller's handler needs the TaskError wrapper
+            schedule_callback(error_callback, TaskError(e, tb))
+        else:
+            schedule_callback(default_error_handler, e, tb)
+
+# Shared worker pool used by run_in_thread, created on first use
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+def get_shared_pool() -> 'ThreadPool':
+    """
+    Get the application-wide worker pool for background tasks.
+    
+    Returns:
+        ThreadPool bounded to min(8, 2 * CPU count) workers
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = ThreadPool(max_workers=min(8, (os.cpu_count() or 1) * 2))
+        return _shared_pool
+
 def run_in_thread(
     task_func: Callable[[], Any],
     callback: Optional[Callable[[Any], None]] = None,
     error_callback: Optional[Callable[[TaskError], None]] = None,
-    daemon: bool = True
-) -> threading.Thread:
+    daemon: bool = True,
+    pooled: bool = True
+) -> Optional[threading.Thread]:
     """
     Run a function in a background thread with GUI-safe callbacks.
     
+    By default the task is queued on the shared worker pool so concurrent
+    callers (moves, prefetch, batch jobs) don't each spawn a thread.
+    
     Args:
         task_func: The function to run in background
         callback: Function to call with result when task completes
         error_callback: Function to call if task raises an exception
-        daemon: Whether thread should be daemonized
+        daemon: Whether thread should be daemonized (dedicated thread only)
+        pooled: Queue on the shared pool instead of starting a new thread
         
     Returns:
-        The created Thread object
+        The created Thread object, or None when the task was pooled
     """
-    def wrapped():
-        try:
-            result = task_func()
-            if callback:
-                schedule_callback(callback, result)
-        except Exception as e:
-            if error_callback:
-                error = TaskError(e, traceback.format_exc())
-                schedule_callback(error_callback, error)
-            else:
-                schedule_callback(
-                    lambda: default_error_handler(e, traceback.format_exc())
-                )
+    if pooled:
+        get_shared_pool().submit(task_func, callback, error_callback)
+        return None
     
-    thread = threading.Thread(target=wrapped, daemon=daemon)
+    thread = threading.Thread(
+        target=_run_task, args=(task_func, callback, error_callback), daemon=daemon
+    )
     thread.start()
     return thread
 
+# Per-thread RNG for ThreadPool push targets and steal victims
+_tls = threading.local()
+
+def _thread_rng() -> random.Random:
+    """Get this thread's RNG so threads never share generator state."""
+    try:
+        return _tls.rng
+    except AttributeError:
+        rng = _tls.rng = random.Random(os.urandom(8))
+        return rng
+
 class ThreadPool:
     """
-    Thread-safe thread pool for managing concurrent tasks.
+    Thread-safe work-stealing thread pool for managing concurrent tasks.
+    
+    Each persistent worker owns a task deque: it runs its own oldest task
+    first and, when that runs dry, steals the newest task from another
+    worker before parking. Workers take tasks without a shared lock -
+    deque operations are atomic under the GIL; submitters hold the pool
+    lock only so no task can be queued after shutdown has been decided.
     
     Args:
         max_workers: Maximum number of concurrent threads
     """
     def __init__(self, max_workers: int = 4):
         self.max_workers = max_workers
-        self.active_threads = 0
-        self.pending_tasks = queue.Queue()
+        self._deques = [deque() for _ in range(max_workers)]
+        self._events = [threading.Event() for _ in range(max_workers)]
+        self._idle = set()  # parked worker indices
+        self._unfinished = 0  # queued + running tasks
         self.lock = threading.Lock()
+        self._done_cv = threading.Condition(self.lock)
+        self._shutdown = False
+        self._workers = [
+            threading.Thread(target=self._worker_loop, args=(i,), daemon=True)
+            for i in range(max_workers)
+        ]
+        for thread in self._workers:
+            thread.start()
         
     def submit(
         self,
@@ -107,39 +216,128 @@ class ThreadPool:
         error_callback: Optional[Callable[[TaskError], None]] = None
     ) -> None:
         """Submit a task to the thread pool with thread safety."""
-        self.pending_tasks.put((task_func, callback, error_callback))
-        self._start_next_task()
-        
-    def _start_next_task(self) -> None:
-        """Start the next pending task if workers are available."""
+        task = (task_func, callback, error_callback)
         with self.lock:
-            if self.active_threads >= self.max_workers:
+            if self._shutdown:
+                raise RuntimeError("cannot submit to a ThreadPool after shutdown")
+            self._unfinished += 1
+            try:
+                target = self._idle.pop()
+            except KeyError:
+                # Everyone is busy: queue on a random worker, then wake anyone
+                # who went idle meanwhile so they can steal it
+                target = _thread_rng().randrange(self.max_workers)
+                self._deques[target].append(task)
+                self._events[target].set()
+                try:
+                    self._events[self._idle.pop()].set()
+                except KeyError:
+                    pass
                 return
+            self._deques[target].append(task)
+            self._events[target].set()
+        
+    def submit_many(
+        self,
+        tasks: Iterable[Tuple[Callable[[], Any], Optional[Callable], Optional[Callable]]]
+    ) -> None:
+        """
+        Submit a batch of tasks, synchronizing once rather than per task.
+        
+        Prefer this over repeated submit() calls for bulk work.
+        
+        Args:
+            tasks: (task_func, callback, error_callback) triples
+        """
+        tasks = list(tasks)
+        if not tasks:
+            return
+        rng = _thread_rng()
+        targets = set()
+        overflow = False
+        with self.lock:
+            if self._shutdown:
+                raise RuntimeError("cannot submit to a ThreadPool after shutdown")
+            self._unfinished += len(tasks)
+            for task in tasks:
+                try:
+                    target = self._idle.pop()
+                except KeyError:
+                    target = rng.randrange(self.max_workers)
+                    overflow = True
+                self._deques[target].append(task)
+                targets.add(target)
+        for target in targets:
+            self._events[target].set()
+        if overflow:
+            # Tasks queued on busy workers: let anyone now idle steal them
+            while True:
+                try:
+                    self._events[self._idle.pop()].set()
+                except KeyError:
+                    break
+        
+    def _take(self, me: int) -> Optional[Tuple]:
+        """Take from our own deque (oldest first), else steal another's newest."""
+        try:
+            return self._deques[me].popleft()
+        except IndexError:
+            pass
+        start = _thread_rng().randrange(self.max_workers)
+        for k in range(self.max_workers):
+            victim = (start + k) % self.max_workers
+            if victim == me:
+                continue
+            try:
+                return self._deques[victim].pop()
+            except IndexError:
+                pass
+        return None
+        
+    def _worker_loop(self, me: int) -> None:
+        """Run tasks for worker `me` until shutdown leaves nothing to do."""
+        event = self._events[me]
+        while True:
+            event.clear()
+            task = self._take(me)
+            if task is None:
+                self._idle.add(me)
+                # Re-check once advertised as idle: a submit that found no
+                # idle worker may have just queued on a busy one
+                task = self._take(me)
+                if task is None:
+                    if not self._shutdown:
+                        event.wait()
+                        continue
+                    # Submits queue under self.lock before shutdown sets the
+                    # flag, so one more look now sees every accepted task
+                    task = self._take(me)
+                    if task is None:
+                        return
+                self._idle.discard(me)
                 
-            if not self.pending_tasks.empty():
-                task_func, callback, error_callback = self.pending_tasks.get()
-                self.active_threads += 1
-                
-                def wrapped():
-                    try:
-                        result = task_func()
-                        if callback:
-                            schedule_callback(callback, result)
-                    except Exception as e:
-                        if error_callback:
-                            error = TaskError(e, traceback.format_exc())
-                            schedule_callback(error_callback, error)
-                        else:
-                            schedule_callback(
-                                lambda: default_error_handler(e, traceback.format_exc())
-                            )
-                    finally:
-                        with self.lock:
-                            self.active_threads -= 1
-                        self._start_next_task()
-                
-                thread = threading.Thread(target=wrapped, daemon=True)
-                thread.start()
+            try:
+                _run_task(*task)
+            finally:
+                with self.lock:
+                    self._unfinished -= 1
+                    if self._unfinished == 0:
+                        self._done_cv.notify_all()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting tasks and let the workers exit once queued work is done.
+        
+        Args:
+            wait: Block until every worker thread has exited
+        """
+        with self.lock:
+            self._shutdown = True
+        for event in self._events:
+            event.set()
+        if wait:
+            for thread in self._workers:
+                thread.join()
 
     def wait_completion(self, timeout: Optional[float] = None) -> bool:
         """
@@ -151,16 +349,10 @@ class ThreadPool:
         Returns:
             bool: True if all tasks completed, False if timeout
         """
-        start_time = time.time()
-        while True:
-            with self.lock:
-                if self.active_threads == 0 and self.pending_tasks.empty():
-                    return True
-                    
-            if timeout is not None and (time.time() - start_time) > timeout:
-                return False
-                
-            time.sleep(0.1)
+        with self._done_cv:
+            return self._done_cv.wait_for(
+                lambda: self._unfinished == 0, timeout=timeout
+            )
 
 class CancellableTask:
     """
@@ -177,17 +369,23 @@ class CancellableTask:
     ):
         self.task_func = task_func
         self.progress_callback = progress_callback
-        self._cancelled = False
+        # One-way flag read on every progress tick; is_set() needs no lock
+        self._cancel_event = threading.Event()
         self._thread = None
-        self._lock = threading.Lock()
+        self._lock = threading.Lock()  # guards _thread
+        self._done = threading.Event()  # set when _run finishes
+        # Latest unreported progress; set while a delivery is queued
+        self._latest_progress = 0.0
+        self._progress_pending = threading.Event()
         
     def start(self) -> None:
         """Start the task in a background thread with thread safety."""
         with self._lock:
-            if self._thread is not None and self._thread.is_alive():
+            if self.is_running():
                 return
                 
-            self._cancelled = False
+            self._cancel_event.clear()
+            self._done.clear()
             self._thread = threading.Thread(target=self._run, daemon=True)
             self._thread.start()
             
@@ -195,13 +393,13 @@ class CancellableTask:
         """Internal task runner that handles cancellation."""
         try:
             result = self.task_func(self._report_progress)
-            if not self._cancelled and self.progress_callback:
+            if not self._cancel_event.is_set() and self.progress_callback:
                 schedule_callback(self.progress_callback, 1.0)  # 100%
         except Exception as e:
-            if not self._cancelled:
-                schedule_callback(
-                    lambda: default_error_handler(e, traceback.format_exc())
-                )
+            if not self._cancel_event.is_set():
+                schedule_callback(default_error_handler, e, _format_exc())
+        finally:
+            self._done.set()
                 
     def _report_progress(self, progress: float) -> bool:
         """
@@ -213,21 +411,31 @@ class CancellableTask:
         Returns:
             bool: True if task should continue, False if cancelled
         """
-        with self._lock:
-            if self._cancelled:
-                return False
-                
-            if self.progress_callback:
-                schedule_callback(self.progress_callback, progress)
-                
-            return not self._cancelled
+        if self._cancel_event.is_set():
+            return False
+            
+        if self.progress_callback:
+            # Coalesce: a burst of reports between GUI polls becomes one
+            # callback carrying the newest value
+            self._latest_progress = progress
+            if not self._progress_pending.is_set():
+                self._progress_pending.set()
+                _enqueue((self._deliver_progress, ()))
+            
+        return True
+        
+    def _deliver_progress(self) -> None:
+        """Pass the newest reported progress to the callback (GUI thread)."""
+        # Clear before reading so a report racing with us queues a fresh
+        # delivery rather than being dropped
+        self._progress_pending.clear()
+        self.progress_callback(self._latest_progress)
             
     def cancel(self) -> None:
         """Request cancellation of the task with thread safety."""
-        with self._lock:
-            self._cancelled = True
+        self._cancel_event.set()
             
     def is_running(self) -> bool:
         """Check if the task is currently running with thread safety."""
-        with self._lock:
-            return self._thread is not None and self._thread.is_alive()
\ No newline at end of file
+        # Plain flag reads - cheap enough for GUI "is it done yet?" polling
+        return self._thread is not None and not self._done.is_set()
\ No newline at end of file